@@ -0,0 +1 @@
+"""Throughput and latency benchmarks for Synesthetic Labs (run with ``python -m``)."""
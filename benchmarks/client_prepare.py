@@ -0,0 +1,90 @@
+"""Measure ``MCPClient`` batch preparation against the previous deep-copy path.
+
+A ``batch_limit``-sized batch of enriched assets pinned to the legacy 0.7.3
+schema (so provenance keys are stripped) and one of current 0.7.4 assets are
+prepared for validation, and a matching ``mcp.core`` result payload is
+normalised. The baseline reproduces the old behaviour: ``copy.deepcopy``
+of each asset before stripping in place and of each result afterwards.
+Peak allocation is measured with ``tracemalloc``.
+
+Usage::
+
+    python -m benchmarks.client_prepare --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, MutableMapping
+
+from labs.agents.generator import GeneratorAgent
+from labs.mcp.client import MCPClient
+
+_LEGACY_SCHEMA = "https://schemas.synesthetic.dev/0.7.3/synesthetic-asset.schema.json"
+
+
+def _deepcopy_prepare(client: MCPClient, asset: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+    payload = copy.deepcopy(asset)
+    version = client._extract_schema_version(payload)
+    if version and client._is_legacy_version(version):
+        for key in ("asset_id", "prompt", "timestamp", "seed", "parameter_index", "provenance"):
+            payload.pop(key, None)
+        meta_info = payload.get("meta_info")
+        if isinstance(meta_info, MutableMapping):
+            meta_info.pop("provenance", None)
+        rule_bundle = payload.get("rule_bundle")
+        if isinstance(rule_bundle, MutableMapping):
+            bundle_meta = rule_bundle.get("meta_info")
+            if isinstance(bundle_meta, MutableMapping):
+                bundle_meta.pop("provenance", None)
+    return payload
+
+
+def _measure(fn: Callable[[], Any], rounds: int) -> Dict[str, float]:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    elapsed = (time.perf_counter() - started) / rounds
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"batch_us": round(elapsed * 1e6, 1), "peak_kib": round(peak / 1024, 1)}
+
+
+def run(rounds: int) -> Dict[str, Any]:
+    client = MCPClient()
+    agent = GeneratorAgent(schema_version="0.7.4", log_path=os.devnull)
+    current = [agent.propose(f"prepare {index}", seed=index) for index in range(client.batch_limit)]
+    legacy = [dict(json.loads(json.dumps(asset)), **{"$schema": _LEGACY_SCHEMA}) for asset in current]
+    payload = {"ok": True, "items": [{"ok": True, "reason": "validation_passed", "errors": []} for _ in current]}
+
+    report: Dict[str, Any] = {"batch_limit": client.batch_limit, "rounds": rounds}
+    for label, batch in (("legacy_0.7.3", legacy), ("current_0.7.4", current)):
+        baseline = _measure(lambda: [_deepcopy_prepare(client, asset) for asset in batch], rounds)
+        projected = _measure(lambda: [client._prepare_asset_for_validation(asset) for asset in batch], rounds)
+        report[label] = {"deepcopy": baseline, "projection": projected}
+
+    results: List[Any] = payload["items"]
+    report["normalise_results"] = {
+        "deepcopy": _measure(lambda: [copy.deepcopy(entry) for entry in results], rounds),
+        "current": _measure(lambda: client._normalise_validation_payload(payload), rounds),
+    }
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.rounds), indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""Compare sequential and process-pool validation over a synthetic corpus.
+
+Two modes are timed: ``validate_many`` over in-memory assets (which pickles
+every asset to the workers) and ``validate_files`` over the same corpus
+written as one JSON file per asset, where workers read and parse the files
+themselves. The pool is started (and its workers warmed) before timing, as
+it would be for a long archive run; one invalid asset in every ten
+exercises the error path.
+
+Usage::
+
+    python -m benchmarks.parallel_validate --assets 20000 --processes 4 --chunksize 256
+    LABS_SCHEMA_COMPILER=0 python -m benchmarks.parallel_validate --processes 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import parallel
+from labs.mcp.validate import validate_many
+
+
+def _corpus(count: int, version: str) -> List[Dict[str, Any]]:
+    agent = GeneratorAgent(schema_version=version, log_path=os.devnull)
+    templates = [agent.propose(f"corpus {seed}", seed=seed) for seed in range(10)]
+    templates[-1] = dict(templates[-1], tone=[])
+    return [json.loads(json.dumps(templates[index % len(templates)])) for index in range(count)]
+
+
+def _timed(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def _row(sequential_s: float, parallel_s: float) -> Dict[str, Any]:
+    return {
+        "sequential_s": round(sequential_s, 3),
+        "parallel_s": round(parallel_s, 3),
+        "speedup": round(sequential_s / parallel_s, 2) if parallel_s else None,
+    }
+
+
+def run(count: int, processes: int, chunksize: int, version: str) -> Dict[str, Any]:
+    assets = _corpus(count, version)
+    parallel.validate_chunks(assets[: chunksize * processes], processes=processes, chunksize=chunksize)
+
+    sequential, sequential_s = _timed(lambda: validate_many(assets))
+    pooled, pooled_s = _timed(lambda: validate_many(assets, processes=processes, chunksize=chunksize))
+    assert pooled == sequential
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index, asset in enumerate(assets):
+            path = Path(directory) / f"asset-{index:06d}.json"
+            path.write_text(json.dumps(asset), encoding="utf-8")
+            paths.append(path)
+        read_items, read_s = _timed(lambda: parallel.validate_files(paths, processes=1, chunksize=chunksize))
+        pooled_items, pooled_read_s = _timed(
+            lambda: parallel.validate_files(paths, processes=processes, chunksize=chunksize)
+        )
+    parallel.shutdown_pool()
+
+    assert read_items == pooled_items == sequential["items"]
+    return {
+        "assets": count,
+        "processes": processes,
+        "cpus": os.cpu_count(),
+        "chunksize": chunksize,
+        "schema_compiler": os.getenv("LABS_SCHEMA_COMPILER", "1"),
+        "in_memory": _row(sequential_s, pooled_s),
+        "files": _row(read_s, pooled_read_s),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=20000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--chunksize", type=int, default=256)
+    parser.add_argument("--version", default="0.7.4", help="bundled schema version")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.assets, args.processes, args.chunksize, args.version), indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+"""Compare compiled schema validation against ``jsonschema``.
+
+Both paths report the first error the same way ``labs.mcp.validate`` does;
+timings are per instance for a valid asset and for one failing deep in the
+property list.
+
+Usage::
+
+    python -m benchmarks.schema_compiler --version 0.7.4 --rounds 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from jsonschema import Draft202012Validator
+
+from labs.agents.generator import GeneratorAgent
+from labs.mcp.schema_compiler import compile_schema
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _time_per_call(fn: Callable[[], Any], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds
+
+
+def run(version: str, rounds: int) -> Dict[str, Any]:
+    schema = json.loads((_ROOT / "meta" / "schemas" / version / "synesthetic-asset.schema.json").read_text())
+    asset = GeneratorAgent(schema_version=version, log_path=os.devnull).propose("benchmark asset", seed=1)
+    invalid = dict(asset, meta_info=[])
+    generic = Draft202012Validator(schema)
+    compiled = compile_schema(schema)
+
+    report: Dict[str, Any] = {"version": version, "rounds": rounds}
+    for label, instance in (("valid", asset), ("invalid", invalid)):
+        generic_us = _time_per_call(lambda: next(generic.iter_errors(instance), None), rounds) * 1e6
+        compiled_us = _time_per_call(lambda: compiled.first_error(instance), rounds) * 1e6
+        report[label] = {
+            "jsonschema_us": round(generic_us, 2),
+            "compiled_us": round(compiled_us, 2),
+            "speedup": round(generic_us / compiled_us, 1) if compiled_us else None,
+        }
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--version", default="0.7.4", help="bundled schema version")
+    parser.add_argument("--rounds", type=int, default=5000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.version, args.rounds), indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+"""Measure Unix socket MCP server throughput with many concurrent clients.
+
+Usage::
+
+    python -m benchmarks.socket_throughput --clients 32 --requests 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import socket_main
+from labs.mcp_stdio import SocketMCPValidator
+
+
+def benchmark_asset() -> Dict[str, Any]:
+    return GeneratorAgent(schema_version="0.7.4", log_path=os.devnull).propose("benchmark asset", seed=1)
+
+
+def measure(validate: Callable[[Dict[str, Any]], Dict[str, Any]], clients: int, requests: int) -> dict:
+    """Drive *validate* from *clients* threads, *requests* calls each."""
+
+    asset = benchmark_asset()
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def _client(_: int) -> None:
+        local: List[float] = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            result = validate(asset)
+            local.append(time.perf_counter() - started)
+            if not result.get("ok"):
+                raise RuntimeError(f"unexpected validation failure: {result}")
+        with lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(_client, range(clients)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    total = clients * requests
+    return {
+        "clients": clients,
+        "requests": total,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(total / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 3),
+    }
+
+
+def run(clients: int, requests: int, workers: int | None) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "mcp.sock")
+        server = socket_main.create_server(path, max_workers=workers)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        try:
+            return measure(SocketMCPValidator(path, timeout=30.0).validate, clients, requests)
+        finally:
+            server.shutdown(timeout=5.0)
+            thread.join(timeout=5.0)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=100, help="requests per client")
+    parser.add_argument("--workers", type=int, default=None, help="server validation threads")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.clients, args.requests, args.workers), indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,47 @@
+"""Load-test the bundled TCP MCP server with pipelined concurrent clients.
+
+Usage::
+
+    python -m benchmarks.tcp_throughput --clients 32 --requests 200 --processes 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+
+from benchmarks.socket_throughput import measure
+from labs.mcp import tcp_main
+from labs.mcp.tcp_client import TcpMCPValidator
+
+
+def run(clients: int, requests: int, workers: int | None, processes: int) -> dict:
+    server = tcp_main.create_server("127.0.0.1", 0, max_workers=workers, processes=processes)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    host, port = server.address[:2]
+    validator = TcpMCPValidator(host, port, timeout=30.0)
+    try:
+        result = measure(validator.validate, clients, requests)
+    finally:
+        validator.close()
+        server.shutdown(timeout=5.0)
+        thread.join(timeout=5.0)
+    result["processes"] = processes
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=100, help="requests per client")
+    parser.add_argument("--workers", type=int, default=None, help="server handler threads")
+    parser.add_argument("--processes", type=int, default=0, help="server validation processes")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.clients, args.requests, args.workers, args.processes), indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
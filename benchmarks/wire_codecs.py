@@ -0,0 +1,77 @@
+"""Compare MCP wire codecs: bytes on the wire and encode/decode time.
+
+The ``current`` row is the default newline-framed, key-sorted JSON path
+(:func:`labs.transport.encode_payload` / :func:`labs.transport.decode_payload`);
+the other rows are length-prefixed frames for each installed codec.
+
+Usage::
+
+    python -m benchmarks.wire_codecs --assets 32 --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.socket_throughput import benchmark_asset
+from labs.mcp.jsonrpc import validate_many_request, validate_request
+from labs.transport import (
+    FRAMING_LENGTH,
+    available_codecs,
+    decode_payload,
+    encode_frame,
+    encode_payload,
+    get_codec,
+)
+
+
+def _time_per_call(fn: Callable[[], Any], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds
+
+
+def _row(name: str, payload: Dict[str, Any], rounds: int) -> Dict[str, Any]:
+    if name == "current":
+        encode: Callable[[], bytes] = lambda: encode_payload(payload)
+        frame = encode()
+        decode: Callable[[], Any] = lambda: decode_payload(frame)
+    else:
+        codec = get_codec(name)
+        encode = lambda: encode_frame(payload, FRAMING_LENGTH, codec)
+        frame = encode()
+        body = frame[4:]
+        decode = lambda: decode_payload(body, codec)
+    return {
+        "codec": name,
+        "wire_bytes": len(frame),
+        "encode_us": round(_time_per_call(encode, rounds) * 1e6, 1),
+        "decode_us": round(_time_per_call(decode, rounds) * 1e6, 1),
+    }
+
+
+def run(assets: int, rounds: int) -> Dict[str, List[Dict[str, Any]]]:
+    asset = benchmark_asset()
+    payloads = {
+        "validate": validate_request(asset),
+        "validate_many": validate_many_request([asset] * assets),
+    }
+    names = ["current", *available_codecs()]
+    return {label: [_row(name, payload, rounds) for name in names] for label, payload in payloads.items()}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=32, help="assets in the validate_many payload")
+    parser.add_argument("--rounds", type=int, default=200, help="timed encode/decode calls per codec")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.assets, args.rounds), indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -6,10 +6,12 @@ import datetime as _dt
 import logging
 import os
 import uuid
-from typing import Any, Callable, Dict, List, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
 from labs.logging import log_jsonl
 from labs.mcp.exceptions import MCPUnavailableError
+from labs.mcp.result_cache import ValidationResultCache
+from labs.mcp.validate import local_verdict, prepare_for_validation, resolve_validation_tier
 from labs.mcp_stdio import build_validator_from_env, resolve_mcp_endpoint
 
 _DEFAULT_LOG_PATH = "meta/output/labs/critic.jsonl"
@@ -37,9 +39,13 @@ class CriticAgent:
         validator: Optional[ValidatorType] = None,
         *,
         log_path: str = _DEFAULT_LOG_PATH,
+        result_cache: Optional[ValidationResultCache] = None,
+        validation_tier: Optional[str] = None,
     ) -> None:
         self._validator = validator
         self.log_path = log_path
+        self.result_cache = result_cache
+        self.validation_tier = validation_tier
         self._logger = logging.getLogger(self.__class__.__name__)
 
     @staticmethod
@@ -56,13 +62,29 @@ class CriticAgent:
                 return trace_id
         return str(uuid.uuid4())
 
-    def review(self, asset: Dict[str, Any], *, patch_id: Optional[str] = None) -> Dict[str, Any]:
+    def review(
+        self,
+        asset: Dict[str, Any],
+        *,
+        patch_id: Optional[str] = None,
+        changed: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
         """Inspect *asset* and return a review payload.
 
         Validation is attempted through the configured MCP validator. When
         ``LABS_FAIL_FAST`` is enabled (default) any validator outages surface as
         failures; otherwise validation still runs but surfaces as warnings so
-        relaxed mode can proceed in a degraded state.
+        relaxed mode can proceed in a degraded state. A configured
+        ``result_cache`` short-circuits validation for assets already judged
+        against the current schema content. *changed* lists the top-level keys
+        (or JSON pointers) a patch touched on an asset that previously passed;
+        validators exposing ``validate_changes`` then re-check only those.
+        The ``validation_tier`` (constructor argument or ``LABS_VALIDATION_TIER``)
+        lets the local validator decide clear failures, or every asset in
+        ``local`` mode, before any MCP round trip; the review records the
+        deciding tier. Validators and the cache see the same legacy-stripped
+        payload as :class:`labs.mcp.client.MCPClient`, so both share cache
+        entries.
         """
 
         if not isinstance(asset, dict):
@@ -128,6 +150,25 @@ class CriticAgent:
                     validation_status = "warned"
                     self._logger.warning("Validation warning: %s", message)
 
+        payload = prepare_for_validation(asset)
+        result_cache = self.result_cache
+        validation_cached = False
+        if should_attempt_validation and result_cache is not None:
+            cached_response = result_cache.get(payload)
+            if cached_response is not None:
+                mcp_response = cached_response
+                validation_cached = True
+                should_attempt_validation = False
+
+        decided_by: Optional[str] = None
+        tier = resolve_validation_tier(self.validation_tier)
+        if should_attempt_validation and tier != "remote":
+            local_response = local_verdict(payload, tier, changed)
+            if local_response is not None:
+                mcp_response = dict(local_response)
+                decided_by = "local"
+                should_attempt_validation = False
+
         validator = None
         if should_attempt_validation:
             validator = self._validator
@@ -158,12 +199,16 @@ class CriticAgent:
 
         if should_attempt_validation and validator is not None:
             try:
-                response = validator(asset)
+                incremental = getattr(validator, "validate_changes", None) if changed is not None else None
+                response = incremental(payload, changed) if callable(incremental) else validator(payload)
+                decided_by = "remote"
                 if isinstance(response, dict):
                     mcp_response = dict(response)
                     mcp_response.setdefault("ok", True)
                 else:
                     mcp_response = {"ok": True}
+                if result_cache is not None:
+                    result_cache.put(payload, mcp_response)
             except MCPUnavailableError as exc:
                 message = f"MCP validation unavailable: {exc}"
                 issues.append(str(exc))
@@ -228,6 +273,12 @@ class CriticAgent:
             "trace_id": trace_id,
         }
 
+        if validation_cached:
+            review["validation_cached"] = True
+
+        if decided_by is not None:
+            review["validation_tier"] = decided_by
+
         if validation_reason is not None:
             review["validation_reason"] = validation_reason
 
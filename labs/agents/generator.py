@@ -11,6 +11,7 @@ from typing import Any, Dict, Optional
 from labs.generator.assembler import AssetAssembler
 from labs.logging import log_jsonl
 from labs.mcp_stdio import resolve_mcp_endpoint
+from labs.singleflight import SingleFlight, flight_key
 
 _DEFAULT_LOG_PATH = "meta/output/labs/generator.jsonl"
 _DEFAULT_SCHEMA_VERSION = AssetAssembler.DEFAULT_SCHEMA_VERSION
@@ -32,6 +33,10 @@ class GeneratorAgent:
     log_path:
         Location of the JSONL log sink. The default targets the shared
         repository log directory under ``meta/output``.
+    flight:
+        Optional :class:`SingleFlight` group used to coalesce concurrent
+        duplicate seeded proposals; share one across agents to coalesce
+        between them.
     """
 
     def __init__(
@@ -41,6 +46,7 @@ class GeneratorAgent:
         version: str = "v0.2",
         assembler: Optional[AssetAssembler] = None,
         schema_version: Optional[str] = None,
+        flight: Optional[SingleFlight] = None,
     ) -> None:
         self.log_path = log_path
         self._logger = logging.getLogger(self.__class__.__name__)
@@ -50,6 +56,7 @@ class GeneratorAgent:
         self._assembler = assembler or AssetAssembler(
             version=version, schema_version=self.schema_version
         )
+        self._flight = flight or SingleFlight()
 
     def propose(
         self,
@@ -62,23 +69,46 @@ class GeneratorAgent:
 
         The payload mirrors the canonical Synesthetic schema sections produced
         by :class:`AssetAssembler` and is logged to the configured JSONL sink
-        for traceability.
+        for traceability. Seeded proposals are deterministic, so concurrent
+        duplicates share the in-flight result and each receive a copy.
         """
 
         if not isinstance(prompt, str) or not prompt.strip():
             raise ValueError("prompt must be a non-empty string")
 
         target_schema_version = schema_version or self.schema_version
+        if seed is None:
+            return self._propose(prompt, seed=seed, schema_version=target_schema_version)
+
+        key = flight_key(self.version, prompt, seed, target_schema_version)
+        return self._flight.do(
+            key,
+            lambda: self._propose(prompt, seed=seed, schema_version=target_schema_version),
+        )
+
+    @property
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Return singleflight counters for :meth:`propose`."""
+
+        return self._flight.stats()
+
+    def _propose(
+        self,
+        prompt: str,
+        *,
+        seed: Optional[int],
+        schema_version: str,
+    ) -> Dict[str, Any]:
         asset = self._assembler.generate(
             prompt,
             seed=seed,
-            schema_version=target_schema_version,
+            schema_version=schema_version,
         )
 
         timestamp = asset.get("timestamp") or _dt.datetime.now(tz=_dt.timezone.utc).isoformat()
 
         meta = asset.setdefault("meta_info", {})
-        legacy_schema = target_schema_version.startswith("0.7.3")
+        legacy_schema = schema_version.startswith("0.7.3")
 
         if legacy_schema:
             trace_id = asset.get("asset_id") or str(uuid.uuid4())
@@ -109,7 +139,7 @@ class GeneratorAgent:
         log_entry["mode"] = "local"
         log_entry["strict"] = _strict_mode_enabled()
         log_entry["transport"] = resolve_mcp_endpoint()
-        log_entry["schema_version"] = target_schema_version
+        log_entry["schema_version"] = schema_version
 
         log_jsonl(self.log_path, log_entry)
         return asset
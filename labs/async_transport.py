@@ -0,0 +1,76 @@
+"""asyncio stream counterparts of :mod:`labs.transport`.
+
+Framing, codecs and the payload cap are shared with the blocking helpers;
+only the I/O differs. Open streams with ``limit=STREAM_LIMIT`` so that
+newline-delimited messages up to the cap fit in the reader's buffer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Mapping, Optional
+
+from labs.transport import (
+    FRAMING_LENGTH,
+    FRAMING_NEWLINE,
+    MAX_PAYLOAD_BYTES,
+    Codec,
+    PayloadTooLargeError,
+    encode_frame,
+)
+
+_DELIMITER = b"\n"
+_HEADER_SIZE = 4
+
+STREAM_LIMIT = MAX_PAYLOAD_BYTES + len(_DELIMITER)
+
+
+def _too_large(size: int) -> PayloadTooLargeError:
+    return PayloadTooLargeError(f"payload size {size} bytes exceeds cap of {MAX_PAYLOAD_BYTES} bytes")
+
+
+async def read_message(reader: asyncio.StreamReader, *, framing: str = FRAMING_NEWLINE) -> Optional[bytes]:
+    """Return the next message body from *reader*, or ``None`` on a clean close."""
+
+    if framing == FRAMING_LENGTH:
+        try:
+            header = await reader.readexactly(_HEADER_SIZE)
+        except asyncio.IncompleteReadError as exc:
+            if exc.partial:
+                raise ConnectionError("stream closed before length-prefixed header was received") from exc
+            return None
+        length = int.from_bytes(header, "big")
+        if length > MAX_PAYLOAD_BYTES:
+            raise _too_large(length)
+        try:
+            return await reader.readexactly(length)
+        except asyncio.IncompleteReadError as exc:
+            raise ConnectionError("stream closed before length-prefixed payload was received") from exc
+
+    try:
+        message = await reader.readuntil(_DELIMITER)
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial:
+            raise ConnectionError("stream closed before newline-delimited payload was received") from exc
+        return None
+    except asyncio.LimitOverrunError as exc:
+        raise _too_large(exc.consumed) from exc
+    if len(message) - len(_DELIMITER) > MAX_PAYLOAD_BYTES:
+        raise _too_large(len(message) - len(_DELIMITER))
+    return message
+
+
+async def write_message(
+    writer: asyncio.StreamWriter,
+    payload: Mapping[str, Any],
+    *,
+    framing: str = FRAMING_NEWLINE,
+    codec: Optional[Codec] = None,
+) -> None:
+    """Send *payload* over *writer* and wait for the transport to drain."""
+
+    writer.write(encode_frame(payload, framing, codec))
+    await writer.drain()
+
+
+__all__ = ["STREAM_LIMIT", "read_message", "write_message"]
@@ -81,6 +81,8 @@ from labs.agents.generator import GeneratorAgent
 from labs.generator.assembler import AssetAssembler
 from labs.generator.external import ExternalGenerationError, build_external_generator
 from labs.mcp import MCPClient, MCPClientError, MCPValidationError
+from labs.mcp.result_cache import ValidationResultCache
+from labs.mcp.validate import prepare_for_validation, resolve_validation_tier
 from labs.mcp_stdio import MCPUnavailableError, build_validator_from_env
 from labs.patches import apply_patch, preview_patch, rate_patch
 
@@ -302,6 +304,9 @@ def main(argv: Optional[list[str]] = None) -> int:
     except MCPClientError as exc:
         _LOGGER.error("Failed to initialise MCP client: %s", exc)
         return 1
+    # Cached verdicts come from the MCP, so fingerprint them by the schema the client fetched.
+    result_cache = ValidationResultCache.from_env(fingerprint=mcp_client.schema_fingerprint)
+    mcp_client.result_cache = result_cache
 
     mcp_client.record_event(
         "cli_ready",
@@ -362,7 +367,7 @@ def main(argv: Optional[list[str]] = None) -> int:
             _LOGGER.error("MCP unavailable: %s", exc)
             return _complete(1)
 
-        critic = CriticAgent(validator=validator_callback)
+        critic = CriticAgent(validator=validator_callback, result_cache=result_cache)
         review = critic.review(asset)
 
         strict_flag = bool(args.strict if args.strict is not None else is_fail_fast_enabled())
@@ -464,7 +469,7 @@ def main(argv: Optional[list[str]] = None) -> int:
             _LOGGER.error("MCP unavailable: %s", exc)
             return _complete(1)
 
-        critic = CriticAgent(validator=validator_callback)
+        critic = CriticAgent(validator=validator_callback, result_cache=result_cache)
         review = critic.review(asset)
         print(json.dumps(review, indent=2))
 
@@ -494,8 +499,15 @@ def main(argv: Optional[list[str]] = None) -> int:
             _LOGGER.error("MCP unavailable: %s", exc)
             return _complete(1)
 
-        critic = CriticAgent(validator=validator_callback)
-        result = apply_patch(asset, patch, critic=critic)
+        # A cached passing verdict for the base lets non-remote tiers re-check only the patched keys.
+        base_review = result_cache.get(prepare_for_validation(asset))
+        base_valid = bool(base_review and base_review.get("ok"))
+        critic = CriticAgent(
+            validator=validator_callback,
+            result_cache=result_cache,
+            validation_tier=resolve_validation_tier(),
+        )
+        result = apply_patch(asset, patch, critic=critic, base_valid=base_valid)
         print(json.dumps(result, indent=2))
 
         review_payload = result["review"]
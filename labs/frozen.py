@@ -0,0 +1,96 @@
+"""Immutable JSON values for data shared across callers without copying.
+
+:func:`freeze` turns parsed JSON into :class:`FrozenDict`/:class:`FrozenList`
+trees. They subclass ``dict``/``list``, so ``isinstance`` checks,
+``json.dumps`` and ``jsonschema`` keep working, but every mutator raises
+``TypeError`` and the hash is computed once and cached. :func:`thaw` (or
+``copy.deepcopy``) returns a plain mutable copy for callers that need to
+edit.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, NoReturn, Optional
+
+
+def _immutable(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(f"{type(self).__name__} is immutable; call thaw() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """Read-only ``dict`` with a cached hash; values are frozen recursively."""
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        dict.__init__(self, ((key, freeze(value)) for key, value in dict(*args, **kwargs).items()))
+        self._hash: Optional[int] = None
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        if self._hash is None:
+            self._hash = hash(frozenset(self.items()))
+        return self._hash
+
+    def __reduce__(self) -> Any:
+        return (type(self), (dict(self),))
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return thaw(self)
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+
+class FrozenList(list):
+    """Read-only ``list`` with a cached hash; items are frozen recursively."""
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, iterable: Any = ()) -> None:
+        list.__init__(self, (freeze(item) for item in iterable))
+        self._hash: Optional[int] = None
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __reduce__(self) -> Any:
+        return (type(self), (list(self),))
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return thaw(self)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+
+def freeze(value: Any) -> Any:
+    """Return an immutable view of JSON *value*; already-frozen values are returned as-is."""
+
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenDict(value)
+    if isinstance(value, (list, tuple)):
+        return FrozenList(value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a plain, mutable deep copy of JSON *value*."""
+
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+__all__ = ["FrozenDict", "FrozenList", "freeze", "thaw"]
@@ -24,6 +24,7 @@ import requests
 from labs.generator.assembler import AssetAssembler
 from labs.logging import log_external_generation
 from labs.mcp import MCPClient, MCPClientError
+from labs.singleflight import SingleFlight, flight_key
 
 JsonDict = Dict[str, Any]
 
@@ -112,7 +113,7 @@ def _cached_schema_descriptor(version: str) -> Tuple[str, str, Dict[str, Any]]:
 
     schema_id = descriptor.get("schema_id") or schema.get("$id") or AssetAssembler.schema_url(version)
     resolved_version = descriptor.get("version") or version
-    return schema_id, resolved_version, deepcopy(schema)
+    return schema_id, resolved_version, schema
 
 
 def _schema_descriptor(version: Optional[str]) -> Tuple[str, str, Dict[str, Any]]:
@@ -360,6 +361,7 @@ class ExternalGenerator:
         timeout_seconds: float = 35.0,
         sleeper: Callable[[float], None] = time.sleep,
         schema_version: Optional[str] = None,
+        flight: Optional[SingleFlight] = None,
     ) -> None:
         if max_retries < 1:
             raise ValueError("max_retries must be >= 1")
@@ -380,6 +382,7 @@ class ExternalGenerator:
         self.timeout_seconds = timeout_seconds
         self._sleep = sleeper
         self._logger = logging.getLogger(self.__class__.__name__)
+        self._flight = flight or SingleFlight()
         self.schema_version = schema_version or AssetAssembler.DEFAULT_SCHEMA_VERSION
         default_resolution = _shared_mcp_client().resolution
         self._latest_schema_binding: Dict[str, Any] = {
@@ -400,11 +403,55 @@ class ExternalGenerator:
         trace_id: Optional[str] = None,
         schema_version: Optional[str] = None,
     ) -> Tuple[JsonDict, JsonDict]:
-        """Return an asset assembled from an external API response."""
+        """Return an asset assembled from an external API response.
+
+        Seeded requests without an explicit *trace_id* are coalesced: while one
+        call for the same engine, prompt, seed, schema version and parameters
+        is in flight, duplicates wait for it and receive an independent copy.
+        """
 
         if not isinstance(prompt, str) or not prompt.strip():
             raise ValueError("prompt must be a non-empty string")
 
+        def _run() -> Tuple[JsonDict, JsonDict]:
+            return self._generate(
+                prompt,
+                parameters=parameters,
+                seed=seed,
+                timeout=timeout,
+                trace_id=trace_id,
+                schema_version=schema_version,
+            )
+
+        if seed is None or trace_id is not None:
+            return _run()
+
+        key = flight_key(
+            self.engine,
+            self.mock_mode,
+            prompt,
+            seed,
+            schema_version or os.getenv("LABS_SCHEMA_VERSION", AssetAssembler.DEFAULT_SCHEMA_VERSION),
+            parameters or {},
+        )
+        return self._flight.do(key, _run)
+
+    @property
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Return singleflight counters for :meth:`generate`."""
+
+        return self._flight.stats()
+
+    def _generate(
+        self,
+        prompt: str,
+        *,
+        parameters: Optional[JsonDict],
+        seed: Optional[int],
+        timeout: Optional[float],
+        trace_id: Optional[str],
+        schema_version: Optional[str],
+    ) -> Tuple[JsonDict, JsonDict]:
         parameters = dict(parameters or {})
         defaults = self.default_parameters()
         for key, value in defaults.items():
@@ -5,7 +5,9 @@ from __future__ import annotations
 import os
 from typing import List, Optional
 
+from labs.mcp.shm_main import main as shm_main
 from labs.mcp.socket_main import main as socket_main
+from labs.mcp.tcp_main import main as tcp_main
 from labs.mcp_stub import main as stdio_main
 
 
@@ -13,6 +15,10 @@ def main(argv: Optional[List[str]] = None) -> int:
     endpoint = os.getenv("MCP_ENDPOINT", "stdio").strip().lower()
     if endpoint == "socket":
         return socket_main(argv)
+    if endpoint == "tcp":
+        return tcp_main(argv)
+    if endpoint == "shm":
+        return shm_main(argv)
     return stdio_main(argv)
 
 
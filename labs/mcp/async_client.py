@@ -0,0 +1,318 @@
+"""asyncio MCP validators for the TCP and Unix socket transports.
+
+These mirror :class:`labs.mcp.tcp_client.TcpMCPValidator` and
+:class:`labs.mcp_stdio.SocketMCPValidator` (same payload caps, JSON-RPC
+unwrapping and error types) but never block the event loop, so a single loop
+can keep hundreds of validations in flight via :func:`validate_all`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from labs.async_transport import STREAM_LIMIT, read_message, write_message
+from labs.mcp.exceptions import MCPUnavailableError
+from labs.mcp.jsonrpc import (
+    unwrap_batch_items,
+    unwrap_response,
+    validate_many_request,
+    validate_request,
+)
+from labs.mcp.tcp_client import codecs_from_env, framing_from_env
+from labs.transport import (
+    FRAMING_LENGTH,
+    FRAMING_NEWLINE,
+    Codec,
+    InvalidPayloadError,
+    PayloadTooLargeError,
+    available_codecs,
+    decode_payload,
+    encode_frame,
+    framing_request,
+    get_codec,
+    iter_payload_batches,
+    select_codec,
+)
+
+JsonDict = Dict[str, Any]
+
+
+class _AsyncValidatorBase:
+    async def validate(self, asset: Mapping[str, Any]) -> JsonDict:
+        """Send *asset* to the MCP server and return the validation payload."""
+
+        return unwrap_response(await self._round_trip(validate_request(asset)))
+
+    async def validate_many(
+        self,
+        assets: Sequence[Mapping[str, Any]],
+        *,
+        batch_limit: Optional[int] = None,
+    ) -> List[JsonDict]:
+        """Validate *assets* via ``validate_many``; chunks are sent concurrently."""
+
+        chunks = list(iter_payload_batches(assets, max_items=batch_limit))
+        responses = await asyncio.gather(
+            *(self._round_trip(validate_many_request(chunk)) for chunk in chunks)
+        )
+        results: List[JsonDict] = []
+        for chunk, response in zip(chunks, responses):
+            results.extend(unwrap_batch_items(response, len(chunk)))
+        return results
+
+    async def close(self) -> None:
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _round_trip(self, payload: JsonDict) -> JsonDict:  # pragma: no cover - abstract
+        raise NotImplementedError
+
+
+class AsyncSocketMCPValidator(_AsyncValidatorBase):
+    """Invoke an MCP server over a Unix domain socket, one connection per request."""
+
+    def __init__(self, path: str, *, timeout: float = 10.0) -> None:
+        if not path:
+            raise ValueError("path must be a non-empty string")
+        self._path = path
+        self._timeout = timeout
+
+    async def _round_trip(self, payload: JsonDict) -> JsonDict:
+        try:
+            data = encode_frame(payload)
+        except PayloadTooLargeError as exc:
+            raise MCPUnavailableError(f"MCP request payload too large: {exc}") from exc
+        try:
+            raw = await asyncio.wait_for(self._exchange(data), self._timeout)
+        except PayloadTooLargeError as exc:
+            raise MCPUnavailableError(f"Invalid MCP response: {exc}") from exc
+        except (FileNotFoundError, asyncio.TimeoutError) as exc:
+            raise MCPUnavailableError(f"MCP socket unavailable: {exc}") from exc
+        except ConnectionError as exc:
+            raise MCPUnavailableError(f"MCP socket connection error: {exc}") from exc
+        except OSError as exc:
+            raise MCPUnavailableError(f"MCP socket failure: {exc}") from exc
+        try:
+            return decode_payload(raw)
+        except (PayloadTooLargeError, InvalidPayloadError) as exc:
+            raise MCPUnavailableError(f"Invalid MCP response: {exc}") from exc
+
+    async def _exchange(self, data: bytes) -> bytes:
+        reader, writer = await asyncio.open_unix_connection(self._path, limit=STREAM_LIMIT)
+        try:
+            writer.write(data)
+            await writer.drain()
+            raw = await read_message(reader)
+        finally:
+            writer.close()
+        if raw is None:
+            raise ConnectionError("socket closed before newline-delimited payload was received")
+        return raw
+
+
+class _AsyncChannel:
+    """One open stream plus the futures still waiting for a response on it."""
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        framing: str,
+        codec: Optional[Codec],
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.framing = framing
+        self.codec = codec
+        self.alive = True
+        self.pending: Dict[Any, "asyncio.Future[JsonDict]"] = {}
+        self.task: Optional["asyncio.Task[None]"] = None
+
+    def fail(self, error: BaseException) -> None:
+        if not self.alive:
+            return
+        self.alive = False
+        self.writer.close()
+        pending, self.pending = self.pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def read_loop(self) -> None:
+        error: BaseException = ConnectionError("MCP server closed the connection")
+        try:
+            while True:
+                raw = await read_message(self.reader, framing=self.framing)
+                if raw is None:
+                    break
+                try:
+                    response = decode_payload(raw, self.codec)
+                except (PayloadTooLargeError, InvalidPayloadError) as exc:
+                    # The frame's owner is unknown; drop the connection rather than guess.
+                    error = MCPUnavailableError(f"Invalid MCP response: {exc}")
+                    break
+                self._deliver(response)
+        except PayloadTooLargeError as exc:
+            error = MCPUnavailableError(f"Invalid MCP response: {exc}")
+        except OSError as exc:
+            error = exc
+        self.fail(error)
+
+    def _deliver(self, response: JsonDict) -> None:
+        response_id = response.get("id")
+        if response_id is not None:
+            future = self.pending.pop(response_id, None)
+        elif self.pending:
+            future = self.pending.pop(next(iter(self.pending)))
+        else:
+            future = None
+        if future is not None and not future.done():
+            future.set_result(response)
+
+
+class AsyncTcpMCPValidator(_AsyncValidatorBase):
+    """Pipeline validation requests over one persistent asyncio TCP stream.
+
+    Behaves like :class:`labs.mcp.tcp_client.MultiplexedConnection`: responses
+    are routed back by JSON-RPC ``id``, a dropped stream is reopened on the
+    next request and requests lost with it are retried once, a timeout or
+    undecodable response closes the stream, and the
+    ``labs.framing`` handshake negotiates framing and codec when asked
+    (``MCP_FRAMING`` / ``MCP_CODEC`` by default). The stream belongs to the
+    event loop that opened it.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        timeout: float = 10.0,
+        framing: Optional[str] = None,
+        codecs: Optional[Sequence[str]] = None,
+    ) -> None:
+        if not host:
+            raise ValueError("host must be a non-empty string")
+        if port <= 0:
+            raise ValueError("port must be a positive integer")
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        supported = available_codecs()
+        preferences = codecs_from_env() if codecs is None else codecs
+        self.codecs: Tuple[str, ...] = tuple(name for name in preferences if name in supported)
+        self.framing = framing or framing_from_env()
+        if any(get_codec(name).binary for name in self.codecs):
+            self.framing = FRAMING_LENGTH
+        self._channel: Optional[_AsyncChannel] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self.connects = 0
+
+    async def close(self) -> None:
+        channel, self._channel = self._channel, None
+        if channel is not None:
+            channel.fail(MCPUnavailableError("MCP TCP connection closed"))
+            if channel.task is not None:
+                await asyncio.gather(channel.task, return_exceptions=True)
+
+    async def _round_trip(self, payload: JsonDict) -> JsonDict:
+        last_error: Optional[BaseException] = None
+        for _ in range(2):
+            channel = await self._open()
+            try:
+                data = encode_frame(payload, channel.framing, channel.codec)
+            except PayloadTooLargeError as exc:
+                raise MCPUnavailableError(f"MCP request payload too large: {exc}") from exc
+            future: "asyncio.Future[JsonDict]" = asyncio.get_running_loop().create_future()
+            call_id = payload.get("id")
+            channel.pending[call_id if call_id is not None else object()] = future
+            try:
+                channel.writer.write(data)
+                await channel.writer.drain()
+            except OSError as exc:
+                channel.fail(exc)
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), self._timeout)
+            except asyncio.TimeoutError:
+                # As in MultiplexedConnection: a late id-less reply would reach the wrong caller.
+                future.cancel()
+                channel.fail(ConnectionError("MCP request timed out"))
+                raise MCPUnavailableError("MCP TCP connection error: timed out") from None
+            except MCPUnavailableError:
+                raise
+            except (OSError, ConnectionError) as exc:
+                last_error = exc
+        raise MCPUnavailableError(f"MCP TCP connection error: {last_error}") from last_error
+
+    async def _open(self) -> _AsyncChannel:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            channel = self._channel
+            if channel is not None and channel.alive:
+                return channel
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self._host, self._port, limit=STREAM_LIMIT),
+                    self._timeout,
+                )
+            except (OSError, asyncio.TimeoutError) as exc:
+                raise MCPUnavailableError(f"MCP TCP connection error: {exc}") from exc
+            try:
+                framing, codec = await asyncio.wait_for(self._negotiate(reader, writer), self._timeout)
+            except (OSError, asyncio.TimeoutError, PayloadTooLargeError, InvalidPayloadError) as exc:
+                writer.close()
+                raise MCPUnavailableError(f"MCP TCP connection error: {exc}") from exc
+            channel = _AsyncChannel(reader, writer, framing, codec)
+            channel.task = asyncio.ensure_future(channel.read_loop())
+            self._channel = channel
+            self.connects += 1
+            return channel
+
+    async def _negotiate(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> Tuple[str, Optional[Codec]]:
+        if self.framing == FRAMING_NEWLINE and not self.codecs:
+            return FRAMING_NEWLINE, None
+        await write_message(writer, framing_request(self.framing, self.codecs))
+        message = await read_message(reader)
+        if message is None:
+            raise ConnectionError("MCP server closed the connection during framing handshake")
+        result = decode_payload(message).get("result")
+        if not isinstance(result, dict) or result.get("framing") != self.framing:
+            return FRAMING_NEWLINE, None
+        codec = select_codec([result.get("codec")], self.framing)
+        return self.framing, codec if codec.name in self.codecs else None
+
+
+async def validate_all(
+    validator: _AsyncValidatorBase,
+    assets: Sequence[Mapping[str, Any]],
+    *,
+    concurrency: int = 100,
+) -> List[JsonDict]:
+    """Validate *assets* individually with at most *concurrency* requests in flight.
+
+    Results come back in input order; the first failure propagates.
+    """
+
+    if concurrency <= 0:
+        raise ValueError("concurrency must be a positive integer")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(asset: Mapping[str, Any]) -> JsonDict:
+        async with semaphore:
+            return await validator.validate(asset)
+
+    return list(await asyncio.gather(*(_one(asset) for asset in assets)))
+
+
+__all__ = ["AsyncSocketMCPValidator", "AsyncTcpMCPValidator", "validate_all"]
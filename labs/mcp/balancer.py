@@ -0,0 +1,281 @@
+"""Spread MCP validation across several endpoints with passive health checks."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from labs.mcp.exceptions import MCPMethodNotFoundError, MCPUnavailableError
+from labs.mcp.result_cache import canonical_asset_hash
+
+STRATEGY_LEAST_OUTSTANDING = "least-outstanding"
+STRATEGY_HASH = "hash"
+
+_VIRTUAL_NODES = 64
+
+
+class _Endpoint:
+    __slots__ = ("name", "client", "in_flight", "requests", "failures", "consecutive_failures", "ejected_until")
+
+    def __init__(self, name: str, client: Any) -> None:
+        self.name = name
+        self.client = client
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+
+
+class BalancedMCPValidator:
+    """Route validation requests across MCP endpoints with failover.
+
+    *endpoints* is a sequence of ``(name, client)`` pairs where each client
+    exposes ``validate`` and ``validate_many`` (any of the bundled transport
+    validators). With the ``least-outstanding`` strategy each request goes to
+    the endpoint with the fewest requests in flight (ties rotate). With
+    ``hash`` each asset is placed on a consistent-hash ring keyed by its
+    canonical hash, so repeat validations of an asset reach the same endpoint
+    and its caches stay warm; adding or removing an endpoint only remaps
+    that endpoint's share.
+
+    Health is tracked passively: ``eject_after`` consecutive transport
+    failures eject an endpoint for ``ejection`` seconds, doubling on each
+    repeat up to ``max_ejection``. Once the period lapses the endpoint is
+    re-admitted and a success resets its backoff. A failed request is
+    retried on the next eligible endpoint; when every endpoint is ejected
+    they are still tried, soonest re-admission first.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[Tuple[str, Any]],
+        *,
+        strategy: str = STRATEGY_LEAST_OUTSTANDING,
+        eject_after: int = 1,
+        ejection: float = 5.0,
+        max_ejection: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not endpoints:
+            raise ValueError("at least one MCP endpoint is required")
+        if strategy not in {STRATEGY_LEAST_OUTSTANDING, STRATEGY_HASH}:
+            raise ValueError(f"unsupported balancing strategy: {strategy}")
+        self._endpoints = [_Endpoint(name, client) for name, client in endpoints]
+        self.strategy = strategy
+        self._eject_after = max(1, eject_after)
+        self._ejection = ejection
+        self._max_ejection = max(ejection, max_ejection)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next = 0
+        self._ring: List[Tuple[int, int]] = sorted(
+            (_ring_hash(f"{endpoint.name}#{replica}"), index)
+            for index, endpoint in enumerate(self._endpoints)
+            for replica in range(_VIRTUAL_NODES)
+        )
+        self._ring_keys = [key for key, _ in self._ring]
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+    def validate(self, asset: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate *asset* on the selected endpoint, failing over on errors."""
+
+        key = canonical_asset_hash(asset) if self.strategy == STRATEGY_HASH else None
+        return self._call(key, lambda client: client.validate(asset))
+
+    def validate_many(
+        self,
+        assets: Sequence[Mapping[str, Any]],
+        *,
+        batch_limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Validate *assets*; with hashing, each endpoint receives its own share."""
+
+        if self.strategy != STRATEGY_HASH:
+            return self._call(None, lambda client: client.validate_many(assets, batch_limit=batch_limit))
+
+        groups: Dict[int, List[int]] = {}
+        keys: Dict[int, str] = {}
+        for position, asset in enumerate(assets):
+            key = canonical_asset_hash(asset)
+            owner = self._ring_owner(key)
+            groups.setdefault(owner, []).append(position)
+            keys.setdefault(owner, key)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(assets)
+        for owner, positions in groups.items():
+            share = [assets[position] for position in positions]
+            items = self._call(keys[owner], lambda client: client.validate_many(share, batch_limit=batch_limit))
+            for position, item in zip(positions, items):
+                results[position] = item
+        return results  # type: ignore[return-value]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            now = self._clock()
+            return [
+                {
+                    "endpoint": endpoint.name,
+                    "in_flight": endpoint.in_flight,
+                    "requests": endpoint.requests,
+                    "failures": endpoint.failures,
+                    "healthy": endpoint.ejected_until <= now,
+                }
+                for endpoint in self._endpoints
+            ]
+
+    def close(self) -> None:
+        for endpoint in self._endpoints:
+            close = getattr(endpoint.client, "close", None)
+            if callable(close):
+                close()
+
+    def _call(self, key: Optional[str], operation: Callable[[Any], Any]) -> Any:
+        last_error: Optional[MCPUnavailableError] = None
+        for index in self._candidates(key):
+            endpoint = self._endpoints[index]
+            with self._lock:
+                endpoint.in_flight += 1
+                endpoint.requests += 1
+            try:
+                result = operation(endpoint.client)
+            except MCPMethodNotFoundError:
+                self._release(endpoint, ok=True)
+                raise
+            except MCPUnavailableError as exc:
+                self._release(endpoint, ok=False)
+                last_error = exc
+                continue
+            except BaseException:
+                self._release(endpoint, ok=True)
+                raise
+            self._release(endpoint, ok=True)
+            return result
+        assert last_error is not None
+        raise MCPUnavailableError(f"All MCP endpoints failed: {last_error}") from last_error
+
+    def _release(self, endpoint: _Endpoint, *, ok: bool) -> None:
+        with self._lock:
+            endpoint.in_flight -= 1
+            if ok:
+                endpoint.consecutive_failures = 0
+                return
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            strikes = endpoint.consecutive_failures - self._eject_after
+            if strikes >= 0:
+                backoff = min(self._ejection * (2 ** min(strikes, 16)), self._max_ejection)
+                endpoint.ejected_until = self._clock() + backoff
+
+    def _candidates(self, key: Optional[str]) -> List[int]:
+        """Return endpoint indices in try order: eligible first, then ejected."""
+
+        with self._lock:
+            now = self._clock()
+            count = len(self._endpoints)
+            if key is None:
+                order = sorted(
+                    range(count),
+                    key=lambda i: (self._endpoints[i].in_flight, (i - self._next) % count),
+                )
+            else:
+                order = self._ring_walk(key)
+            healthy = [i for i in order if self._endpoints[i].ejected_until <= now]
+            ejected = sorted(
+                (i for i in order if self._endpoints[i].ejected_until > now),
+                key=lambda i: self._endpoints[i].ejected_until,
+            )
+            if key is None and healthy:
+                self._next = (healthy[0] + 1) % count
+            return healthy + ejected
+
+    def _ring_owner(self, key: str) -> int:
+        candidates = self._candidates(key)
+        return candidates[0]
+
+    def _ring_walk(self, key: str) -> List[int]:
+        start = bisect.bisect(self._ring_keys, _ring_hash(key))
+        seen: List[int] = []
+        for offset in range(len(self._ring)):
+            index = self._ring[(start + offset) % len(self._ring)][1]
+            if index not in seen:
+                seen.append(index)
+                if len(seen) == len(self._endpoints):
+                    break
+        return seen
+
+
+def _ring_hash(value: str) -> int:
+    return int.from_bytes(hashlib.sha256(value.encode("utf-8")).digest()[:8], "big")
+
+
+def parse_endpoint(spec: str, *, timeout: float = 10.0) -> Tuple[str, Any]:
+    """Build a transport client for one endpoint *spec*.
+
+    Accepted forms are ``tcp://host:port``, ``host:port``, ``unix:///path``
+    and a bare absolute socket path.
+    """
+
+    from labs.mcp.tcp_client import TcpMCPValidator
+    from labs.mcp_stdio import SocketMCPValidator
+
+    text = spec.strip()
+    if text.startswith("unix:"):
+        path = text[len("unix:") :]
+        if path.startswith("//"):
+            path = path[2:]
+        if not path:
+            raise MCPUnavailableError(f"Invalid MCP endpoint: {spec!r}")
+        return f"unix:{path}", SocketMCPValidator(path, timeout=timeout)
+    if text.startswith("/"):
+        return f"unix:{text}", SocketMCPValidator(text, timeout=timeout)
+    if text.startswith("tcp://"):
+        text = text[len("tcp://") :]
+    host, sep, port_raw = text.rpartition(":")
+    if not sep or not host:
+        raise MCPUnavailableError(f"Invalid MCP endpoint: {spec!r}")
+    try:
+        port = int(port_raw)
+    except ValueError as exc:
+        raise MCPUnavailableError(f"Invalid MCP endpoint port: {spec!r}") from exc
+    host = host.strip("[]")
+    return f"tcp:{host}:{port}", TcpMCPValidator(host, port, timeout=timeout)
+
+
+def balanced_validator_from_env(*, timeout: float = 10.0) -> Optional[BalancedMCPValidator]:
+    """Return a balancer for ``MCP_ENDPOINTS`` (comma separated), if set.
+
+    ``MCP_BALANCE=hash`` selects consistent hashing; the default is
+    least-outstanding. ``MCP_EJECTION_SECONDS`` sets the base ejection time.
+    """
+
+    raw = os.getenv("MCP_ENDPOINTS", "").strip()
+    if not raw:
+        return None
+    specs = [part for part in raw.split(",") if part.strip()]
+    strategy_raw = os.getenv("MCP_BALANCE", "").strip().lower()
+    strategy = STRATEGY_HASH if strategy_raw in {"hash", "consistent-hash"} else STRATEGY_LEAST_OUTSTANDING
+    ejection_raw = os.getenv("MCP_EJECTION_SECONDS", "").strip()
+    try:
+        ejection = float(ejection_raw) if ejection_raw else 5.0
+    except ValueError as exc:
+        raise MCPUnavailableError("MCP_EJECTION_SECONDS must be a number") from exc
+    return BalancedMCPValidator(
+        [parse_endpoint(spec, timeout=timeout) for spec in specs],
+        strategy=strategy,
+        ejection=ejection,
+    )
+
+
+__all__ = [
+    "STRATEGY_HASH",
+    "STRATEGY_LEAST_OUTSTANDING",
+    "BalancedMCPValidator",
+    "balanced_validator_from_env",
+    "parse_endpoint",
+]
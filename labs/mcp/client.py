@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
-import copy
 import logging
 import os
+import random
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 
 from mcp import core as mcp_core
 
+from labs.frozen import FrozenDict, freeze
 from labs.generator.assembler import AssetAssembler
 from labs.logging import log_jsonl
-from labs.mcp.exceptions import MCPUnavailableError
+from labs.mcp.exceptions import MCPMethodNotFoundError, MCPUnavailableError
+from labs.mcp.result_cache import ValidationResultCache
+from labs.mcp.schema_cache import SchemaDescriptorCache, schema_content_hash
+from labs.mcp.sampling import sample_rate_from_env, sample_seed_from_env, sample_strategy_from_env, select_sample
+from labs.mcp.validate import (
+    is_legacy_version,
+    local_verdict,
+    prepare_for_validation,
+    resolve_validation_tier,
+    schema_unavailable,
+    schema_version_of,
+    validate_asset,
+)
 from labs.mcp.tcp_client import get_schema_from_mcp
+from labs.singleflight import SingleFlight
 
 JsonDict = Dict[str, Any]
 
@@ -23,6 +38,10 @@ _DEFAULT_SCHEMA_NAME = "synesthetic-asset"
 _VALID_RESOLUTIONS = {"inline"}
 
 
+def _as_dict(entry: Mapping[str, Any]) -> JsonDict:
+    return entry if type(entry) is dict else dict(entry)
+
+
 class MCPClientError(RuntimeError):
     """Base error raised by the MCP client."""
 
@@ -40,6 +59,7 @@ class MCPClient:
     """Encapsulate schema retrieval, resolution, and validation handshakes."""
 
     DEFAULT_BATCH_LIMIT = 50
+    DEFAULT_VALIDATE_CONCURRENCY = 4
 
     def __init__(
         self,
@@ -48,8 +68,15 @@ class MCPClient:
         schema_version: Optional[str] = None,
         resolution: Optional[str] = None,
         batch_limit: Optional[int] = None,
+        concurrency: Optional[int] = None,
         telemetry_path: Optional[str] = None,
         event_hook: Optional[Callable[[JsonDict], None]] = None,
+        schema_cache: Union[SchemaDescriptorCache, bool, None] = None,
+        result_cache: Optional[ValidationResultCache] = None,
+        validation_tier: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+        sample_strategy: Optional[str] = None,
+        sample_seed: Optional[int] = None,
     ) -> None:
         self.schema_name = schema_name or _DEFAULT_SCHEMA_NAME
         self._requested_version = schema_version or os.getenv(
@@ -58,12 +85,26 @@ class MCPClient:
         env_resolution = os.getenv("LABS_SCHEMA_RESOLUTION")
         self.resolution = self._normalise_resolution(resolution or env_resolution)
         self.batch_limit = self._resolve_batch_limit(batch_limit)
+        self.concurrency = self._resolve_concurrency(concurrency)
         self.telemetry_path = telemetry_path or os.getenv("LABS_MCP_LOG_PATH")
         self._event_hook = event_hook
         self._descriptor_cache: Dict[Tuple[str, str, str], JsonDict] = {}
         self._descriptor: Optional[JsonDict] = None
+        self._fingerprints: Dict[str, Tuple[JsonDict, Tuple[str, str]]] = {}
+        if schema_cache is None or schema_cache is True:
+            schema_cache = SchemaDescriptorCache.from_env()
+        self._schema_cache: Optional[SchemaDescriptorCache] = schema_cache or None
+        self.result_cache = result_cache
+        self.validation_tier = resolve_validation_tier(validation_tier)
+        self.sample_rate = sample_rate if sample_rate is not None else sample_rate_from_env()
+        if not 0 < self.sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self.sample_strategy = sample_strategy or sample_strategy_from_env()
+        self._sample_rng = random.Random(sample_seed if sample_seed is not None else sample_seed_from_env())
         self._transport_validator: Union[Callable[[MutableMapping[str, Any]], Dict[str, Any]], bool, None] = None
+        self._transport_batch_validator: Union[Callable[..., List[JsonDict]], bool, None] = None
         self._lock = threading.RLock()
+        self._schema_flight = SingleFlight()
 
     @staticmethod
     def _normalise_resolution(resolution: Optional[str]) -> str:
@@ -90,12 +131,33 @@ class MCPClient:
                     return parsed
         return MCPClient.DEFAULT_BATCH_LIMIT
 
+    @staticmethod
+    def _resolve_concurrency(candidate: Optional[int]) -> int:
+        if candidate is not None and candidate > 0:
+            return candidate
+        env_value = os.getenv("MCP_VALIDATE_CONCURRENCY")
+        if env_value:
+            try:
+                parsed = int(env_value)
+            except ValueError:
+                _LOGGER.warning("Invalid MCP_VALIDATE_CONCURRENCY value '%s'; using default", env_value)
+            else:
+                if parsed > 0:
+                    return parsed
+        return MCPClient.DEFAULT_VALIDATE_CONCURRENCY
+
     @property
     def descriptor(self) -> Optional[JsonDict]:
+        """The last fetched descriptor, shared and read-only (see :mod:`labs.frozen`)."""
+
         with self._lock:
-            if self._descriptor is None:
-                return None
-            return copy.deepcopy(self._descriptor)
+            return self._descriptor
+
+    @property
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Return singleflight counters for :meth:`fetch_schema`."""
+
+        return self._schema_flight.stats()
 
     @property
     def schema_version(self) -> str:
@@ -126,25 +188,73 @@ class MCPClient:
         resolution: Optional[str] = None,
         force: bool = False,
     ) -> JsonDict:
-        """Retrieve and cache the descriptor for *name*."""
+        """Retrieve and cache the descriptor for *name*.
+
+        Lookups consult the per-instance cache, then the on-disk
+        :class:`SchemaDescriptorCache` shared across processes (unless
+        disabled via ``LABS_SCHEMA_CACHE=0``), and only then the MCP.
+        The descriptor is a frozen, shared object; use
+        :func:`labs.frozen.thaw` for a mutable copy.
+        """
 
         target_name = name or self.schema_name
         target_version = version or self._requested_version
         target_resolution = self._normalise_resolution(resolution or self.resolution)
 
-        cache_key = (target_name, target_version, target_resolution)
+        descriptor = self._descriptor_for(target_name, target_version, target_resolution, force=force)
+        with self._lock:
+            self._descriptor = descriptor
+        return descriptor
+
+    def schema_fingerprint(self, identifier: str) -> Optional[Tuple[str, str]]:
+        """Return ``(schema_id, content hash)`` of the descriptor this client validates *identifier* against.
+
+        Used as the :class:`ValidationResultCache` fingerprint for verdicts
+        from the MCP, so cached results follow the server's schema rather
+        than the local ``meta/schemas`` copy. Descriptors come from
+        :meth:`fetch_schema`'s caches, so a server-side change is noticed
+        once the descriptor is refreshed. Does not change :attr:`descriptor`.
+        """
+
+        version = schema_version_of({"$schema": identifier})
+        if version is None:
+            return None
+        try:
+            descriptor = self._descriptor_for(self.schema_name, version, self.resolution)
+        except MCPClientError:
+            return None
+        with self._lock:
+            memo = self._fingerprints.get(version)
+        if memo is not None and memo[0] is descriptor:
+            return memo[1]
+        schema = descriptor.get("schema")
+        if not isinstance(schema, Mapping):
+            return None
+        schema_id = descriptor.get("schema_id") or identifier
+        fingerprint = (str(schema_id), schema_content_hash(schema))
+        with self._lock:
+            self._fingerprints[version] = (descriptor, fingerprint)
+        return fingerprint
+
+    def _descriptor_for(self, name: str, version: str, resolution: str, *, force: bool = False) -> JsonDict:
+        cache_key = (name, version, resolution)
         with self._lock:
             if not force and cache_key in self._descriptor_cache:
-                self._descriptor = self._descriptor_cache[cache_key]
-                return copy.deepcopy(self._descriptor)
+                return self._descriptor_cache[cache_key]
 
-        descriptor = self._resolve_schema_descriptor(
-            target_name, target_version, target_resolution
-        )
+        def _load() -> JsonDict:
+            return self._resolve_schema_descriptor(name, version, resolution)
+
+        def _load_shared() -> JsonDict:
+            if self._schema_cache is None:
+                return _load()
+            return self._schema_cache.fetch((*cache_key, self._schema_source()), _load, force=force)
+
+        # Concurrent cold-cache fetches for the same key share one resolution.
+        descriptor = freeze(self._schema_flight.do(cache_key, _load_shared))
 
         with self._lock:
             self._descriptor_cache[cache_key] = descriptor
-            self._descriptor = descriptor
 
         self._emit_event(
             {
@@ -155,7 +265,18 @@ class MCPClient:
                 "schema_id": descriptor.get("schema_id"),
             }
         )
-        return copy.deepcopy(descriptor)
+        return descriptor
+
+    @staticmethod
+    def _schema_source() -> str:
+        """Identify the MCP endpoint and local schema directory descriptors come from."""
+
+        from labs.mcp_stdio import resolve_mcp_endpoint  # local import to avoid cycles
+
+        host = os.getenv("MCP_HOST", "127.0.0.1").strip()
+        port = os.getenv("MCP_PORT", "8765").strip()
+        schemas_dir = os.getenv("SYN_SCHEMAS_DIR", "").strip()
+        return f"{resolve_mcp_endpoint()}|tcp://{host}:{port}|{schemas_dir}"
 
     def validate(
         self,
@@ -163,7 +284,23 @@ class MCPClient:
         *,
         strict: bool = True,
     ) -> List[JsonDict]:
-        """Validate *assets* via MCP batch validation."""
+        """Validate *assets* via MCP batch validation.
+
+        Transports exposing ``validate_many`` validate the whole batch in one
+        round trip per payload-sized chunk; adapters that reject the method
+        fall back to per-asset calls, and an unavailable transport falls back
+        to ``mcp.core.validate_many``. When a ``result_cache`` is attached,
+        assets with a cached verdict for the current schema skip validation.
+        With a ``tiered`` or ``local`` ``validation_tier`` the in-process
+        validator runs first (see :func:`labs.mcp.validate.local_verdict`) and
+        each result records the deciding tier under ``validation_tier``;
+        local verdicts are not written to the result cache. The ``sampled``
+        tier validates the whole batch locally and confirms a sample
+        remotely, re-validating everything remotely when any verdict differs.
+        In these tiers, results that needed the MCP but were validated by the
+        ``mcp.core`` fallback (no transport) are tagged ``fallback`` rather
+        than ``remote`` and are not cached either.
+        """
 
         batch = list(assets)
         if not batch:
@@ -173,44 +310,195 @@ class MCPClient:
 
         prepared_batch = [self._prepare_asset_for_validation(item) for item in batch]
 
+        cache = self.result_cache
+        if cache is None:
+            results = self._validate_tiered(prepared_batch, strict=strict)
+        else:
+            cached = [cache.get(item) for item in prepared_batch]
+            pending = [index for index, entry in enumerate(cached) if entry is None]
+            fresh: List[JsonDict] = []
+            if pending:
+                fresh = self._validate_tiered([prepared_batch[index] for index in pending], strict=strict)
+            for index, entry in zip(pending, fresh):
+                if entry.get("validation_tier") not in ("local", "fallback"):
+                    cache.put(prepared_batch[index], entry)
+                cached[index] = entry
+            results = [entry if entry is not None else {"ok": False, "reason": "empty_result"} for entry in cached]
+
+        event: JsonDict = {
+            "event": "schema_validated",
+            "count": len(results),
+            "strict": strict,
+            "ok": all(entry.get("ok") for entry in results),
+        }
+        if self.validation_tier != "remote":
+            event["validation_tier"] = self.validation_tier
+            event["local_decisions"] = sum(1 for entry in results if entry.get("validation_tier") == "local")
+            event["fallback_decisions"] = sum(1 for entry in results if entry.get("validation_tier") == "fallback")
+        self._emit_event(event)
+        return results
+
+    def _validate_tiered(self, prepared_batch: List[MutableMapping[str, Any]], *, strict: bool) -> List[JsonDict]:
+        tier = self.validation_tier
+        if tier == "remote":
+            return self._validate_prepared(prepared_batch, strict=strict)
+        if tier == "sampled":
+            return self._validate_sampled(prepared_batch, strict=strict)
+
+        results: List[Optional[JsonDict]] = []
+        for asset in prepared_batch:
+            verdict = local_verdict(asset, tier)
+            results.append(None if verdict is None else dict(verdict, validation_tier="local"))
+        pending = [index for index, entry in enumerate(results) if entry is None]
+        if pending:
+            remote, deciding_tier = self._validate_remote([prepared_batch[index] for index in pending], strict=strict)
+            for index, entry in zip(pending, remote):
+                results[index] = dict(entry, validation_tier=deciding_tier)
+        return [entry if entry is not None else {"ok": False, "reason": "empty_result"} for entry in results]
+
+    def _validate_sampled(self, prepared_batch: List[MutableMapping[str, Any]], *, strict: bool) -> List[JsonDict]:
+        """Validate locally, confirm a sample remotely, and escalate the batch on any disagreement.
+
+        Samples are stratified by ``$schema`` and local verdict unless
+        ``sample_strategy`` is ``random``. Assets whose schema is not bundled
+        locally always go to the transport. Without a transport the
+        confirmation is only ``mcp.core`` re-running the local schema, so
+        drift cannot be detected: those results are tagged ``fallback`` and
+        never trigger escalation.
+        """
+
+        local = [validate_asset(asset) for asset in prepared_batch]
+        results = [dict(entry, validation_tier="local") for entry in local]
+        deferred = [index for index, entry in enumerate(local) if schema_unavailable(entry)]
+        candidates = [index for index, entry in enumerate(local) if not schema_unavailable(entry)]
+        strata = [(prepared_batch[index].get("$schema"), bool(local[index]["ok"])) for index in candidates]
+        with self._lock:
+            picked = select_sample(strata, self.sample_rate, self._sample_rng, strategy=self.sample_strategy)
+        sampled = {candidates[position] for position in picked}
+
+        fallback: List[int] = []
+
+        def _confirm(indices: List[int]) -> List[int]:
+            remote, deciding_tier = self._validate_remote([prepared_batch[index] for index in indices], strict=strict)
+            mismatched = []
+            for index, entry in zip(indices, remote):
+                if deciding_tier == "fallback":
+                    fallback.append(index)
+                elif index in sampled and bool(entry.get("ok")) != bool(local[index]["ok"]):
+                    mismatched.append(index)
+                results[index] = dict(entry, validation_tier=deciding_tier)
+            return mismatched
+
+        confirmed = sorted(sampled.union(deferred))
+        mismatches = _confirm(confirmed) if confirmed else []
+        if mismatches:
+            _LOGGER.warning(
+                "Local and remote verdicts differ for %d of %d sampled assets; validating the batch remotely",
+                len(mismatches),
+                len(sampled),
+            )
+            done = set(confirmed)
+            remaining = [index for index in range(len(prepared_batch)) if index not in done]
+            if remaining:
+                _confirm(remaining)
+
+        self._emit_event(
+            {
+                "event": "validation_sampled",
+                "count": len(prepared_batch),
+                "sampled": len(sampled),
+                "deferred": len(deferred),
+                "mismatches": len(mismatches),
+                "escalated": bool(mismatches),
+                "fallback": len(fallback),
+                "strategy": self.sample_strategy,
+            }
+        )
+        return results
+
+    def _validate_remote(
+        self,
+        prepared_batch: List[MutableMapping[str, Any]],
+        *,
+        strict: bool,
+    ) -> Tuple[List[JsonDict], str]:
+        """Validate for a tier that needs the MCP's verdict; return results and the deciding tier.
+
+        The tier is ``remote`` when the transport answered and ``fallback``
+        when no transport was available and ``mcp.core`` validated locally.
+        """
+
+        results = self._validate_prepared(prepared_batch, strict=strict)
+        # _validate_prepared disables the transport whenever it falls back to mcp.core.
+        if self._resolve_transport_validator():
+            return results, "remote"
+        _LOGGER.warning(
+            "MCP transport unavailable; %d asset(s) validated by the local fallback, not confirmed remotely",
+            len(prepared_batch),
+        )
+        return results, "fallback"
+
+    def _validate_prepared(self, prepared_batch: List[MutableMapping[str, Any]], *, strict: bool) -> List[JsonDict]:
         transport_validator = self._resolve_transport_validator()
         results: Optional[List[JsonDict]] = None
 
-        if callable(transport_validator):
-            responses: List[JsonDict] = []
-            for asset in prepared_batch:
-                try:
-                    response = transport_validator(asset)
-                except MCPUnavailableError as exc:
-                    _LOGGER.debug("Transport validator unavailable during batch validation: %s", exc)
-                    self._transport_validator = False
-                    responses = []
-                    break
-                except Exception as exc:  # pragma: no cover - defensive fallback
-                    _LOGGER.warning("Unexpected MCP transport validation error: %s", exc)
-                    self._transport_validator = False
-                    responses = []
-                    break
-                if isinstance(response, Mapping):
-                    responses.append(dict(response))
-                else:
-                    responses.append({"ok": False, "reason": "invalid_mcp_response"})
-            if responses:
-                results = responses
+        batch_validator = self._transport_batch_validator
+        if callable(transport_validator) and callable(batch_validator):
+            try:
+                results = batch_validator(prepared_batch, batch_limit=self.batch_limit)
+            except MCPMethodNotFoundError as exc:
+                _LOGGER.debug("Transport lacks validate_many; validating per asset: %s", exc)
+                self._transport_batch_validator = False
+            except MCPUnavailableError as exc:
+                _LOGGER.debug("Transport validator unavailable during batch validation: %s", exc)
+                self._transport_validator = False
+            except Exception as exc:  # pragma: no cover - defensive fallback
+                _LOGGER.warning("Unexpected MCP transport validation error: %s", exc)
+                self._transport_validator = False
+            transport_validator = self._resolve_transport_validator()
+
+        if results is None and callable(transport_validator):
+            results = self._validate_per_asset(transport_validator, prepared_batch)
 
         if results is None:
             payload = mcp_core.validate_many(prepared_batch, strict=strict)
             results = self._normalise_validation_payload(payload)
-        self._emit_event(
-            {
-                "event": "schema_validated",
-                "count": len(results),
-                "strict": strict,
-                "ok": all(entry.get("ok") for entry in results),
-            }
-        )
         return results
 
+    def _validate_per_asset(
+        self,
+        transport_validator: Callable[[MutableMapping[str, Any]], Dict[str, Any]],
+        prepared_batch: List[MutableMapping[str, Any]],
+    ) -> Optional[List[JsonDict]]:
+        """Validate each asset over the transport, up to ``concurrency`` at a time.
+
+        Results keep input order. Any transport failure marks the transport
+        unusable and returns ``None`` so the caller falls back to
+        ``mcp.core.validate_many`` for the whole batch.
+        """
+
+        def _coerce(response: Any) -> JsonDict:
+            if isinstance(response, Mapping):
+                return dict(response)
+            return {"ok": False, "reason": "invalid_mcp_response"}
+
+        workers = min(self.concurrency, len(prepared_batch))
+        try:
+            if workers <= 1:
+                return [_coerce(transport_validator(asset)) for asset in prepared_batch]
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="labs-mcp-validate")
+            try:
+                futures = [executor.submit(transport_validator, asset) for asset in prepared_batch]
+                return [_coerce(future.result()) for future in futures]
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+        except MCPUnavailableError as exc:
+            _LOGGER.debug("Transport validator unavailable during batch validation: %s", exc)
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            _LOGGER.warning("Unexpected MCP transport validation error: %s", exc)
+        self._transport_validator = False
+        return None
+
     def confirm(self, asset: MutableMapping[str, Any], *, strict: bool = True) -> JsonDict:
         """Validate a single *asset* and raise on failure when strict."""
 
@@ -229,6 +517,7 @@ class MCPClient:
         resolution: str,
     ) -> JsonDict:
         response: Optional[JsonDict] = None
+        source = "mcp"
         try:
             response = get_schema_from_mcp(
                 name,
@@ -242,6 +531,7 @@ class MCPClient:
 
         if not response:
             response = mcp_core.get_schema(name, version=version, resolution=resolution)
+            source = "mcp.core"
 
         if not isinstance(response, Mapping):
             raise MCPClientError("MCP schema response must be a mapping")
@@ -257,6 +547,7 @@ class MCPClient:
                     fallback.get("version"),
                 )
                 response = fallback
+                source = "mcp.core"
             else:
                 raise MCPClientError(f"MCP schema unavailable: {reason}")
 
@@ -279,29 +570,30 @@ class MCPClient:
             "name": response.get("name", name),
             "version": resolved_version,
             "path": response.get("path"),
-            "schema": copy.deepcopy(schema),
+            "schema": schema,
             "schema_id": schema_id,
             "resolution": resolution,
+            "source": source,
             "fetched_at": datetime.now(tz=timezone.utc).isoformat(),
         }
         if requested_version:
             descriptor["requested_version"] = requested_version
         if source_version and source_version != resolved_version:
             descriptor["source_version"] = source_version
-        schema_copy = descriptor.get("schema")
-        if requested_version and isinstance(schema_copy, MutableMapping):
-            schema_copy["$id"] = schema_id
-        return descriptor
+        if requested_version:
+            descriptor["schema"] = {**schema, "$id": schema_id}
+        return FrozenDict(descriptor)
 
     @staticmethod
     def _normalise_validation_payload(payload: Any) -> List[JsonDict]:
+        # ``mcp.core.validate_many`` builds fresh result dicts per call; they are handed over as-is.
         if isinstance(payload, list):
-            return [copy.deepcopy(entry) for entry in payload if isinstance(entry, Mapping)]
+            return [_as_dict(entry) for entry in payload if isinstance(entry, Mapping)]
         if isinstance(payload, Mapping):
             items = payload.get("items")
             if isinstance(items, list):
-                return [copy.deepcopy(entry) for entry in items if isinstance(entry, Mapping)]
-            return [copy.deepcopy(payload)]
+                return [_as_dict(entry) for entry in items if isinstance(entry, Mapping)]
+            return [_as_dict(payload)]
         raise MCPClientError("Unexpected MCP validation response payload")
 
     def _emit_event(self, record: JsonDict) -> None:
@@ -336,66 +628,31 @@ class MCPClient:
         if callable(cached):
             return cached
         try:
-            from labs.mcp_stdio import build_validator_from_env  # local import to avoid cycles
+            from labs.mcp_stdio import build_transport_from_env  # local import to avoid cycles
         except ImportError:
             self._transport_validator = False
             return None
         try:
-            validator = build_validator_from_env()
+            transport = build_transport_from_env()
         except MCPUnavailableError:
             self._transport_validator = False
             return None
-        self._transport_validator = validator
-        return validator
+        self._transport_validator = transport.validate
+        batch_validator = getattr(transport, "validate_many", None)
+        self._transport_batch_validator = batch_validator if callable(batch_validator) else False
+        return transport.validate
 
     def _prepare_asset_for_validation(self, asset: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
-        payload = copy.deepcopy(asset)
-        version = self._extract_schema_version(payload)
-        if version and self._is_legacy_version(version):
-            self._strip_legacy_metadata(payload)
-        return payload
+        """Return *asset* as sent for validation (see :func:`labs.mcp.validate.prepare_for_validation`)."""
 
-    def _extract_schema_version(self, asset: Mapping[str, Any]) -> Optional[str]:
-        schema_field = asset.get("$schema")
-        if isinstance(schema_field, str) and schema_field.strip():
-            tokens = schema_field.rstrip("/").split("/")
-            if tokens:
-                candidate = tokens[-2] if len(tokens) >= 2 else tokens[-1]
-                if candidate and all(ch.isdigit() or ch == "." for ch in candidate):
-                    return candidate
-        return self.schema_version
+        return prepare_for_validation(asset, default_version=self.schema_version)
 
-    @staticmethod
-    def _parse_version(value: Optional[str]) -> Optional[Tuple[int, int, int]]:
-        if not value:
-            return None
-        try:
-            parts = tuple(int(part) for part in str(value).split("."))
-        except ValueError:
-            return None
-        if len(parts) != 3:
-            return None
-        return parts  # type: ignore[return-value]
-
-    def _is_legacy_version(self, version: str) -> bool:
-        parsed = self._parse_version(version)
-        if parsed is None:
-            return str(version) < "0.7.4"
-        return parsed < (0, 7, 4)
+    def _extract_schema_version(self, asset: Mapping[str, Any]) -> Optional[str]:
+        return schema_version_of(asset) or self.schema_version
 
     @staticmethod
-    def _strip_legacy_metadata(payload: MutableMapping[str, Any]) -> None:
-        for key in ("asset_id", "prompt", "timestamp", "seed", "parameter_index", "provenance"):
-            payload.pop(key, None)
-        meta_info = payload.get("meta_info")
-        if isinstance(meta_info, MutableMapping):
-            meta_info.pop("provenance", None)
-        # Legacy schema disallows embedded telemetry fields under rule_bundle meta.
-        rule_bundle = payload.get("rule_bundle")
-        if isinstance(rule_bundle, MutableMapping):
-            bundle_meta = rule_bundle.get("meta_info")
-            if isinstance(bundle_meta, MutableMapping):
-                bundle_meta.pop("provenance", None)
+    def _is_legacy_version(version: str) -> bool:
+        return is_legacy_version(version)
 
 
 def load_schema_bundle(
@@ -404,7 +661,11 @@ def load_schema_bundle(
     version: Optional[str] = None,
     client: Optional["MCPClient"] = None,
 ) -> Dict[str, Any]:
-    """Fetch and return the authoritative inline schema bundle without disk IO."""
+    """Fetch and return the authoritative inline schema bundle without disk IO.
+
+    The bundle is frozen and shared with the client's cache; use
+    :func:`labs.frozen.thaw` before mutating it.
+    """
 
     active_client = client or MCPClient(schema_name=schema_name, schema_version=version, resolution='inline')
     descriptor = active_client.fetch_schema(
@@ -416,7 +677,7 @@ def load_schema_bundle(
     schema = descriptor.get("schema")
     if not isinstance(schema, Mapping):
         raise MCPClientError("MCP schema response missing inline bundle")
-    return copy.deepcopy(schema)
+    return freeze(schema)
 
 
 __all__ = ["MCPClient", "MCPClientError", "MCPValidationError", "load_schema_bundle"]
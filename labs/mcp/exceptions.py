@@ -7,4 +7,8 @@ class MCPUnavailableError(RuntimeError):
     """Raised when the MCP validator cannot be reached."""
 
 
-__all__ = ["MCPUnavailableError"]
+class MCPMethodNotFoundError(MCPUnavailableError):
+    """Raised when the MCP adapter does not implement the requested method."""
+
+
+__all__ = ["MCPMethodNotFoundError", "MCPUnavailableError"]
@@ -0,0 +1,89 @@
+"""JSON-RPC 2.0 envelopes shared by the MCP transport clients."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, Dict, List, Mapping, Sequence
+
+from labs.mcp.exceptions import MCPMethodNotFoundError, MCPUnavailableError
+
+JsonDict = Dict[str, Any]
+
+METHOD_NOT_FOUND = -32601
+
+
+def build_request(method: str, params: Mapping[str, Any]) -> JsonDict:
+    """Return a JSON-RPC request for *method* with a fresh correlation id."""
+
+    return {
+        "jsonrpc": "2.0",
+        "id": str(uuid.uuid4()),
+        "method": method,
+        "params": dict(params),
+    }
+
+
+def validate_request(asset: Mapping[str, Any]) -> JsonDict:
+    return build_request("validate", {"asset": asset})
+
+
+def validate_many_request(assets: Sequence[Mapping[str, Any]]) -> JsonDict:
+    return build_request("validate_many", {"assets": list(assets)})
+
+
+def unwrap_response(payload: Mapping[str, Any]) -> JsonDict:
+    """Return the ``result`` of a JSON-RPC *payload* (or the payload itself)."""
+
+    if payload.get("jsonrpc") == "2.0":
+        if "error" in payload:
+            error = payload["error"]
+            message = error.get("message") if isinstance(error, dict) else str(error)
+            if isinstance(error, dict) and error.get("code") == METHOD_NOT_FOUND:
+                raise MCPMethodNotFoundError(f"MCP method not supported: {message}")
+            raise MCPUnavailableError(f"MCP error response: {message}")
+        result = payload.get("result")
+        if isinstance(result, dict):
+            return result
+        raise MCPUnavailableError("MCP response missing result payload")
+    return dict(payload)
+
+
+def unwrap_batch_items(payload: Mapping[str, Any], expected: int) -> List[JsonDict]:
+    """Return the per-asset results of a ``validate_many`` response in order."""
+
+    result = unwrap_response(payload)
+    items = result.get("items")
+    if not isinstance(items, list):
+        raise MCPUnavailableError("MCP batch response missing items")
+    if len(items) != expected:
+        raise MCPUnavailableError(
+            f"MCP batch response returned {len(items)} items for {expected} assets"
+        )
+    return [
+        dict(item) if isinstance(item, Mapping) else {"ok": False, "reason": "invalid_mcp_response"}
+        for item in items
+    ]
+
+
+def method_not_found(request: Mapping[str, Any]) -> JsonDict:
+    """Return the JSON-RPC error response for an unsupported *request* method."""
+
+    return {
+        "jsonrpc": "2.0",
+        "id": request.get("id"),
+        "error": {
+            "code": METHOD_NOT_FOUND,
+            "message": f"method not found: {request.get('method')}",
+        },
+    }
+
+
+__all__ = [
+    "METHOD_NOT_FOUND",
+    "build_request",
+    "method_not_found",
+    "unwrap_batch_items",
+    "unwrap_response",
+    "validate_many_request",
+    "validate_request",
+]
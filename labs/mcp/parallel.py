@@ -0,0 +1,139 @@
+"""Process-pool sharding for large local validation batches and asset archives."""
+
+from __future__ import annotations
+
+import atexit
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+from labs.mcp.validate import _failure, validate_asset, warm_up_validators
+
+JsonDict = Dict[str, Any]
+
+_DEFAULT_CHUNKSIZE = 64
+_POOL_LOCK = threading.Lock()
+_POOLS: Dict[int, ProcessPoolExecutor] = {}
+
+
+def _validate_chunk(chunk: List[JsonDict]) -> List[JsonDict]:
+    return [validate_asset(asset) for asset in chunk]
+
+
+def _validate_file(path: str) -> JsonDict:
+    try:
+        with open(path, "rb") as handle:
+            asset = json.loads(handle.read())
+    except (OSError, ValueError) as exc:
+        return _failure("validation_failed", [{"path": "/", "msg": f"asset_unreadable: {exc}"}])
+    if not isinstance(asset, dict):
+        return _failure("validation_failed", [{"path": "/", "msg": "asset must be a JSON object"}])
+    return validate_asset(asset)
+
+
+def _validate_file_chunk(chunk: List[str]) -> List[JsonDict]:
+    return [_validate_file(path) for path in chunk]
+
+
+def _get_pool(processes: int) -> ProcessPoolExecutor:
+    """Return the shared pool with *processes* workers, starting it on first use.
+
+    Pools are kept per size so a caller asking for a different count never
+    disturbs chunks another thread is still mapping.
+    """
+
+    with _POOL_LOCK:
+        pool = _POOLS.get(processes)
+        if pool is None:
+            # Spawned workers: callers may be multi-threaded, and each worker warms its own registry.
+            pool = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_up_validators,
+            )
+            _POOLS[processes] = pool
+        return pool
+
+
+def shutdown_pool() -> None:
+    """Stop the shared worker pools (they are restarted on the next parallel call)."""
+
+    with _POOL_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_pool)
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map_chunks(
+    worker: Callable[[List[Any]], List[JsonDict]],
+    items: Iterable[Any],
+    processes: int,
+    chunksize: Optional[int],
+) -> List[JsonDict]:
+    if processes <= 0:
+        raise ValueError("processes must be positive")
+    size = chunksize or _DEFAULT_CHUNKSIZE
+    if size <= 0:
+        raise ValueError("chunksize must be positive")
+
+    chunks = list(_chunks(items, size))
+    if processes == 1 or len(chunks) <= 1:
+        return [result for chunk in chunks for result in worker(chunk)]
+
+    results: List[JsonDict] = []
+    for part in _get_pool(processes).map(worker, chunks):
+        results.extend(part)
+    return results
+
+
+def validate_chunks(
+    assets: Iterable[Mapping[str, Any]],
+    *,
+    processes: int,
+    chunksize: Optional[int] = None,
+) -> List[JsonDict]:
+    """Validate *assets* across *processes* workers, returning results in input order.
+
+    Assets are pickled in chunks of *chunksize* so each task amortises the
+    round trip; batches that fit in a single chunk run in this process.
+    """
+
+    # Plain dicts pickle fastest and keep MutableMapping subclasses out of the workers.
+    plain = (asset if type(asset) is dict else dict(asset) for asset in assets)
+    return _map_chunks(_validate_chunk, plain, processes, chunksize)
+
+
+def validate_files(
+    paths: Iterable[Union[str, os.PathLike]],
+    *,
+    processes: int,
+    chunksize: Optional[int] = None,
+) -> List[JsonDict]:
+    """Read and validate the JSON asset files at *paths*, one result per path in order.
+
+    Only paths cross the process boundary, so workers also share the JSON
+    parsing. Unreadable files and non-object documents are reported as
+    ``validation_failed`` items rather than raised.
+    """
+
+    return _map_chunks(_validate_file_chunk, (os.fspath(path) for path in paths), processes, chunksize)
+
+
+__all__ = ["shutdown_pool", "validate_chunks", "validate_files"]
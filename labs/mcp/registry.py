@@ -0,0 +1,182 @@
+"""Bounded registry of compiled schema validators keyed by schema ``$id``."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from jsonschema import Draft202012Validator
+
+JsonDict = Dict[str, Any]
+ErrorCheck = Callable[[JsonDict], Optional[JsonDict]]
+CanonicalKey = Tuple[str, str]
+T = TypeVar("T")
+
+
+class _Entry:
+    __slots__ = ("key", "path", "schema", "check", "derived", "_validator")
+
+    def __init__(self, key: CanonicalKey, path: Path, schema: JsonDict, check: ErrorCheck) -> None:
+        self.key = key
+        self.path = path
+        self.schema = schema
+        self.check = check
+        self.derived: Dict[str, Any] = {}
+        self._validator: Optional[Draft202012Validator] = None
+
+    @property
+    def validator(self) -> Draft202012Validator:
+        if self._validator is None:
+            self._validator = Draft202012Validator(self.schema)
+        return self._validator
+
+
+class ValidatorRegistry:
+    """LRU of schema validators shared by every spelling of a schema.
+
+    Raw ``$schema`` identifiers (URLs, relative or absolute paths) are
+    resolved once with *resolve* and remembered as aliases of a canonical
+    key, the schema's ``$id`` (or its path when it has none) plus a content
+    hash, so every spelling shares one compiled check. At most
+    *max_entries* schemas are kept; evicting one drops its aliases too.
+    Repeat lookups of a known alias never touch the filesystem.
+    """
+
+    def __init__(
+        self,
+        *,
+        resolve: Callable[[str], Path],
+        build_check: Callable[[JsonDict], ErrorCheck],
+        max_entries: int = 64,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._resolve = resolve
+        self._build_check = build_check
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CanonicalKey, _Entry]" = OrderedDict()
+        self._aliases: Dict[str, CanonicalKey] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._compile_seconds = 0.0
+
+    def __contains__(self, identifier: object) -> bool:
+        with self._lock:
+            return identifier in self._aliases
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+
+    def check(self, identifier: str) -> ErrorCheck:
+        """Return the first-error check for the schema named by *identifier*."""
+
+        return self._entry(identifier).check
+
+    def validator(self, identifier: str) -> Draft202012Validator:
+        """Return a ``jsonschema`` validator for *identifier* (built lazily, shared)."""
+
+        return self._entry(identifier).validator
+
+    def derived(self, identifier: str, name: str, factory: Callable[[JsonDict, Draft202012Validator], T]) -> T:
+        """Return ``factory(schema, validator)`` memoised on the schema's entry under *name*.
+
+        Derived artefacts share the entry's lifetime, so they are dropped
+        when the schema is evicted or the registry is cleared.
+        """
+
+        entry = self._entry(identifier)
+        try:
+            return entry.derived[name]
+        except KeyError:
+            value = factory(entry.schema, entry.validator)
+            with self._lock:
+                return entry.derived.setdefault(name, value)
+
+    def warm_up(self, directory: Path) -> int:
+        """Register every ``<version>/*.schema.json`` below *directory*; return the count."""
+
+        count = 0
+        for path in sorted(directory.glob("*/*.schema.json")):
+            try:
+                entry = self._entry(str(path))
+            except (OSError, ValueError):
+                continue
+            schema_id = entry.schema.get("$id")
+            if isinstance(schema_id, str) and schema_id:
+                with self._lock:
+                    self._aliases.setdefault(schema_id, entry.key)
+            count += 1
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "aliases": len(self._aliases),
+                "compile_seconds": round(self._compile_seconds, 6),
+                "schemas": [key[0] for key in self._entries],
+            }
+
+    def _entry(self, identifier: str) -> _Entry:
+        with self._lock:
+            key = self._aliases.get(identifier)
+            entry = self._entries.get(key) if key is not None else None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry
+
+        path = self._resolve(identifier)
+        data = path.read_bytes()
+        schema = json.loads(data)
+        schema_id = schema.get("$id") if isinstance(schema, dict) else None
+        key = (schema_id if isinstance(schema_id, str) and schema_id else str(path), hashlib.sha256(data).hexdigest())
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._aliases[identifier] = key
+                self._hits += 1
+                return entry
+
+        started = time.perf_counter()
+        check = self._build_check(schema)
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self._misses += 1
+            self._compile_seconds += elapsed
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(key, path, schema, check)
+                self._entries[key] = entry
+                self._evict()
+            self._aliases[identifier] = key
+            return entry
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            key, _ = self._entries.popitem(last=False)
+            self._evictions += 1
+            for alias in [alias for alias, target in self._aliases.items() if target == key]:
+                del self._aliases[alias]
+
+
+__all__ = ["ValidatorRegistry"]
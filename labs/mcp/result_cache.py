@@ -0,0 +1,278 @@
+"""Validation result cache keyed by schema ``$id`` and canonical asset hash."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from labs.mcp.validate import _resolve_schema_path
+
+JsonDict = Dict[str, Any]
+SchemaFingerprint = Tuple[str, str]
+
+_LOGGER = logging.getLogger("labs.mcp.result_cache")
+_DEFAULT_MAX_ENTRIES = 4096
+_TRANSIENT_REASONS = {
+    "mcp_unavailable",
+    "mcp_error",
+    "mcp_client_error",
+    "invalid_mcp_response",
+    "validation_not_attempted",
+    "empty_result",
+}
+
+
+def canonical_asset_hash(asset: Mapping[str, Any]) -> str:
+    """Return a SHA-256 digest of *asset*'s canonical JSON encoding."""
+
+    canonical = json.dumps(asset, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _SchemaFingerprints:
+    """Map ``$schema`` identifiers to ``($id, content hash)`` with stat-based reuse."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_path: Dict[Path, Tuple[Tuple[int, int], SchemaFingerprint]] = {}
+
+    def __call__(self, identifier: str) -> Optional[SchemaFingerprint]:
+        try:
+            path = _resolve_schema_path(identifier)
+            stat = path.stat()
+        except (OSError, ValueError):
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._by_path.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        try:
+            raw = path.read_bytes()
+            schema = json.loads(raw)
+        except (OSError, ValueError):
+            return None
+        schema_id = schema.get("$id") if isinstance(schema, dict) else None
+        fingerprint = (
+            schema_id if isinstance(schema_id, str) and schema_id else str(path),
+            hashlib.sha256(raw).hexdigest(),
+        )
+        with self._lock:
+            self._by_path[path] = (signature, fingerprint)
+        return fingerprint
+
+
+class ValidationResultCache:
+    """Remember definitive validation verdicts for identical assets.
+
+    Entries are keyed by the schema ``$id`` the asset's ``$schema`` resolves to
+    and the canonical hash of the asset. Each entry also records the schema's
+    content hash; a lookup after the schema changes discards the entry. The
+    default *fingerprint* hashes the bundled ``meta/schemas`` file, which
+    suits local verdicts; caches holding MCP verdicts should pass
+    :meth:`labs.mcp.client.MCPClient.schema_fingerprint` so the hash follows
+    the server's schema instead.
+    Results live in a bounded in-memory LRU and, when *path* is given, in a
+    SQLite database shared by concurrent processes.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Optional[str] = None,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        fingerprint: Optional[Callable[[str], Optional[SchemaFingerprint]]] = None,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._fingerprint = fingerprint or _SchemaFingerprints()
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[str, JsonDict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            self._db = self._open_database(path)
+
+    @classmethod
+    def from_env(
+        cls,
+        *,
+        fingerprint: Optional[Callable[[str], Optional[SchemaFingerprint]]] = None,
+    ) -> "ValidationResultCache":
+        """Build a cache, persisting to ``LABS_VALIDATION_CACHE_PATH`` when set."""
+
+        path = os.getenv("LABS_VALIDATION_CACHE_PATH", "").strip() or None
+        return cls(path=path, fingerprint=fingerprint)
+
+    @staticmethod
+    def _open_database(path: str) -> Optional[sqlite3.Connection]:
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS validation_results ("
+                " schema_id TEXT NOT NULL,"
+                " asset_hash TEXT NOT NULL,"
+                " schema_hash TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " PRIMARY KEY (schema_id, asset_hash))"
+            )
+            connection.commit()
+        except sqlite3.Error as exc:
+            _LOGGER.warning("Validation cache database unavailable (%s); using memory only", exc)
+            return None
+        return connection
+
+    def _identity(self, asset: Mapping[str, Any]) -> Optional[Tuple[str, str, str]]:
+        identifier = asset.get("$schema") if isinstance(asset, Mapping) else None
+        if not isinstance(identifier, str) or not identifier.strip():
+            return None
+        fingerprint = self._fingerprint(identifier)
+        if fingerprint is None:
+            return None
+        schema_id, schema_hash = fingerprint
+        return schema_id, canonical_asset_hash(asset), schema_hash
+
+    def get(self, asset: Mapping[str, Any]) -> Optional[JsonDict]:
+        """Return a copy of the cached verdict for *asset*, if still valid."""
+
+        identity = self._identity(asset)
+        if identity is None:
+            return None
+        schema_id, asset_hash, schema_hash = identity
+        key = (schema_id, asset_hash)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] == schema_hash:
+                    self._memory.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return copy.deepcopy(entry[1])
+                del self._memory[key]
+                self._counters["invalidations"] += 1
+
+            stored = self._db_get(key)
+            if stored is not None:
+                stored_hash, result = stored
+                if stored_hash == schema_hash:
+                    self._remember(key, schema_hash, result)
+                    self._counters["hits"] += 1
+                    return copy.deepcopy(result)
+                self._db_delete(key)
+                self._counters["invalidations"] += 1
+
+            self._counters["misses"] += 1
+        return None
+
+    def put(self, asset: Mapping[str, Any], result: Mapping[str, Any]) -> bool:
+        """Store *result* for *asset* when it is a definitive verdict."""
+
+        if not self.is_cacheable(result):
+            return False
+        identity = self._identity(asset)
+        if identity is None:
+            return False
+        schema_id, asset_hash, schema_hash = identity
+        key = (schema_id, asset_hash)
+        payload = copy.deepcopy(dict(result))
+        with self._lock:
+            self._remember(key, schema_hash, payload)
+            self._db_put(key, schema_hash, payload)
+            self._counters["stores"] += 1
+        return True
+
+    def invalidate_schema(self, schema_id: str) -> None:
+        """Drop every entry recorded against *schema_id*."""
+
+        with self._lock:
+            stale = [key for key in self._memory if key[0] == schema_id]
+            for key in stale:
+                del self._memory[key]
+            self._counters["invalidations"] += len(stale)
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM validation_results WHERE schema_id = ?", (schema_id,))
+                    self._db.commit()
+                except sqlite3.Error as exc:  # pragma: no cover - database failure
+                    _LOGGER.debug("Failed to invalidate cached results for %s: %s", schema_id, exc)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            snapshot = dict(self._counters)
+            snapshot["entries"] = len(self._memory)
+        return snapshot
+
+    @staticmethod
+    def is_cacheable(result: Any) -> bool:
+        """Return True for verdicts (pass or schema failure), not transport errors."""
+
+        if not isinstance(result, Mapping) or not isinstance(result.get("ok"), bool):
+            return False
+        return result.get("reason") not in _TRANSIENT_REASONS
+
+    def _remember(self, key: Tuple[str, str], schema_hash: str, result: JsonDict) -> None:
+        self._memory[key] = (schema_hash, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _db_get(self, key: Tuple[str, str]) -> Optional[Tuple[str, JsonDict]]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT schema_hash, result FROM validation_results WHERE schema_id = ? AND asset_hash = ?",
+                key,
+            ).fetchone()
+        except sqlite3.Error as exc:  # pragma: no cover - database failure
+            _LOGGER.debug("Validation cache lookup failed: %s", exc)
+            return None
+        if row is None:
+            return None
+        try:
+            result = json.loads(row[1])
+        except ValueError:
+            return None
+        return row[0], result
+
+    def _db_put(self, key: Tuple[str, str], schema_hash: str, result: JsonDict) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO validation_results"
+                " (schema_id, asset_hash, schema_hash, result, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (key[0], key[1], schema_hash, json.dumps(result, sort_keys=True, default=str), time.time()),
+            )
+            self._db.commit()
+        except sqlite3.Error as exc:  # pragma: no cover - database failure
+            _LOGGER.debug("Validation cache write failed: %s", exc)
+
+    def _db_delete(self, key: Tuple[str, str]) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "DELETE FROM validation_results WHERE schema_id = ? AND asset_hash = ?", key
+            )
+            self._db.commit()
+        except sqlite3.Error as exc:  # pragma: no cover - database failure
+            _LOGGER.debug("Validation cache delete failed: %s", exc)
+
+
+__all__ = ["ValidationResultCache", "canonical_asset_hash"]
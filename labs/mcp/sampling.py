@@ -0,0 +1,77 @@
+"""Sample selection for the ``sampled`` validation tier."""
+
+from __future__ import annotations
+
+import math
+import os
+import random
+from typing import Dict, Hashable, List, Optional, Sequence
+
+DEFAULT_SAMPLE_RATE = 0.01
+SAMPLE_STRATEGIES = ("stratified", "random")
+
+
+def sample_rate_from_env() -> float:
+    """Return ``LABS_VALIDATION_SAMPLE_RATE`` as a fraction in ``(0, 1]`` (default 1%)."""
+
+    raw = os.getenv("LABS_VALIDATION_SAMPLE_RATE")
+    try:
+        rate = float(raw) if raw else DEFAULT_SAMPLE_RATE
+    except ValueError:
+        return DEFAULT_SAMPLE_RATE
+    return rate if 0 < rate <= 1 else DEFAULT_SAMPLE_RATE
+
+
+def sample_strategy_from_env() -> str:
+    raw = os.getenv("LABS_VALIDATION_SAMPLE_STRATEGY", SAMPLE_STRATEGIES[0]).strip().lower()
+    return raw if raw in SAMPLE_STRATEGIES else SAMPLE_STRATEGIES[0]
+
+
+def sample_seed_from_env() -> Optional[int]:
+    raw = os.getenv("LABS_VALIDATION_SAMPLE_SEED")
+    try:
+        return int(raw) if raw else None
+    except ValueError:
+        return None
+
+
+def select_sample(
+    strata: Sequence[Hashable],
+    rate: float,
+    rng: random.Random,
+    *,
+    strategy: str = "stratified",
+) -> List[int]:
+    """Pick indices of *strata* to confirm remotely, in ascending order.
+
+    ``random`` draws ``ceil(rate * n)`` indices from the whole batch.
+    ``stratified`` draws ``ceil(rate * size)`` from every group of equal
+    stratum keys, so each schema version and local verdict present in the
+    batch is checked at least once.
+    """
+
+    if not 0 < rate <= 1:
+        raise ValueError("rate must be in (0, 1]")
+    if not strata:
+        return []
+    if strategy == "random":
+        count = math.ceil(rate * len(strata))
+        return sorted(rng.sample(range(len(strata)), count))
+
+    groups: Dict[Hashable, List[int]] = {}
+    for index, key in enumerate(strata):
+        groups.setdefault(key, []).append(index)
+    chosen: List[int] = []
+    for members in groups.values():
+        chosen.extend(rng.sample(members, math.ceil(rate * len(members))))
+    return sorted(chosen)
+
+
+__all__ = [
+    "DEFAULT_SAMPLE_RATE",
+    "SAMPLE_STRATEGIES",
+    "sample_rate_from_env",
+    "sample_seed_from_env",
+    "sample_strategy_from_env",
+    "select_sample",
+]
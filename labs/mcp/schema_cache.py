@@ -0,0 +1,283 @@
+"""On-disk schema descriptor cache shared across Labs processes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Tuple
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+JsonDict = Dict[str, Any]
+CacheKey = Tuple[str, ...]
+
+_LOGGER = logging.getLogger("labs.mcp.schema_cache")
+_FORMAT_VERSION = 2
+_DEFAULT_TTL_SECONDS = 300.0
+_DEFAULT_MAX_STALE_SECONDS = 24 * 60 * 60.0
+_DISABLED_VALUES = {"0", "false", "no", "off"}
+
+
+def schema_content_hash(schema: Mapping[str, Any]) -> str:
+    """Return a stable SHA-256 digest of *schema*'s canonical JSON form."""
+
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _file_hash(path: Any) -> Optional[str]:
+    if not isinstance(path, str) or not path:
+        return None
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _default_directory() -> Path:
+    base = os.getenv("XDG_CACHE_HOME", "").strip()
+    root = Path(base).expanduser() if base else Path.home() / ".cache"
+    return root / "synesthetic-labs" / "schemas"
+
+
+def _env_seconds(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        _LOGGER.warning("Invalid %s value '%s'; using default", name, raw)
+        return default
+    return value if value >= 0 else default
+
+
+class SchemaDescriptorCache:
+    """Persist schema descriptors under caller-supplied keys.
+
+    :class:`labs.mcp.client.MCPClient` keys entries by ``(name, version,
+    resolution, source)``, where ``source`` identifies the MCP endpoint and
+    local schema directory the descriptor came from. Descriptors read from a
+    local file (``source == "mcp.core"``, file in ``path``) also record that
+    file's content hash and are discarded as soon as it changes.
+
+    Entries younger than *ttl* are served directly. Entries within the
+    additional *max_stale* window are served immediately while a background
+    thread revalidates them (stale-while-revalidate). Older or corrupt entries
+    are reloaded synchronously. Writes are atomic renames and background
+    refreshes take a non-blocking file lock so concurrent processes neither
+    observe torn files nor stampede the MCP with duplicate refreshes.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        ttl: float = _DEFAULT_TTL_SECONDS,
+        max_stale: float = _DEFAULT_MAX_STALE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._clock = clock
+        self._refreshing: Set[CacheKey] = set()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["SchemaDescriptorCache"]:
+        """Build a cache from ``LABS_SCHEMA_CACHE*`` variables, or ``None`` if disabled."""
+
+        if os.getenv("LABS_SCHEMA_CACHE", "1").strip().lower() in _DISABLED_VALUES:
+            return None
+        directory_raw = os.getenv("LABS_SCHEMA_CACHE_DIR", "").strip()
+        directory = Path(directory_raw).expanduser() if directory_raw else _default_directory()
+        return cls(
+            directory,
+            ttl=_env_seconds("LABS_SCHEMA_CACHE_TTL", _DEFAULT_TTL_SECONDS),
+            max_stale=_env_seconds("LABS_SCHEMA_CACHE_MAX_STALE", _DEFAULT_MAX_STALE_SECONDS),
+        )
+
+    def fetch(
+        self,
+        key: CacheKey,
+        loader: Callable[[], JsonDict],
+        *,
+        force: bool = False,
+    ) -> JsonDict:
+        """Return the descriptor for *key*, consulting *loader* when required."""
+
+        if not force:
+            entry = self._read(key)
+            if entry is not None:
+                age = self._clock() - float(entry.get("stored_at", 0.0))
+                if age <= self.ttl:
+                    return entry["descriptor"]
+                if age <= self.ttl + self.max_stale:
+                    self._schedule_refresh(key, loader)
+                    return entry["descriptor"]
+
+        descriptor = loader()
+        self.store(key, descriptor)
+        return descriptor
+
+    def store(self, key: CacheKey, descriptor: Mapping[str, Any]) -> None:
+        """Atomically persist *descriptor* under *key*."""
+
+        schema = descriptor.get("schema")
+        if not isinstance(schema, Mapping):
+            return
+        record: JsonDict = {
+            "format": _FORMAT_VERSION,
+            "key": list(key),
+            "stored_at": self._clock(),
+            "schema_id": descriptor.get("schema_id"),
+            "content_hash": schema_content_hash(schema),
+            "descriptor": descriptor,
+        }
+        if descriptor.get("source") == "mcp.core":
+            source_hash = _file_hash(descriptor.get("path"))
+            if source_hash is None:
+                return
+            record["source_hash"] = source_hash
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(record, handle, sort_keys=True)
+                os.replace(tmp_name, path)
+            except BaseException:
+                if os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+                raise
+        except (OSError, TypeError, ValueError) as exc:
+            _LOGGER.debug("Failed to persist schema descriptor %s: %s", key, exc)
+
+    def invalidate(self, key: CacheKey) -> None:
+        """Remove the persisted entry for *key* if present."""
+
+        try:
+            self._path_for(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:  # pragma: no cover - filesystem dependent
+            _LOGGER.debug("Failed to remove schema cache entry %s: %s", key, exc)
+
+    def _path_for(self, key: CacheKey) -> Path:
+        digest = hashlib.sha256(json.dumps(list(key)).encode("utf-8")).hexdigest()[:32]
+        return self.directory / f"{digest}.json"
+
+    def _read(self, key: CacheKey) -> Optional[JsonDict]:
+        path = self._path_for(key)
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                record = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            _LOGGER.debug("Discarding unreadable schema cache entry %s: %s", path, exc)
+            return None
+
+        if not self._is_valid(record, key):
+            _LOGGER.debug("Discarding invalid schema cache entry %s", path)
+            self.invalidate(key)
+            return None
+        return record
+
+    @staticmethod
+    def _is_valid(record: Any, key: CacheKey) -> bool:
+        if not isinstance(record, dict) or record.get("format") != _FORMAT_VERSION:
+            return False
+        if record.get("key") != list(key):
+            return False
+        descriptor = record.get("descriptor")
+        if not isinstance(descriptor, dict):
+            return False
+        schema = descriptor.get("schema")
+        if not isinstance(schema, dict):
+            return False
+        if record.get("schema_id") != descriptor.get("schema_id"):
+            return False
+        if "source_hash" in record and record["source_hash"] != _file_hash(descriptor.get("path")):
+            return False
+        return record.get("content_hash") == schema_content_hash(schema)
+
+    def _schedule_refresh(self, key: CacheKey, loader: Callable[[], JsonDict]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            thread = threading.Thread(
+                target=self._refresh,
+                args=(key, loader),
+                name="labs-schema-cache-refresh",
+                daemon=True,
+            )
+            self._threads = [item for item in self._threads if item.is_alive()]
+            self._threads.append(thread)
+        thread.start()
+
+    def wait_for_refreshes(self, timeout: Optional[float] = None) -> None:
+        """Block until pending background refreshes finish (or *timeout* elapses)."""
+
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(timeout)
+
+    def _refresh(self, key: CacheKey, loader: Callable[[], JsonDict]) -> None:
+        lock_handle = None
+        try:
+            lock_handle = self._acquire_refresh_lock(key)
+            if lock_handle is False:
+                return  # another process is already revalidating this entry
+            descriptor = loader()
+            previous = self._read(key)
+            schema = descriptor.get("schema")
+            if (
+                previous is not None
+                and isinstance(schema, Mapping)
+                and previous.get("schema_id") == descriptor.get("schema_id")
+                and previous.get("content_hash") == schema_content_hash(schema)
+            ):
+                # Content unchanged: keep the original descriptor, extend its lifetime.
+                descriptor = previous["descriptor"]
+            self.store(key, descriptor)
+        except Exception as exc:  # pragma: no cover - background refresh must not raise
+            _LOGGER.debug("Background schema refresh failed for %s: %s", key, exc)
+        finally:
+            if lock_handle not in (None, False):
+                lock_handle.close()
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _acquire_refresh_lock(self, key: CacheKey):
+        if fcntl is None:  # pragma: no cover - non-POSIX platforms
+            return None
+        lock_path = self._path_for(key).with_suffix(".lock")
+        try:
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(lock_path, "a+")
+        except OSError:
+            return None
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        return handle
+
+
+__all__ = ["SchemaDescriptorCache", "schema_content_hash"]
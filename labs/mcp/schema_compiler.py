@@ -0,0 +1,347 @@
+"""Compile JSON schemas into specialised Python validation functions.
+
+The generated code checks keywords in the same order as
+``jsonschema.Draft202012Validator.iter_errors`` and builds the same
+messages, so the first error it reports matches the first error the
+generic validator would raise (same path, same ``msg``). Schemas using an
+asserting keyword outside :data:`SUPPORTED_KEYWORDS` (``$ref``,
+combinators, ``patternProperties``...) are not compiled; callers fall back
+to ``jsonschema`` for them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import numbers
+import re
+import threading
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from jsonschema import Draft202012Validator
+from jsonschema._utils import equal as _equal
+from jsonschema._utils import uniq as _uniq
+
+ErrorPath = Tuple[Any, ...]
+FirstError = Optional[Tuple[ErrorPath, str]]
+
+SUPPORTED_KEYWORDS = frozenset(
+    {
+        "type",
+        "required",
+        "properties",
+        "additionalProperties",
+        "items",
+        "enum",
+        "const",
+        "minimum",
+        "maximum",
+        "exclusiveMinimum",
+        "exclusiveMaximum",
+        "minLength",
+        "maxLength",
+        "minItems",
+        "maxItems",
+        "minProperties",
+        "maxProperties",
+        "pattern",
+        "uniqueItems",
+    }
+)
+# Keywords jsonschema knows but never asserts with the default (no format checker) setup.
+_IGNORED_KEYWORDS = frozenset({"format"})
+
+_TYPE_CHECKS = {
+    "object": "isinstance(data, dict)",
+    "array": "isinstance(data, list)",
+    "string": "isinstance(data, str)",
+    "boolean": "isinstance(data, bool)",
+    "null": "data is None",
+    "integer": "(isinstance(data, int) and not isinstance(data, bool)"
+    " or isinstance(data, float) and data.is_integer())",
+    "number": "(isinstance(data, _Number) and not isinstance(data, bool))",
+}
+_IS_NUMBER = _TYPE_CHECKS["number"]
+
+
+class UnsupportedSchemaError(ValueError):
+    """Raised when a schema uses keywords the compiler does not handle."""
+
+
+class CompiledSchema:
+    """A schema compiled to Python; call :meth:`first_error` per instance."""
+
+    __slots__ = ("schema_id", "digest", "source", "_check")
+
+    def __init__(self, schema_id: str, digest: str, source: str, check: Optional[Callable[[Any], FirstError]]) -> None:
+        self.schema_id = schema_id
+        self.digest = digest
+        self.source = source
+        self._check = check
+
+    def first_error(self, instance: Any) -> FirstError:
+        """Return ``(path, message)`` of the first violation, or ``None``."""
+
+        if self._check is None:
+            return None
+        return self._check(instance)
+
+    def is_valid(self, instance: Any) -> bool:
+        return self.first_error(instance) is None
+
+
+class _Generator:
+    def __init__(self) -> None:
+        self.namespace: Dict[str, Any] = {
+            "_Number": numbers.Number,
+            "_equal": _equal,
+            "_uniq": _uniq,
+        }
+        self.functions: List[str] = []
+        self._false_checks: set = set()
+
+    def constant(self, value: Any) -> str:
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def compile(self, schema: Any) -> Optional[str]:
+        """Emit a checker for *schema*; return its name or ``None`` if always valid."""
+
+        if schema is True:
+            return None
+        if schema is False:
+            name = self._function(['return ((), "False schema does not allow " + repr(data))'])
+            self._false_checks.add(name)
+            return name
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"schema must be an object or boolean, got {type(schema).__name__}")
+
+        body: List[str] = []
+        for keyword, value in schema.items():
+            if keyword in SUPPORTED_KEYWORDS:
+                body.extend(getattr(self, f"_kw_{keyword}")(value, schema))
+            elif keyword in Draft202012Validator.VALIDATORS and keyword not in _IGNORED_KEYWORDS:
+                raise UnsupportedSchemaError(f"unsupported keyword: {keyword}")
+        if not body:
+            return None
+        return self._function(body)
+
+    def _function(self, body: List[str]) -> str:
+        name = f"_check_{len(self.functions)}"
+        lines = [f"def {name}(data):"]
+        lines.extend("    " + line for line in body)
+        lines.append("    return None")
+        self.functions.append("\n".join(lines))
+        return name
+
+    def _descend(self, check: str, value: str, key: str, indent: str) -> List[str]:
+        if check in self._false_checks:
+            # jsonschema reports a ``false`` subschema without the descended key.
+            return [f"{indent}return {check}({value})"]
+        return [
+            f"{indent}_e = {check}({value})",
+            f"{indent}if _e is not None:",
+            f"{indent}    return (({key},) + _e[0], _e[1])",
+        ]
+
+    def _kw_type(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        types = value if isinstance(value, list) else [value]
+        checks = []
+        for name in types:
+            if name not in _TYPE_CHECKS:
+                raise UnsupportedSchemaError(f"unsupported type: {name!r}")
+            checks.append(_TYPE_CHECKS[name])
+        suffix = " is not of type " + ", ".join(repr(name) for name in types)
+        return [f"if not ({' or '.join(checks) or 'False'}):", f"    return ((), repr(data) + {suffix!r})"]
+
+    def _kw_required(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        if not isinstance(value, list):
+            raise UnsupportedSchemaError("required must be an array")
+        lines = ["if isinstance(data, dict):"]
+        for name in value:
+            lines.append(f"    if {name!r} not in data:")
+            lines.append(f"        return ((), {repr(name) + ' is a required property'!r})")
+        return lines if value else []
+
+    def _kw_properties(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        if not isinstance(value, dict):
+            raise UnsupportedSchemaError("properties must be an object")
+        lines: List[str] = []
+        for name, subschema in value.items():
+            check = self.compile(subschema)
+            if check is None:
+                continue
+            lines.append(f"    if {name!r} in data:")
+            lines.extend(self._descend(check, f"data[{name!r}]", repr(name), "        "))
+        return ["if isinstance(data, dict):", *lines] if lines else []
+
+    def _kw_additionalProperties(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        if "patternProperties" in schema:
+            raise UnsupportedSchemaError("patternProperties is not supported")
+        known = self.constant(frozenset(schema.get("properties", {})))
+        if value is False:
+            return [
+                "if isinstance(data, dict):",
+                f"    _extras = sorted(set(_k for _k in data if _k not in {known}), key=str)",
+                "    if _extras:",
+                "        _verb = 'was' if len(_extras) == 1 else 'were'",
+                "        return ((), 'Additional properties are not allowed (%s %s unexpected)'"
+                " % (', '.join(repr(_k) for _k in _extras), _verb))",
+            ]
+        check = self.compile(value) if isinstance(value, dict) else None
+        if check is None:
+            return []
+        return [
+            "if isinstance(data, dict):",
+            f"    for _k in set(_k for _k in data if _k not in {known}):",
+            *self._descend(check, "data[_k]", "_k", "        "),
+        ]
+
+    def _kw_items(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        if "prefixItems" in schema:
+            raise UnsupportedSchemaError("prefixItems is not supported")
+        if value is False:
+            return [
+                "if isinstance(data, list) and data:",
+                "    _rest = data if len(data) != 1 else data[0]",
+                "    return ((), 'Expected at most 0 items but found %d extra: %r' % (len(data), _rest))",
+            ]
+        check = self.compile(value)
+        if check is None:
+            return []
+        return [
+            "if isinstance(data, list):",
+            "    for _i, _item in enumerate(data):",
+            *self._descend(check, "_item", "_i", "        "),
+        ]
+
+    def _kw_enum(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        suffix = f" is not one of {value!r}"
+        if isinstance(value, list) and value and all(isinstance(each, str) for each in value):
+            options = self.constant(frozenset(value))
+            condition = f"not (isinstance(data, str) and data in {options})"
+        else:
+            options = self.constant(value)
+            condition = f"all(not _equal(_each, data) for _each in {options})"
+        return [f"if {condition}:", f"    return ((), repr(data) + {suffix!r})"]
+
+    def _kw_const(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        const = self.constant(value)
+        return [f"if not _equal(data, {const}):", f"    return ((), {f'{value!r} was expected'!r})"]
+
+    def _bound(self, guard: str, comparison: str, suffix: str) -> List[str]:
+        return [f"if {guard} and {comparison}:", f"    return ((), repr(data) + {suffix!r})"]
+
+    def _kw_minimum(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        return self._bound(_IS_NUMBER, f"data < {self.constant(value)}", f" is less than the minimum of {value!r}")
+
+    def _kw_maximum(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        return self._bound(_IS_NUMBER, f"data > {self.constant(value)}", f" is greater than the maximum of {value!r}")
+
+    def _kw_exclusiveMinimum(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        suffix = f" is less than or equal to the minimum of {value!r}"
+        return self._bound(_IS_NUMBER, f"data <= {self.constant(value)}", suffix)
+
+    def _kw_exclusiveMaximum(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        suffix = f" is greater than or equal to the maximum of {value!r}"
+        return self._bound(_IS_NUMBER, f"data >= {self.constant(value)}", suffix)
+
+    def _length(self, guard: str, value: Any, *, minimum: bool, short: str, long: str) -> List[str]:
+        limit = self.constant(value)
+        if minimum:
+            suffix = " should be non-empty" if value == 1 else f" {short}"
+            return self._bound(guard, f"len(data) < {limit}", suffix)
+        suffix = " is expected to be empty" if value == 0 else f" {long}"
+        return self._bound(guard, f"len(data) > {limit}", suffix)
+
+    def _kw_minLength(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        return self._length("isinstance(data, str)", value, minimum=True, short="is too short", long="")
+
+    def _kw_maxLength(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        return self._length("isinstance(data, str)", value, minimum=False, short="", long="is too long")
+
+    def _kw_minItems(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        return self._length("isinstance(data, list)", value, minimum=True, short="is too short", long="")
+
+    def _kw_maxItems(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        return self._length("isinstance(data, list)", value, minimum=False, short="", long="is too long")
+
+    def _kw_minProperties(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        return self._length(
+            "isinstance(data, dict)", value, minimum=True, short="does not have enough properties", long=""
+        )
+
+    def _kw_maxProperties(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        return self._length(
+            "isinstance(data, dict)", value, minimum=False, short="", long="has too many properties"
+        )
+
+    def _kw_pattern(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        regex = self.constant(re.compile(value))
+        return self._bound(
+            "isinstance(data, str)", f"not {regex}.search(data)", f" does not match {value!r}"
+        )
+
+    def _kw_uniqueItems(self, value: Any, schema: Mapping[str, Any]) -> List[str]:
+        if not value:
+            return []
+        return self._bound("isinstance(data, list)", "not _uniq(data)", " has non-unique elements")
+
+
+def schema_digest(schema: Mapping[str, Any]) -> str:
+    """Return the SHA-256 of *schema*'s canonical JSON encoding."""
+
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def compile_schema(schema: Mapping[str, Any]) -> CompiledSchema:
+    """Compile *schema*; raise :class:`UnsupportedSchemaError` if it cannot be."""
+
+    generator = _Generator()
+    root = generator.compile(schema)
+    source = "\n\n".join(generator.functions)
+    namespace = dict(generator.namespace)
+    exec(compile(source or "pass", "<labs-schema>", "exec"), namespace)
+    schema_id = schema.get("$id", "") if isinstance(schema, dict) else ""
+    return CompiledSchema(schema_id, schema_digest(schema), source, namespace[root] if root else None)
+
+
+_COMPILED: Dict[Tuple[str, str], Optional[CompiledSchema]] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+def get_compiled(schema: Mapping[str, Any]) -> Optional[CompiledSchema]:
+    """Return the cached compilation of *schema* (keyed by ``$id`` and content hash).
+
+    ``None`` means the schema is unsupported and callers should use
+    ``jsonschema`` instead; that outcome is cached too.
+    """
+
+    key = (str(schema.get("$id", "")), schema_digest(schema))
+    with _COMPILED_LOCK:
+        if key in _COMPILED:
+            return _COMPILED[key]
+    try:
+        compiled: Optional[CompiledSchema] = compile_schema(schema)
+    except UnsupportedSchemaError:
+        compiled = None
+    with _COMPILED_LOCK:
+        return _COMPILED.setdefault(key, compiled)
+
+
+def clear_cache() -> None:
+    with _COMPILED_LOCK:
+        _COMPILED.clear()
+
+
+__all__ = [
+    "SUPPORTED_KEYWORDS",
+    "CompiledSchema",
+    "UnsupportedSchemaError",
+    "clear_cache",
+    "compile_schema",
+    "get_compiled",
+    "schema_digest",
+]
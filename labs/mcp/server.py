@@ -0,0 +1,433 @@
+"""Concurrent newline-delimited JSON-RPC server shared by the MCP adapters."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import queue
+import selectors
+import socket
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from mcp import core as mcp_core
+
+from labs.mcp.jsonrpc import method_not_found
+from labs.mcp.validate import validate_asset, validate_many, warm_up_validators
+from labs.transport import (
+    FRAMING_LENGTH,
+    FRAMING_METHOD,
+    FRAMING_NEWLINE,
+    MAX_PAYLOAD_BYTES,
+    MIN_CHUNK,
+    Codec,
+    InvalidPayloadError,
+    PayloadTooLargeError,
+    decode_payload,
+    encode_frame,
+    select_codec,
+    split_frame,
+)
+
+JsonDict = Dict[str, Any]
+Handler = Callable[[JsonDict], JsonDict]
+
+_LOGGER = logging.getLogger("labs.mcp.server")
+
+PARSE_ERROR = -32700
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+def _error(request_id: Any, code: int, message: str) -> JsonDict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def dispatch(request: Mapping[str, Any]) -> JsonDict:
+    """Answer one MCP request with the local schema validator.
+
+    JSON-RPC 2.0 requests support ``validate``, ``validate_many`` and
+    ``get_schema``. Legacy ``{"asset": {...}}`` payloads get the bare
+    validation result.
+    """
+
+    if request.get("jsonrpc") != "2.0":
+        asset = request.get("asset")
+        if not isinstance(asset, dict):
+            return {"ok": False, "reason": "invalid_request", "errors": [{"path": "/asset", "msg": "asset object required"}]}
+        return validate_asset(asset)
+
+    request_id = request.get("id")
+    method = request.get("method")
+    params = request.get("params")
+    if not isinstance(params, dict):
+        params = {}
+
+    if method == "validate":
+        asset = params.get("asset")
+        if not isinstance(asset, dict):
+            return _error(request_id, INVALID_PARAMS, "params.asset must be an object")
+        result = validate_asset(asset)
+    elif method == "validate_many":
+        assets = params.get("assets")
+        if not isinstance(assets, list) or not all(isinstance(item, dict) for item in assets):
+            return _error(request_id, INVALID_PARAMS, "params.assets must be a list of objects")
+        result = validate_many(assets)
+    elif method == "get_schema":
+        name = params.get("name")
+        if not isinstance(name, str) or not name.strip():
+            return _error(request_id, INVALID_PARAMS, "params.name must be a non-empty string")
+        try:
+            result = mcp_core.get_schema(name, params.get("version"), resolution=params.get("resolution"))
+        except ValueError as exc:
+            return _error(request_id, INVALID_PARAMS, str(exc))
+    else:
+        return method_not_found(request)
+
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+class ProcessPoolDispatcher:
+    """Callable handler that runs :func:`dispatch` in a pool of processes."""
+
+    def __init__(self, processes: int) -> None:
+        if processes <= 0:
+            raise ValueError("processes must be positive")
+        # Spawned (not forked) workers: the server is multi-threaded by the time they start.
+        # Each worker compiles the bundled schemas once on start-up.
+        self._pool = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warm_up_validators,
+        )
+
+    def __call__(self, request: JsonDict) -> JsonDict:
+        return self._pool.submit(dispatch, request).result()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+class _Connection:
+    """Per-client buffers; responses are flushed in request order."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.framing = FRAMING_NEWLINE
+        self.codec: Optional[Codec] = None
+        self.chunk = MIN_CHUNK
+        self.inbuf = bytearray()
+        self.start = 0
+        self.scanned = 0
+        self.outbuf = bytearray()
+        self.next_seq = 0
+        self.send_seq = 0
+        self.completed: Dict[int, bytes] = {}
+        self.peer_closed = False
+        self.events = selectors.EVENT_READ
+
+    def next_frame(self) -> Optional[bytes]:
+        """Pop the next complete frame from ``inbuf`` in the current framing."""
+
+        frame, offset = split_frame(self.inbuf, self.start, framing=self.framing, scanned=self.scanned)
+        if frame is None:
+            self.scanned = offset
+        else:
+            self.start = self.scanned = offset
+        return frame
+
+    def compact(self) -> None:
+        if self.start:
+            del self.inbuf[: self.start]
+            self.scanned -= self.start
+            self.start = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self.next_seq - self.send_seq
+
+    @property
+    def idle(self) -> bool:
+        return self.in_flight == 0 and not self.outbuf
+
+
+class StreamMCPServer:
+    """Serve many clients on a listening stream socket.
+
+    A selector loop accepts connections and frames newline-delimited
+    requests; handlers run on a thread pool, so slow validations on one
+    connection never block another. Connections stay open across requests
+    and a single client may pipeline several. :meth:`shutdown` stops
+    accepting, lets in-flight requests finish, then closes every connection.
+    """
+
+    def __init__(
+        self,
+        listener: socket.socket,
+        *,
+        handler: Optional[Handler] = None,
+        max_workers: Optional[int] = None,
+        on_close: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._listener = listener
+        self._listener.setblocking(False)
+        self._handler = handler or dispatch
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="labs-mcp-server")
+        self._on_close = on_close
+        self._selector = selectors.DefaultSelector()
+        self._completions: "queue.SimpleQueue[tuple[_Connection, int, bytes]]" = queue.SimpleQueue()
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self._connections: Dict[int, _Connection] = {}
+        self._stopping = threading.Event()
+        self._stopped = threading.Event()
+        self._deadline: Optional[float] = None
+        self._counters = {"connections": 0, "requests": 0}
+
+    @property
+    def address(self) -> Any:
+        return self._listener.getsockname()
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._counters, "active": len(self._connections)}
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        selector = self._selector
+        selector.register(self._listener, selectors.EVENT_READ, "listener")
+        selector.register(self._wake_reader, selectors.EVENT_READ, "wake")
+        try:
+            while True:
+                for key, mask in selector.select(timeout=poll_interval):
+                    if key.data == "listener":
+                        self._accept()
+                    elif key.data == "wake":
+                        self._drain_wakeups()
+                    else:
+                        connection: _Connection = key.data
+                        if mask & selectors.EVENT_READ:
+                            self._read(connection)
+                        if mask & selectors.EVENT_WRITE and connection.sock.fileno() != -1:
+                            self._write(connection)
+                self._drain_completions()
+                if self._stopping.is_set() and self._finish_stopping():
+                    break
+        finally:
+            self._teardown()
+
+    def request_shutdown(self, timeout: float = 5.0) -> None:
+        """Ask the loop to stop without waiting (safe from signal handlers)."""
+
+        self._deadline = time.monotonic() + timeout
+        self._stopping.set()
+        self._wake()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop serving; in-flight requests get up to *timeout* seconds."""
+
+        self.request_shutdown(timeout)
+        self._stopped.wait(timeout + 1.0)
+
+    def _wake(self) -> None:
+        try:
+            self._wake_writer.send(b"\0")
+        except OSError:  # pragma: no cover - wake pipe already closed
+            pass
+
+    def _drain_wakeups(self) -> None:
+        try:
+            while self._wake_reader.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    def _accept(self) -> None:
+        if self._stopping.is_set():
+            return
+        while True:
+            try:
+                sock, _ = self._listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            sock.setblocking(False)
+            connection = _Connection(sock)
+            self._connections[sock.fileno()] = connection
+            self._selector.register(sock, selectors.EVENT_READ, connection)
+            self._counters["connections"] += 1
+
+    def _read(self, connection: _Connection) -> None:
+        try:
+            chunk = connection.sock.recv(connection.chunk)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._close(connection)
+            return
+        if not chunk:
+            connection.peer_closed = True
+            self._update_interest(connection)
+            return
+        if len(chunk) == connection.chunk and connection.chunk < MAX_PAYLOAD_BYTES:
+            connection.chunk *= 2
+        connection.inbuf.extend(chunk)
+        try:
+            while True:
+                frame = connection.next_frame()
+                if frame is None:
+                    break
+                if connection.framing == FRAMING_NEWLINE and not frame.strip():
+                    continue
+                if not self._negotiate(connection, frame):
+                    self._submit(connection, frame)
+        except PayloadTooLargeError as exc:
+            _LOGGER.warning("Closing MCP connection: %s", exc)
+            self._close(connection)
+            return
+        connection.compact()
+
+    def _negotiate(self, connection: _Connection, frame: bytes) -> bool:
+        """Handle a ``labs.framing`` handshake inline; return False for other frames.
+
+        The reply is newline-framed JSON; frames after the handshake (even
+        ones already buffered) are parsed with the negotiated framing and the
+        first codec in ``params.codecs`` that this server supports.
+        """
+
+        if connection.framing != FRAMING_NEWLINE or len(frame) > 512 or FRAMING_METHOD.encode() not in frame:
+            return False
+        try:
+            request = decode_payload(frame)
+        except (PayloadTooLargeError, InvalidPayloadError):
+            return False
+        if request.get("method") != FRAMING_METHOD:
+            return False
+        params = request.get("params") if isinstance(request.get("params"), dict) else {}
+        requested = params.get("framing")
+        if requested not in {FRAMING_NEWLINE, FRAMING_LENGTH}:
+            response = _error(request.get("id"), INVALID_PARAMS, f"unsupported framing: {requested}")
+        else:
+            preferences = params.get("codecs") if isinstance(params.get("codecs"), list) else []
+            codec = select_codec(preferences, requested)
+            result = {"framing": requested, "codec": codec.name}
+            response = {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+        seq = connection.next_seq
+        connection.next_seq += 1
+        self._completions.put((connection, seq, encode_frame(response)))
+        if "result" in response:
+            connection.framing = requested
+            connection.codec = codec
+        return True
+
+    def _submit(self, connection: _Connection, frame: bytes) -> None:
+        seq = connection.next_seq
+        connection.next_seq += 1
+        self._counters["requests"] += 1
+        self._executor.submit(self._run, connection, seq, frame, connection.framing, connection.codec)
+
+    def _run(
+        self,
+        connection: _Connection,
+        seq: int,
+        frame: bytes,
+        framing: str,
+        codec: Optional[Codec] = None,
+    ) -> None:
+        try:
+            request = decode_payload(frame, codec)
+        except (PayloadTooLargeError, InvalidPayloadError) as exc:
+            response: JsonDict = _error(None, PARSE_ERROR, str(exc))
+        else:
+            try:
+                response = self._handler(request)
+            except Exception as exc:  # pragma: no cover - handler bug surfaced to client
+                _LOGGER.exception("MCP handler failed")
+                response = _error(request.get("id"), INTERNAL_ERROR, str(exc))
+        try:
+            data = encode_frame(response, framing, codec)
+        except PayloadTooLargeError as exc:
+            data = encode_frame(_error(response.get("id"), INTERNAL_ERROR, str(exc)), framing, codec)
+        self._completions.put((connection, seq, data))
+        self._wake()
+
+    def _drain_completions(self) -> None:
+        touched = set()
+        while True:
+            try:
+                connection, seq, data = self._completions.get_nowait()
+            except queue.Empty:
+                break
+            connection.completed[seq] = data
+            while connection.send_seq in connection.completed:
+                connection.outbuf.extend(connection.completed.pop(connection.send_seq))
+                connection.send_seq += 1
+            touched.add(connection)
+        for connection in touched:
+            if connection.sock.fileno() != -1:
+                self._write(connection)
+
+    def _write(self, connection: _Connection) -> None:
+        if connection.outbuf:
+            try:
+                sent = connection.sock.send(connection.outbuf)
+            except (BlockingIOError, InterruptedError):
+                sent = 0
+            except OSError:
+                self._close(connection)
+                return
+            del connection.outbuf[:sent]
+        self._update_interest(connection)
+
+    def _update_interest(self, connection: _Connection) -> None:
+        if connection.peer_closed and connection.idle:
+            self._close(connection)
+            return
+        events = 0 if connection.peer_closed else selectors.EVENT_READ
+        if connection.outbuf:
+            events |= selectors.EVENT_WRITE
+        if events == connection.events:
+            return
+        if not connection.events:
+            self._selector.register(connection.sock, events, connection)
+        elif not events:
+            self._selector.unregister(connection.sock)
+        else:
+            self._selector.modify(connection.sock, events, connection)
+        connection.events = events
+
+    def _close(self, connection: _Connection) -> None:
+        sock = connection.sock
+        if sock.fileno() == -1:
+            return
+        self._connections.pop(sock.fileno(), None)
+        if connection.events:
+            self._selector.unregister(sock)
+            connection.events = 0
+        sock.close()
+
+    def _finish_stopping(self) -> bool:
+        if self._listener.fileno() != -1:
+            self._selector.unregister(self._listener)
+            self._listener.close()
+        for connection in list(self._connections.values()):
+            if connection.idle:
+                self._close(connection)
+        expired = self._deadline is not None and time.monotonic() >= self._deadline
+        return not self._connections or expired
+
+    def _teardown(self) -> None:
+        for connection in list(self._connections.values()):
+            self._close(connection)
+        if self._listener.fileno() != -1:
+            self._listener.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._selector.close()
+        self._wake_reader.close()
+        self._wake_writer.close()
+        if self._on_close is not None:
+            self._on_close()
+        self._stopped.set()
+
+
+__all__ = ["ProcessPoolDispatcher", "StreamMCPServer", "dispatch"]
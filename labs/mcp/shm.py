@@ -0,0 +1,490 @@
+"""Shared-memory ring-buffer transport for a co-located MCP adapter.
+
+A client creates a file-backed ``mmap`` region holding two single-producer,
+single-consumer rings (requests and responses) and hands its path to the
+server over a Unix domain control socket (one newline-framed ``labs.shm``
+handshake). From then on message bodies travel only through the shared
+rings; the control socket carries 1-byte doorbells that wake the peer, and
+the peer drains every message available per wake-up, so bursts cost one
+syscall rather than one per message. The backing file is unlinked as soon
+as both sides have mapped it.
+
+Each ring starts with two little-endian ``u64`` counters (total bytes
+written, total bytes consumed), each updated only by its owning side,
+followed by ``capacity`` bytes of data holding ``u32`` length-prefixed
+frames that may wrap around the end.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from labs.mcp.exceptions import MCPUnavailableError
+from labs.mcp.jsonrpc import unwrap_batch_items, unwrap_response, validate_many_request, validate_request
+from labs.transport import (
+    MAX_PAYLOAD_BYTES,
+    InvalidPayloadError,
+    MessageReader,
+    PayloadTooLargeError,
+    decode_payload,
+    encode_frame,
+    iter_payload_batches,
+    write_message,
+)
+
+JsonDict = Dict[str, Any]
+Handler = Callable[[JsonDict], JsonDict]
+
+SHM_METHOD = "labs.shm"
+DEFAULT_CAPACITY = 4 * MAX_PAYLOAD_BYTES
+
+_COUNTERS = struct.Struct("<QQ")
+_U64 = struct.Struct("<Q")
+_FRAME_HEADER = struct.Struct("<I")
+_DOORBELL = b"\x01"
+_FULL_RING_POLL = 0.0005
+
+_LOGGER = logging.getLogger("labs.mcp.shm")
+
+
+class _Ring:
+    """One SPSC ring laid out in a shared buffer."""
+
+    def __init__(self, buffer: memoryview, capacity: int) -> None:
+        self._counters = buffer[: _COUNTERS.size]
+        self._data = buffer[_COUNTERS.size : _COUNTERS.size + capacity]
+        self.capacity = capacity
+
+    @staticmethod
+    def size(capacity: int) -> int:
+        return _COUNTERS.size + capacity
+
+    def release(self) -> None:
+        self._counters.release()
+        self._data.release()
+
+    def put(self, body: bytes) -> bool:
+        """Append *body* as one frame; return False when the ring lacks room."""
+
+        written, consumed = _COUNTERS.unpack_from(self._counters)
+        needed = _FRAME_HEADER.size + len(body)
+        if needed > self.capacity - (written - consumed):
+            return False
+        self._write(written, _FRAME_HEADER.pack(len(body)))
+        self._write(written + _FRAME_HEADER.size, body)
+        _U64.pack_into(self._counters, 0, written + needed)
+        return True
+
+    def drain(self, consume: Callable[[memoryview], None]) -> int:
+        """Pass every available frame body to *consume*; return the frame count.
+
+        Contiguous bodies are handed over as views into the shared buffer;
+        the space is only released once *consume* returns.
+        """
+
+        count = 0
+        while True:
+            written, consumed = _COUNTERS.unpack_from(self._counters)
+            if written == consumed:
+                return count
+            (length,) = _FRAME_HEADER.unpack(self._read(consumed, _FRAME_HEADER.size))
+            if length > MAX_PAYLOAD_BYTES:
+                raise PayloadTooLargeError(
+                    f"payload size {length} bytes exceeds cap of {MAX_PAYLOAD_BYTES} bytes"
+                )
+            start = (consumed + _FRAME_HEADER.size) % self.capacity
+            if start + length <= self.capacity:
+                body = self._data[start : start + length]
+                try:
+                    consume(body)
+                finally:
+                    body.release()
+            else:
+                consume(memoryview(self._read(consumed + _FRAME_HEADER.size, length)))
+            _U64.pack_into(self._counters, _U64.size, consumed + _FRAME_HEADER.size + length)
+            count += 1
+
+    def _write(self, position: int, data: bytes) -> None:
+        offset = position % self.capacity
+        first = min(len(data), self.capacity - offset)
+        self._data[offset : offset + first] = data[:first]
+        if first < len(data):
+            self._data[: len(data) - first] = data[first:]
+
+    def _read(self, position: int, length: int) -> bytes:
+        offset = position % self.capacity
+        first = min(length, self.capacity - offset)
+        head = bytes(self._data[offset : offset + first])
+        if first == length:
+            return head
+        return head + bytes(self._data[: length - first])
+
+
+class _Region:
+    """The mapped file holding the request ring followed by the response ring."""
+
+    def __init__(self, fd: int, capacity: int) -> None:
+        self.capacity = capacity
+        self._map = mmap.mmap(fd, 2 * _Ring.size(capacity))
+        view = memoryview(self._map)
+        self.requests = _Ring(view[: _Ring.size(capacity)], capacity)
+        self.responses = _Ring(view[_Ring.size(capacity) :], capacity)
+        view.release()
+
+    @classmethod
+    def create(cls, capacity: int) -> "tuple[_Region, str]":
+        directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        fd, path = tempfile.mkstemp(prefix="labs-mcp-", suffix=".shm", dir=directory)
+        try:
+            os.ftruncate(fd, 2 * _Ring.size(capacity))
+            return cls(fd, capacity), path
+        except BaseException:
+            os.unlink(path)
+            raise
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def attach(cls, path: str, capacity: int) -> "_Region":
+        fd = os.open(path, os.O_RDWR)
+        try:
+            if os.fstat(fd).st_size != 2 * _Ring.size(capacity):
+                raise ValueError("shared memory region size does not match capacity")
+            return cls(fd, capacity)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        self.requests.release()
+        self.responses.release()
+        try:
+            self._map.close()
+        except BufferError:  # pragma: no cover - a consumer still holds a view
+            pass
+
+
+def _put_with_wait(ring: _Ring, body: bytes, deadline: float) -> None:
+    while not ring.put(body):
+        if time.monotonic() >= deadline:
+            raise TimeoutError("shared memory ring is full")
+        time.sleep(_FULL_RING_POLL)
+
+
+def _ring_bell(sock: socket.socket) -> None:
+    try:
+        sock.send(_DOORBELL, socket.MSG_DONTWAIT)
+    except BlockingIOError:
+        pass  # the peer already has unread doorbells and will drain the ring
+
+
+class SharedMemoryMCPValidator:
+    """Validate assets through a shared-memory ring with a co-located server.
+
+    *path* is the server's Unix control socket. Requests are pipelined: any
+    number of threads may have requests in flight and responses are routed
+    back by JSON-RPC ``id``. A lost connection is re-established on the next
+    request.
+    """
+
+    def __init__(self, path: str, *, timeout: float = 10.0, capacity: int = DEFAULT_CAPACITY) -> None:
+        if not path:
+            raise ValueError("path must be a non-empty string")
+        if capacity < _FRAME_HEADER.size + MAX_PAYLOAD_BYTES:
+            raise ValueError("capacity must hold at least one maximum-size payload")
+        self._path = path
+        self._timeout = timeout
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending: Dict[Any, List[Any]] = {}
+        self._sock: Optional[socket.socket] = None
+        self._region: Optional[_Region] = None
+        self.connects = 0
+
+    def validate(self, asset: Dict[str, Any]) -> Dict[str, Any]:
+        """Send *asset* to the MCP server and return the validation payload."""
+
+        return unwrap_response(self._round_trip(validate_request(asset)))
+
+    def validate_many(
+        self,
+        assets: Sequence[Mapping[str, Any]],
+        *,
+        batch_limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Validate *assets* via ``validate_many``, one ring message per chunk."""
+
+        results: List[Dict[str, Any]] = []
+        for chunk in iter_payload_batches(assets, max_items=batch_limit):
+            results.extend(unwrap_batch_items(self._round_trip(validate_many_request(chunk)), len(chunk)))
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            sock, self._sock, self._region = self._sock, None, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+    def _round_trip(self, payload: JsonDict) -> JsonDict:
+        try:
+            body = encode_frame(payload)[:-1]
+        except PayloadTooLargeError as exc:
+            raise MCPUnavailableError(f"MCP request payload too large: {exc}") from exc
+        sock, region = self._connect()
+        done = threading.Event()
+        slot: List[Any] = [done, None]
+        with self._lock:
+            self._pending[payload["id"]] = slot
+        try:
+            with self._write_lock:
+                _put_with_wait(region.requests, body, time.monotonic() + self._timeout)
+                _ring_bell(sock)
+        except (OSError, TimeoutError) as exc:
+            with self._lock:
+                self._pending.pop(payload["id"], None)
+            raise MCPUnavailableError(f"MCP shared memory error: {exc}") from exc
+        if not done.wait(self._timeout):
+            with self._lock:
+                self._pending.pop(payload["id"], None)
+            raise MCPUnavailableError("MCP shared memory error: timed out")
+        result = slot[1]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def _connect(self) -> "tuple[socket.socket, _Region]":
+        with self._lock:
+            if self._sock is not None and self._region is not None:
+                return self._sock, self._region
+            region, shm_path = _Region.create(self._capacity)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.settimeout(self._timeout)
+                sock.connect(self._path)
+                write_message(
+                    sock,
+                    {
+                        "jsonrpc": "2.0",
+                        "id": SHM_METHOD,
+                        "method": SHM_METHOD,
+                        "params": {"path": shm_path, "capacity": self._capacity},
+                    },
+                )
+                message = MessageReader(sock).read()
+                reply = decode_payload(message) if message is not None else {}
+                if not isinstance(reply.get("result"), dict):
+                    raise ConnectionError(f"shared memory handshake rejected: {reply.get('error')}")
+                sock.settimeout(None)
+            except (OSError, PayloadTooLargeError, InvalidPayloadError) as exc:
+                sock.close()
+                region.close()
+                raise MCPUnavailableError(f"MCP shared memory unavailable: {exc}") from exc
+            finally:
+                os.unlink(shm_path)
+            self._sock, self._region = sock, region
+            self.connects += 1
+            threading.Thread(
+                target=self._read_loop,
+                args=(sock, region),
+                name="labs-mcp-shm",
+                daemon=True,
+            ).start()
+            return sock, region
+
+    def _read_loop(self, sock: socket.socket, region: _Region) -> None:
+        error: BaseException = MCPUnavailableError("MCP shared memory error: server closed the connection")
+        try:
+            while sock.recv(4096):
+                region.responses.drain(self._deliver)
+        except PayloadTooLargeError as exc:
+            error = MCPUnavailableError(f"Invalid MCP response: {exc}")
+        except OSError:
+            pass
+        with self._lock:
+            if self._sock is sock:
+                self._sock, self._region = None, None
+            pending, self._pending = self._pending, {}
+        sock.close()
+        for slot in pending.values():
+            slot[1] = error
+            slot[0].set()
+
+    def _deliver(self, body: memoryview) -> None:
+        try:
+            response: Any = decode_payload(body)
+        except (PayloadTooLargeError, InvalidPayloadError) as exc:
+            _LOGGER.warning("Discarding invalid MCP shared memory response: %s", exc)
+            return
+        with self._lock:
+            slot = self._pending.pop(response.get("id"), None)
+        if slot is not None:
+            slot[1] = response
+            slot[0].set()
+
+
+class SharedMemoryMCPServer:
+    """Serve MCP requests to co-located clients over shared-memory rings.
+
+    Clients connect to the Unix control socket at *path*; each connection
+    gets a thread that drains its request ring on every doorbell and hands
+    requests to a shared worker pool. Responses are written to the
+    client's response ring as they complete.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        handler: Handler,
+        max_workers: Optional[int] = None,
+        backlog: int = 128,
+    ) -> None:
+        if not path:
+            raise ValueError("path must be a non-empty string")
+        if os.path.exists(path):
+            os.unlink(path)
+        self._path = path
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._listener.bind(path)
+            self._listener.listen(backlog)
+        except OSError:
+            self._listener.close()
+            raise
+        self._handler = handler
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="labs-mcp-shm")
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._clients: List[socket.socket] = []
+        self._counters = {"connections": 0, "requests": 0}
+
+    @property
+    def address(self) -> str:
+        return self._path
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        self._listener.settimeout(poll_interval)
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn, _ = self._listener.accept()
+                except socket.timeout:
+                    continue
+                except OSError:
+                    if self._stop.is_set():
+                        break
+                    raise
+                conn.settimeout(None)
+                threading.Thread(target=self._serve_client, args=(conn,), daemon=True).start()
+        finally:
+            self._teardown()
+
+    def request_shutdown(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        self.request_shutdown(timeout)
+        with self._lock:
+            clients = list(self._clients)
+        for conn in clients:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _teardown(self) -> None:
+        self._listener.close()
+        self._executor.shutdown(wait=True)
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+    def _serve_client(self, conn: socket.socket) -> None:
+        with self._lock:
+            self._clients.append(conn)
+            self._counters["connections"] += 1
+        region: Optional[_Region] = None
+        try:
+            region = self._handshake(conn)
+            if region is None:
+                return
+            write_lock = threading.Lock()
+
+            def _submit(body: memoryview) -> None:
+                with self._lock:
+                    self._counters["requests"] += 1
+                self._executor.submit(self._run, conn, region, write_lock, bytes(body))
+
+            while conn.recv(4096):
+                region.requests.drain(_submit)
+        except (OSError, PayloadTooLargeError) as exc:
+            _LOGGER.debug("Closing MCP shared memory client: %s", exc)
+        finally:
+            with self._lock:
+                self._clients.remove(conn)
+            conn.close()
+
+    def _handshake(self, conn: socket.socket) -> Optional[_Region]:
+        message = MessageReader(conn).read()
+        if message is None:
+            return None
+        request = decode_payload(message)
+        params = request.get("params") if isinstance(request.get("params"), dict) else {}
+        try:
+            if request.get("method") != SHM_METHOD:
+                raise ValueError(f"expected {SHM_METHOD} handshake")
+            capacity = int(params["capacity"])
+            region = _Region.attach(str(params["path"]), capacity)
+        except (KeyError, TypeError, ValueError, OSError) as exc:
+            write_message(
+                conn,
+                {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": -32602, "message": str(exc)}},
+            )
+            return None
+        write_message(conn, {"jsonrpc": "2.0", "id": request.get("id"), "result": {"capacity": capacity}})
+        return region
+
+    def _run(self, conn: socket.socket, region: _Region, write_lock: threading.Lock, body: bytes) -> None:
+        try:
+            request = decode_payload(body)
+            response = self._handler(request)
+        except (PayloadTooLargeError, InvalidPayloadError) as exc:
+            response = {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": str(exc)}}
+        except Exception as exc:  # pragma: no cover - handler bug surfaced to client
+            _LOGGER.exception("MCP handler failed")
+            response = {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": -32603, "message": str(exc)}}
+        try:
+            data = encode_frame(response)[:-1]
+        except PayloadTooLargeError as exc:
+            data = encode_frame(
+                {"jsonrpc": "2.0", "id": response.get("id"), "error": {"code": -32603, "message": str(exc)}}
+            )[:-1]
+        try:
+            with write_lock:
+                _put_with_wait(region.responses, data, time.monotonic() + 30.0)
+                _ring_bell(conn)
+        except (OSError, TimeoutError) as exc:
+            _LOGGER.debug("Dropping MCP shared memory response: %s", exc)
+
+
+__all__ = [
+    "DEFAULT_CAPACITY",
+    "SharedMemoryMCPServer",
+    "SharedMemoryMCPValidator",
+]
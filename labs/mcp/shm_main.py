@@ -0,0 +1,66 @@
+"""Shared-memory MCP adapter entrypoint backed by the local schema validator."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import Any, Callable, Dict, Optional
+
+from labs.mcp.server import dispatch
+from labs.mcp.shm import SharedMemoryMCPServer
+from labs.mcp.socket_main import install_shutdown_handlers
+from labs.mcp.validate import warm_up_validators
+
+
+def create_server(
+    path: str,
+    *,
+    handler: Callable[[Dict[str, Any]], Dict[str, Any]] | None = None,
+    max_workers: Optional[int] = None,
+    backlog: int = 128,
+) -> SharedMemoryMCPServer:
+    """Bind a shared-memory MCP server whose control socket lives at *path*."""
+
+    return SharedMemoryMCPServer(path, handler=handler or dispatch, max_workers=max_workers, backlog=backlog)
+
+
+def serve(
+    path: str,
+    *,
+    handler: Callable[[Dict[str, Any]], Dict[str, Any]] | None = None,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Serve MCP requests through shared memory until SIGTERM/SIGINT."""
+
+    warm_up_validators()
+    server = create_server(path, handler=handler, max_workers=max_workers)
+    install_shutdown_handlers(server)
+    server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Synesthetic Labs MCP shared-memory adapter")
+    parser.add_argument("--path", help="Unix control socket path; defaults to MCP_SOCKET_PATH")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Validation worker threads (defaults to the executor's CPU-based size).",
+    )
+    args = parser.parse_args(argv)
+
+    path = args.path or os.getenv("MCP_SOCKET_PATH")
+    if not path:
+        parser.error("control socket path must be provided via --path or MCP_SOCKET_PATH")
+
+    try:
+        serve(path, max_workers=args.workers)
+    except Exception as exc:  # pragma: no cover - defensive guard
+        print(f"shared memory adapter failed: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
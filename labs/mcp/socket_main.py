@@ -4,17 +4,21 @@ from __future__ import annotations
 
 import argparse
 import os
+import signal
 import socket
-from typing import Any, Callable, Dict
+import threading
+from typing import Any, Callable, Dict, Optional
 
-from labs.mcp_stub import _success_response
+from labs.mcp.server import StreamMCPServer, dispatch
+from labs.mcp.validate import warm_up_validators
+from labs.mcp_stub import _handle_request
 from labs.transport import PayloadTooLargeError, decode_payload, read_message, write_message
 
 
 def _default_handler(request: Dict[str, Any]) -> Dict[str, Any]:
     """Return the canonical MCP stub response."""
 
-    return _success_response(request)
+    return _handle_request(request)
 
 
 def serve_once(path: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]] | None = None) -> None:
@@ -45,9 +49,77 @@ def serve_once(path: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]] |
             os.unlink(path)
 
 
+def create_server(
+    path: str,
+    *,
+    handler: Callable[[Dict[str, Any]], Dict[str, Any]] | None = None,
+    max_workers: Optional[int] = None,
+    backlog: int = 128,
+) -> StreamMCPServer:
+    """Bind a multi-client MCP server on *path*; the socket is unlinked on shutdown."""
+
+    if not path:
+        raise ValueError("path must be a non-empty string")
+
+    if os.path.exists(path):
+        os.unlink(path)
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        listener.bind(path)
+        listener.listen(backlog)
+    except OSError:
+        listener.close()
+        raise
+
+    def _unlink() -> None:
+        if os.path.exists(path):
+            os.unlink(path)
+
+    return StreamMCPServer(listener, handler=handler or dispatch, max_workers=max_workers, on_close=_unlink)
+
+
+def install_shutdown_handlers(server: StreamMCPServer, *, timeout: float = 5.0) -> None:
+    """Drain *server* gracefully on SIGTERM/SIGINT (main thread only)."""
+
+    if threading.current_thread() is not threading.main_thread():
+        return
+
+    def _handle(signum: int, _frame: Any) -> None:
+        server.request_shutdown(timeout)
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, _handle)
+
+
+def serve(
+    path: str,
+    *,
+    handler: Callable[[Dict[str, Any]], Dict[str, Any]] | None = None,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Serve MCP requests on *path* until SIGTERM/SIGINT."""
+
+    warm_up_validators()
+    server = create_server(path, handler=handler, max_workers=max_workers)
+    install_shutdown_handlers(server)
+    server.serve_forever()
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Synesthetic Labs MCP socket adapter")
     parser.add_argument("--path", help="Unix domain socket path; defaults to MCP_SOCKET_PATH")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Answer a single request with the stub handler and exit (legacy behaviour).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Validation worker threads (defaults to the executor's CPU-based size).",
+    )
     args = parser.parse_args(argv)
 
     path = args.path or os.getenv("MCP_SOCKET_PATH")
@@ -55,7 +127,10 @@ def main(argv: list[str] | None = None) -> int:
         parser.error("socket path must be provided via --path or MCP_SOCKET_PATH")
 
     try:
-        serve_once(path)
+        if args.once:
+            serve_once(path)
+        else:
+            serve(path, max_workers=args.workers)
     except PayloadTooLargeError as exc:
         print(f"payload too large: {exc}", file=os.sys.stderr)
         return 1
@@ -2,24 +2,53 @@
 
 from __future__ import annotations
 
+import os
 import socket
-import uuid
-from typing import Any, Dict
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from labs.mcp.exceptions import MCPUnavailableError
+from labs.mcp.jsonrpc import (
+    build_request,
+    unwrap_batch_items,
+    unwrap_response,
+    validate_many_request,
+    validate_request,
+)
 from labs.transport import (
+    FRAMING_LENGTH,
+    FRAMING_NEWLINE,
+    Codec,
     InvalidPayloadError,
+    MessageReader,
     PayloadTooLargeError,
+    available_codecs,
     decode_payload,
-    read_message,
-    write_message,
+    encode_frame,
+    framing_request,
+    get_codec,
+    iter_payload_batches,
+    select_codec,
 )
 
 
 class TcpMCPValidator:
-    """Connect to an MCP adapter over TCP and issue validation requests."""
+    """Connect to an MCP adapter over TCP and issue validation requests.
+
+    Requests share one persistent, pipelined connection (see
+    :class:`MultiplexedConnection`); call :meth:`close` to release it.
+    """
 
-    def __init__(self, host: str, port: int, *, timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        timeout: float = 10.0,
+        framing: Optional[str] = None,
+        codecs: Optional[Sequence[str]] = None,
+    ) -> None:
         if not host:
             raise ValueError("host must be a non-empty string")
         if port <= 0:
@@ -27,50 +56,272 @@ class TcpMCPValidator:
         self._host = host
         self._port = port
         self._timeout = timeout
+        self._connection = MultiplexedConnection(
+            host,
+            port,
+            framing=framing or framing_from_env(),
+            codecs=codecs_from_env() if codecs is None else codecs,
+        )
 
     def validate(self, asset: Dict[str, Any]) -> Dict[str, Any]:
         """Send *asset* to the MCP adapter and return the validation payload."""
 
+        return unwrap_response(self._round_trip(validate_request(asset)))
+
+    def validate_many(
+        self,
+        assets: Sequence[Mapping[str, Any]],
+        *,
+        batch_limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Validate *assets* with the ``validate_many`` RPC, one round trip per chunk.
+
+        Chunks respect *batch_limit* and the transport payload cap; results are
+        returned in input order.
+        """
+
+        results: List[Dict[str, Any]] = []
+        for chunk in iter_payload_batches(assets, max_items=batch_limit):
+            response = self._round_trip(validate_many_request(chunk))
+            results.extend(unwrap_batch_items(response, len(chunk)))
+        return results
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _round_trip(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return self._connection.request(request, timeout=self._timeout)
+
+
+class _PendingCall:
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+    def resolve(self, response: Optional[Dict[str, Any]] = None, error: Optional[BaseException] = None) -> None:
+        self.response = response
+        self.error = error
+        self.done.set()
+
+
+class _Channel:
+    """One open socket plus the requests still waiting for a response on it."""
+
+    def __init__(self, sock: socket.socket, reader: MessageReader, codec: Optional[Codec] = None) -> None:
+        self.sock = sock
+        self.reader = reader
+        self.framing = reader.framing
+        self.codec = codec
+        self.alive = True
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending: "OrderedDict[Any, _PendingCall]" = OrderedDict()
+
+    def register(self, call_id: Any) -> _PendingCall:
+        call = _PendingCall()
+        with self._lock:
+            if not self.alive:
+                call.resolve(error=ConnectionError("MCP connection closed"))
+            else:
+                self._pending[call_id if call_id is not None else object()] = call
+        return call
+
+    def send(self, data: bytes) -> None:
+        with self._write_lock:
+            self.sock.sendall(data)
+
+    def deliver(self, response: Dict[str, Any]) -> None:
+        """Route a response to its caller by ``id``, else to the oldest request."""
+
+        response_id = response.get("id")
+        with self._lock:
+            if response_id is not None:
+                call = self._pending.pop(response_id, None)
+            elif self._pending:
+                _, call = self._pending.popitem(last=False)
+            else:
+                call = None
+        if call is not None:
+            call.resolve(response)
+
+    def fail(self, error: BaseException) -> None:
+        with self._lock:
+            if not self.alive:
+                return
+            self.alive = False
+            pending = list(self._pending.values())
+            self._pending.clear()
         try:
-            with socket.create_connection((self._host, self._port), timeout=self._timeout) as client:
-                write_message(client, _jsonrpc_request(asset))
-                response_bytes = read_message(client)
-        except PayloadTooLargeError as exc:
-            raise MCPUnavailableError(f"MCP request payload too large: {exc}") from exc
-        except (socket.timeout, ConnectionRefusedError, ConnectionResetError, OSError) as exc:
-            raise MCPUnavailableError(f"MCP TCP connection error: {exc}") from exc
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        for call in pending:
+            call.resolve(error=error)
 
+    def read_loop(self) -> None:
+        error: BaseException = ConnectionError("MCP server closed the connection")
         try:
-            response = decode_payload(response_bytes)
-        except (PayloadTooLargeError, InvalidPayloadError) as exc:
-            raise MCPUnavailableError(f"Invalid MCP response: {exc}") from exc
+            for raw in self.reader:
+                try:
+                    response = decode_payload(raw, self.codec)
+                except (PayloadTooLargeError, InvalidPayloadError) as exc:
+                    # The frame's owner is unknown; drop the connection rather than guess.
+                    error = MCPUnavailableError(f"Invalid MCP response: {exc}")
+                    break
+                self.deliver(response)
+        except PayloadTooLargeError as exc:
+            error = MCPUnavailableError(f"Invalid MCP response: {exc}")
+        except OSError as exc:
+            error = exc
+        self.fail(error)
+
+
+class MultiplexedConnection:
+    """A persistent TCP connection that pipelines JSON-RPC requests.
+
+    Callers write requests as soon as they arrive; a reader thread routes each
+    response back by JSON-RPC ``id`` (id-less responses go to the oldest
+    outstanding request). A reset connection is reopened on the next request
+    and requests lost with it are retried once, since validation and schema
+    lookups are idempotent. A timeout or an undecodable response closes the
+    connection, because either would break order-based routing.
+
+    With ``framing="length-prefixed"`` or preferred *codecs* each new socket
+    first sends a ``labs.framing`` handshake; servers that accept it exchange
+    4-byte length-prefixed frames encoded with the codec they picked, others
+    keep newline-framed JSON. Asking for a binary codec (``zlib``,
+    ``msgpack``) implies length-prefixed framing; codecs not installed
+    locally are never offered.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        framing: str = FRAMING_NEWLINE,
+        codecs: Sequence[str] = (),
+    ) -> None:
+        self._host = host
+        self._port = port
+        supported = available_codecs()
+        self.codecs: Tuple[str, ...] = tuple(name for name in codecs if name in supported)
+        if any(get_codec(name).binary for name in self.codecs):
+            framing = FRAMING_LENGTH
+        self.framing = framing
+        self._lock = threading.Lock()
+        self._channel: Optional[_Channel] = None
+        self.connects = 0
+
+    def request(self, payload: Dict[str, Any], *, timeout: float) -> Dict[str, Any]:
+        last_error: Optional[BaseException] = None
+        for _ in range(2):
+            channel = self._open(timeout)
+            try:
+                data = encode_frame(payload, channel.framing, channel.codec)
+            except PayloadTooLargeError as exc:
+                raise MCPUnavailableError(f"MCP request payload too large: {exc}") from exc
+            call = channel.register(payload.get("id"))
+            if not call.done.is_set():
+                try:
+                    channel.send(data)
+                except OSError as exc:
+                    channel.fail(exc)
+            if not call.done.wait(timeout):
+                # Id-less responses are matched by order, so a late reply would reach the
+                # wrong caller; drop the connection and let other callers retry on a new one.
+                channel.fail(ConnectionError("MCP request timed out"))
+                raise MCPUnavailableError("MCP TCP connection error: timed out")
+            if call.error is None and call.response is not None:
+                return call.response
+            if isinstance(call.error, MCPUnavailableError):
+                raise call.error
+            last_error = call.error
+        raise MCPUnavailableError(f"MCP TCP connection error: {last_error}") from last_error
+
+    def close(self) -> None:
+        with self._lock:
+            channel, self._channel = self._channel, None
+        if channel is not None:
+            channel.fail(MCPUnavailableError("MCP TCP connection closed"))
 
-        if not isinstance(response, dict):
-            raise MCPUnavailableError("Invalid MCP response payload")
+    def _open(self, timeout: float) -> _Channel:
+        with self._lock:
+            channel = self._channel
+            if channel is not None and channel.alive:
+                return channel
+            try:
+                sock = socket.create_connection((self._host, self._port), timeout=timeout)
+            except OSError as exc:
+                raise MCPUnavailableError(f"MCP TCP connection error: {exc}") from exc
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                reader, codec = self._negotiate(sock)
+            except (OSError, PayloadTooLargeError, InvalidPayloadError) as exc:
+                sock.close()
+                raise MCPUnavailableError(f"MCP TCP connection error: {exc}") from exc
+            sock.settimeout(None)
+            channel = _Channel(sock, reader, codec)
+            reader_thread = threading.Thread(
+                target=channel.read_loop,
+                name=f"labs-mcp-tcp-{self._host}:{self._port}",
+                daemon=True,
+            )
+            reader_thread.start()
+            self._channel = channel
+            self.connects += 1
+            return channel
 
-        return _unwrap_jsonrpc(response)
+    def _negotiate(self, sock: socket.socket) -> Tuple[MessageReader, Optional[Codec]]:
+        reader = MessageReader(sock)
+        if self.framing == FRAMING_NEWLINE and not self.codecs:
+            return reader, None
+        sock.sendall(encode_frame(framing_request(self.framing, self.codecs)))
+        message = reader.read()
+        if message is None:
+            raise ConnectionError("MCP server closed the connection during framing handshake")
+        reply = decode_payload(message)
+        result = reply.get("result")
+        if not isinstance(result, dict) or result.get("framing") != self.framing:
+            return reader, None
+        reader.framing = self.framing
+        codec = select_codec([result.get("codec")], self.framing)
+        if codec.name not in self.codecs:
+            return reader, None
+        return reader, codec
 
 
-def _jsonrpc_request(asset: Dict[str, Any]) -> Dict[str, Any]:
-    return {
-        "jsonrpc": "2.0",
-        "id": str(uuid.uuid4()),
-        "method": "validate",
-        "params": {"asset": asset},
-    }
+def framing_from_env() -> str:
+    """Return the framing requested by ``MCP_FRAMING`` (``newline`` by default)."""
 
+    raw = os.getenv("MCP_FRAMING", "").strip().lower()
+    if raw in {"length", FRAMING_LENGTH}:
+        return FRAMING_LENGTH
+    return FRAMING_NEWLINE
 
-def _unwrap_jsonrpc(payload: Dict[str, Any]) -> Dict[str, Any]:
-    if payload.get("jsonrpc") == "2.0":
-        if "error" in payload:
-            error = payload["error"]
-            message = error.get("message") if isinstance(error, dict) else str(error)
-            raise MCPUnavailableError(f"MCP error response: {message}")
-        result = payload.get("result")
-        if isinstance(result, dict):
-            return result
-        raise MCPUnavailableError("MCP response missing result payload")
-    return payload
+
+def codecs_from_env() -> Tuple[str, ...]:
+    """Return the codec preferences listed in ``MCP_CODEC`` (comma separated)."""
+
+    raw = os.getenv("MCP_CODEC", "")
+    return tuple(name.strip().lower() for name in raw.split(",") if name.strip())
+
+
+_SHARED_CONNECTIONS: Dict[Tuple[str, int], MultiplexedConnection] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def _shared_connection(host: str, port: int) -> MultiplexedConnection:
+    with _SHARED_LOCK:
+        connection = _SHARED_CONNECTIONS.get((host, port))
+        if connection is None:
+            connection = MultiplexedConnection(host, port, framing=framing_from_env(), codecs=codecs_from_env())
+            _SHARED_CONNECTIONS[(host, port)] = connection
+        return connection
 
 
 def get_schema_from_mcp(
@@ -112,31 +363,8 @@ def get_schema_from_mcp(
         params["resolution"] = resolution
     
     # MCP server expects direct method calls, not tools/call wrapper
-    request = {
-        "jsonrpc": "2.0",
-        "id": str(uuid.uuid4()),
-        "method": "get_schema",
-        "params": params
-    }
-    
-    try:
-        with socket.create_connection((host, port), timeout=timeout) as client:
-            write_message(client, request)
-            response_bytes = read_message(client)
-    except PayloadTooLargeError as exc:
-        raise MCPUnavailableError(f"MCP request payload too large: {exc}") from exc
-    except (socket.timeout, ConnectionRefusedError, ConnectionResetError, OSError) as exc:
-        raise MCPUnavailableError(f"MCP TCP connection error: {exc}") from exc
-    
-    try:
-        response = decode_payload(response_bytes)
-    except (PayloadTooLargeError, InvalidPayloadError) as exc:
-        raise MCPUnavailableError(f"Invalid MCP response: {exc}") from exc
-    
-    if not isinstance(response, dict):
-        raise MCPUnavailableError("Invalid MCP response payload")
-    
-    return _unwrap_jsonrpc(response)
+    request = build_request("get_schema", params)
+    return unwrap_response(_shared_connection(host, port).request(request, timeout=timeout))
 
 
-__all__ = ["TcpMCPValidator", "get_schema_from_mcp"]
+__all__ = ["MultiplexedConnection", "TcpMCPValidator", "get_schema_from_mcp"]
@@ -0,0 +1,96 @@
+"""TCP MCP adapter entrypoint backed by the local schema validator."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import sys
+from typing import Any, Callable, Dict, Optional
+
+from labs.mcp.server import ProcessPoolDispatcher, StreamMCPServer, dispatch
+from labs.mcp.socket_main import install_shutdown_handlers
+from labs.mcp.validate import warm_up_validators
+
+_DEFAULT_HOST = "127.0.0.1"
+_DEFAULT_PORT = 8765
+
+
+def create_server(
+    host: str = _DEFAULT_HOST,
+    port: int = _DEFAULT_PORT,
+    *,
+    handler: Callable[[Dict[str, Any]], Dict[str, Any]] | None = None,
+    max_workers: Optional[int] = None,
+    processes: int = 0,
+    backlog: int = 128,
+) -> StreamMCPServer:
+    """Bind a multi-client MCP server on ``host:port`` (port 0 picks a free one).
+
+    With *processes* > 0 and no custom *handler*, requests are validated in a
+    process pool of that size so CPU-bound validation scales across cores.
+    """
+
+    pool: Optional[ProcessPoolDispatcher] = None
+    if handler is None and processes > 0:
+        pool = ProcessPoolDispatcher(processes)
+        handler = pool
+
+    try:
+        listener = socket.create_server((host, port), backlog=backlog)
+    except OSError:
+        if pool is not None:
+            pool.close()
+        raise
+    listener.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    return StreamMCPServer(
+        listener,
+        handler=handler or dispatch,
+        max_workers=max_workers,
+        on_close=pool.close if pool is not None else None,
+    )
+
+
+def serve(
+    host: str = _DEFAULT_HOST,
+    port: int = _DEFAULT_PORT,
+    *,
+    max_workers: Optional[int] = None,
+    processes: int = 0,
+) -> None:
+    """Serve MCP requests on ``host:port`` until SIGTERM/SIGINT."""
+
+    warm_up_validators()
+    server = create_server(host, port, max_workers=max_workers, processes=processes)
+    install_shutdown_handlers(server)
+    server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Synesthetic Labs MCP TCP adapter")
+    parser.add_argument("--host", help="Bind address; defaults to MCP_HOST or 127.0.0.1")
+    parser.add_argument("--port", type=int, help="Bind port; defaults to MCP_PORT or 8765")
+    parser.add_argument("--workers", type=int, default=None, help="Request handler threads")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=int(os.getenv("MCP_SERVER_PROCESSES", "0") or 0),
+        help="Validate in a process pool of this size (defaults to MCP_SERVER_PROCESSES or 0 = threads only)",
+    )
+    args = parser.parse_args(argv)
+
+    host = args.host or os.getenv("MCP_HOST", _DEFAULT_HOST)
+    port = args.port if args.port is not None else int(os.getenv("MCP_PORT", str(_DEFAULT_PORT)))
+
+    try:
+        serve(host, port, max_workers=args.workers, processes=args.processes)
+    except OSError as exc:
+        print(f"tcp adapter failed: {exc}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import os
 import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, MutableMapping
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set
 
 import jsonschema
 from jsonschema import Draft202012Validator, ValidationError
 from urllib.parse import urlparse
 
+from labs.mcp.registry import ValidatorRegistry
+from labs.mcp.schema_compiler import get_compiled
+
 JsonDict = Dict[str, Any]
+ErrorCheck = Callable[[JsonDict], Optional[JsonDict]]
 
 _ROOT = Path(__file__).resolve().parent.parent.parent
-_VALIDATOR_CACHE: Dict[str, Draft202012Validator] = {}
+_SCHEMAS_DIR = _ROOT / "meta" / "schemas"
+_DEFAULT_CACHE_SIZE = 64
 
 
 def _resolve_schema_path(schema_identifier: str) -> Path:
@@ -58,18 +63,80 @@ def _resolve_schema_path(schema_identifier: str) -> Path:
 
 
 def _load_validator(schema_identifier: str) -> Draft202012Validator:
-    if schema_identifier not in _VALIDATOR_CACHE:
-        schema_path = _resolve_schema_path(schema_identifier)
-        with schema_path.open("r", encoding="utf-8") as handle:
-            schema_payload = json.load(handle)
-        _VALIDATOR_CACHE[schema_identifier] = Draft202012Validator(schema_payload)
-    return _VALIDATOR_CACHE[schema_identifier]
+    return _VALIDATOR_CACHE.validator(schema_identifier)
 
 
-def _format_error(error: ValidationError) -> JsonDict:
-    tokens = [str(token) for token in error.path]
+def _compiler_enabled() -> bool:
+    return os.getenv("LABS_SCHEMA_COMPILER", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _build_check(schema: JsonDict) -> ErrorCheck:
+    """Return a function mapping an instance to its first formatted error (or ``None``).
+
+    Schemas the compiler supports run as generated Python (shared per
+    ``$id`` and content hash); others, or all of them when
+    ``LABS_SCHEMA_COMPILER=0``, use ``jsonschema``. Both report the same
+    first error.
+    """
+
+    compiled = get_compiled(schema) if _compiler_enabled() else None
+    if compiled is not None:
+
+        def check(instance: JsonDict) -> Optional[JsonDict]:
+            error = compiled.first_error(instance)
+            return None if error is None else _format_pointer(error[0], error[1])
+
+        return check
+
+    validator = Draft202012Validator(schema)
+
+    def check(instance: JsonDict) -> Optional[JsonDict]:
+        error = next(validator.iter_errors(instance), None)
+        return None if error is None else _format_error(error)
+
+    return check
+
+
+def _cache_size() -> int:
+    raw = os.getenv("LABS_VALIDATOR_CACHE_SIZE")
+    try:
+        size = int(raw) if raw else _DEFAULT_CACHE_SIZE
+    except ValueError:
+        size = _DEFAULT_CACHE_SIZE
+    return size if size > 0 else _DEFAULT_CACHE_SIZE
+
+
+_VALIDATOR_CACHE = ValidatorRegistry(resolve=_resolve_schema_path, build_check=_build_check, max_entries=_cache_size())
+
+
+def _load_check(schema_identifier: str) -> ErrorCheck:
+    return _VALIDATOR_CACHE.check(schema_identifier)
+
+
+def warm_up_validators(directory: Optional[Path] = None) -> int:
+    """Compile every bundled schema version ahead of the first request.
+
+    Returns the number of schemas registered; daemons call this at start so
+    the first asset of each version does not pay the compile cost.
+    """
+
+    return _VALIDATOR_CACHE.warm_up(directory or _SCHEMAS_DIR)
+
+
+def validator_stats() -> JsonDict:
+    """Return hit/miss/eviction counters and compile time of the validator registry."""
+
+    return _VALIDATOR_CACHE.stats()
+
+
+def _format_pointer(path: Iterable[Any], message: str) -> JsonDict:
+    tokens = [str(token) for token in path]
     pointer = "/" + "/".join(tokens) if tokens else "/"
-    return {"path": pointer, "msg": error.message}
+    return {"path": pointer, "msg": message}
+
+
+def _format_error(error: ValidationError) -> JsonDict:
+    return _format_pointer(error.path, error.message)
 
 
 def _failure(reason: str, errors: List[JsonDict]) -> JsonDict:
@@ -104,7 +171,7 @@ def validate_asset(asset: MutableMapping[str, Any], *_) -> JsonDict:
         )
 
     try:
-        validator = _load_validator(schema_identifier)
+        check = _load_check(schema_identifier)
     except (OSError, ValueError) as exc:
         return _failure(
             "validation_failed",
@@ -116,18 +183,258 @@ def validate_asset(asset: MutableMapping[str, Any], *_) -> JsonDict:
             ],
         )
 
+    error = check(asset if type(asset) is dict else dict(asset))
+    if error is not None:
+        return _failure("validation_failed", [error])
+
+    return {"ok": True, "reason": "validation_passed", "errors": []}
+
+
+_SUBTREE_ROOT_KEYWORDS = frozenset({"type", "properties", "required", "additionalProperties"})
+_ANNOTATION_KEYWORDS = frozenset(
+    {"$schema", "$id", "$comment", "$defs", "definitions", "title", "description", "default", "examples"}
+)
+
+
+class _SubtreePlan:
+    """Per-property checks for a root schema whose only cross-key rules are ``required``/``additionalProperties``."""
+
+    def __init__(self, schema: JsonDict, validator: Draft202012Validator) -> None:
+        self._properties: JsonDict = schema["properties"]
+        self._validator = validator
+        self.order = {name: index for index, name in enumerate(self._properties)}
+        self._checks: Dict[str, ErrorCheck] = {}
+
+    def check(self, name: str) -> ErrorCheck:
+        check = self._checks.get(name)
+        if check is None:
+            check = self._checks[name] = self._build(name)
+        return check
+
+    def _build(self, name: str) -> ErrorCheck:
+        subschema = self._properties[name]
+        # Wrapping keeps the compiler's (and jsonschema's) error paths for the property intact.
+        compiled = get_compiled({"properties": {name: subschema}}) if _compiler_enabled() else None
+        if compiled is not None:
+
+            def check(instance: JsonDict) -> Optional[JsonDict]:
+                error = compiled.first_error({name: instance[name]})
+                return None if error is None else _format_pointer(error[0], error[1])
+
+            return check
+
+        validator = self._validator
+
+        def check(instance: JsonDict) -> Optional[JsonDict]:
+            errors = validator.descend(instance[name], subschema, path=name, schema_path=name)
+            error = next(iter(errors), None)
+            return None if error is None else _format_error(error)
+
+        return check
+
+
+def _build_subtree_plan(schema: JsonDict, validator: Draft202012Validator) -> Optional[_SubtreePlan]:
+    if not isinstance(schema, dict) or not isinstance(schema.get("properties"), dict):
+        return None
+    if any(key not in _SUBTREE_ROOT_KEYWORDS and key not in _ANNOTATION_KEYWORDS for key in schema):
+        return None
+    return _SubtreePlan(schema, validator)
+
+
+def _changed_keys(changed: Iterable[str]) -> Optional[Set[str]]:
+    """Map changed top-level keys or JSON pointers to top-level keys (``None`` for the root)."""
+
+    keys: Set[str] = set()
+    for entry in changed:
+        if not isinstance(entry, str):
+            return None
+        if entry.startswith("/"):
+            token = entry[1:].split("/", 1)[0]
+            if not token:
+                return None
+            keys.add(token.replace("~1", "/").replace("~0", "~"))
+        elif entry:
+            keys.add(entry)
+        else:
+            return None
+    return keys
+
+
+def validate_changes(asset: MutableMapping[str, Any], changed: Iterable[str], *_) -> JsonDict:
+    """Validate *asset* after a patch that changed only the *changed* keys (or JSON pointers).
+
+    The asset before the patch must have passed :func:`validate_asset` against
+    the same schema. Only the subschemas of the changed top-level properties
+    are checked, and the result (first error included) is the one a full
+    validation would return. Root pointers, ``$schema`` changes, removed or
+    undeclared keys, and schemas with other root-level keywords fall back to
+    :func:`validate_asset`.
+    """
+
+    if not isinstance(asset, MutableMapping):
+        raise TypeError("asset must be a mutable mapping")
+
+    keys = _changed_keys(changed)
+    schema_identifier = asset.get("$schema")
+    if keys is None or "$schema" in keys or "$schemaRef" in asset or not isinstance(schema_identifier, str):
+        return validate_asset(asset)
+
     try:
-        validator.validate(dict(asset))
-    except ValidationError as exc:
-        return _failure("validation_failed", [_format_error(exc)])
+        plan = _VALIDATOR_CACHE.derived(schema_identifier, "subtrees", _build_subtree_plan)
+    except (OSError, ValueError):
+        return validate_asset(asset)
+    if plan is None or any(key not in asset or key not in plan.order for key in keys):
+        return validate_asset(asset)
+
+    instance = asset if type(asset) is dict else dict(asset)
+    for key in sorted(keys, key=plan.order.__getitem__):
+        error = plan.check(key)(instance)
+        if error is not None:
+            return _failure("validation_failed", [error])
 
     return {"ok": True, "reason": "validation_passed", "errors": []}
 
 
-def validate_many(assets: Iterable[MutableMapping[str, Any]], *_) -> JsonDict:
-    results: List[JsonDict] = []
-    for asset in assets:
-        results.append(validate_asset(asset))
+VALIDATION_TIERS = ("remote", "tiered", "sampled", "local")
+_DEFAULT_TIER = "remote"
+
+
+def resolve_validation_tier(value: Optional[str] = None) -> str:
+    """Return the validation tier from *value* or ``LABS_VALIDATION_TIER``.
+
+    ``remote`` (default) sends every asset to the MCP transport, ``tiered``
+    checks locally first and only forwards locally valid assets,
+    ``sampled`` validates batches locally and confirms a sample remotely
+    (single assets are handled as ``tiered``), and ``local`` never leaves
+    the process (bulk dry runs). Unknown values fall back to ``remote``.
+    """
+
+    raw = value if value is not None else os.getenv("LABS_VALIDATION_TIER", _DEFAULT_TIER)
+    tier = raw.strip().lower()
+    return tier if tier in VALIDATION_TIERS else _DEFAULT_TIER
+
+
+def local_verdict(
+    asset: MutableMapping[str, Any],
+    tier: str,
+    changed: Optional[Iterable[str]] = None,
+) -> Optional[JsonDict]:
+    """Return the local tier's result for *asset*, or ``None`` to defer to the MCP transport.
+
+    In ``tiered`` (and per-asset ``sampled``) mode only definite schema
+    failures are final; passing assets and schemas that are not available
+    locally are deferred.
+    *changed* re-checks a patched asset via :func:`validate_changes`.
+    """
+
+    if tier == "remote":
+        return None
+    result = validate_asset(asset) if changed is None else validate_changes(asset, changed)
+    if tier == "local":
+        return result
+    if result["ok"] or schema_unavailable(result):
+        return None
+    return result
+
+
+def schema_unavailable(result: Mapping[str, Any]) -> bool:
+    """Return whether a local *result* failed only because its schema could not be loaded."""
+
+    errors = result.get("errors") or []
+    return any(str(error.get("msg", "")).startswith("schema_unavailable") for error in errors)
+
+
+class LocalValidator:
+    """In-process validator for :class:`labs.agents.critic.CriticAgent`, with incremental re-checks."""
+
+    def __call__(self, asset: MutableMapping[str, Any]) -> JsonDict:
+        return validate_asset(asset)
+
+    def validate_changes(self, asset: MutableMapping[str, Any], changed: Iterable[str]) -> JsonDict:
+        return validate_changes(asset, changed)
+
+
+_LEGACY_STRIPPED_KEYS = frozenset({"asset_id", "prompt", "timestamp", "seed", "parameter_index", "provenance"})
+
+
+def schema_version_of(asset: Mapping[str, Any]) -> Optional[str]:
+    """Return the version segment of *asset*'s ``$schema`` identifier, if it has one."""
+
+    schema_field = asset.get("$schema")
+    if isinstance(schema_field, str) and schema_field.strip():
+        tokens = schema_field.rstrip("/").split("/")
+        candidate = tokens[-2] if len(tokens) >= 2 else tokens[-1]
+        if candidate and all(ch.isdigit() or ch == "." for ch in candidate):
+            return candidate
+    return None
+
+
+def is_legacy_version(version: str) -> bool:
+    """Return whether *version* predates 0.7.4, whose schema rejects provenance keys."""
+
+    try:
+        parts = tuple(int(part) for part in str(version).split("."))
+    except ValueError:
+        parts = ()
+    if len(parts) != 3:
+        return str(version) < "0.7.4"
+    return parts < (0, 7, 4)
+
+
+def _strip_legacy_metadata(asset: Mapping[str, Any]) -> JsonDict:
+    payload = {key: value for key, value in asset.items() if key not in _LEGACY_STRIPPED_KEYS}
+    meta_info = payload.get("meta_info")
+    if isinstance(meta_info, Mapping) and "provenance" in meta_info:
+        payload["meta_info"] = {key: value for key, value in meta_info.items() if key != "provenance"}
+    # Legacy schema disallows embedded telemetry fields under rule_bundle meta.
+    rule_bundle = payload.get("rule_bundle")
+    if isinstance(rule_bundle, Mapping):
+        bundle_meta = rule_bundle.get("meta_info")
+        if isinstance(bundle_meta, Mapping) and "provenance" in bundle_meta:
+            stripped = {key: value for key, value in bundle_meta.items() if key != "provenance"}
+            payload["rule_bundle"] = {**rule_bundle, "meta_info": stripped}
+    return payload
+
+
+def prepare_for_validation(
+    asset: MutableMapping[str, Any],
+    *,
+    default_version: Optional[str] = None,
+) -> MutableMapping[str, Any]:
+    """Return *asset* in the form sent for validation.
+
+    Assets pinned to a legacy schema get a shallow projection without the
+    provenance keys that schema rejects. Only ``meta_info`` and
+    ``rule_bundle.meta_info`` are copied, and only when they hold a
+    ``provenance`` key. Current versions are returned as-is. *asset* is
+    never modified, so prepared payloads must be treated as read-only.
+    *default_version* applies when ``$schema`` names no version.
+    """
+
+    version = schema_version_of(asset) or default_version
+    if version and is_legacy_version(version):
+        return _strip_legacy_metadata(asset)
+    return asset
+
+
+def validate_many(
+    assets: Iterable[MutableMapping[str, Any]],
+    *_,
+    processes: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> JsonDict:
+    """Validate *assets* in order; ``processes > 1`` shards them across a process pool."""
+
+    if processes is not None and processes > 1:
+        from labs.mcp.parallel import validate_chunks
+
+        assets = list(assets)
+        for asset in assets:
+            if not isinstance(asset, MutableMapping):
+                raise TypeError("asset must be a mutable mapping")
+        results = validate_chunks(assets, processes=processes, chunksize=chunksize)
+    else:
+        results = [validate_asset(asset) for asset in assets]
 
     ok = all(entry["ok"] for entry in results)
     payload: JsonDict = {"ok": ok, "items": results}
@@ -151,4 +458,19 @@ def invoke_mcp(asset: MutableMapping[str, Any], strict: bool = True) -> JsonDict
     return result
 
 
-__all__ = ["validate_asset", "validate_many", "invoke_mcp"]
+__all__ = [
+    "LocalValidator",
+    "VALIDATION_TIERS",
+    "is_legacy_version",
+    "local_verdict",
+    "prepare_for_validation",
+    "resolve_validation_tier",
+    "schema_unavailable",
+    "schema_version_of",
+    "validate_asset",
+    "validate_changes",
+    "validate_many",
+    "invoke_mcp",
+    "warm_up_validators",
+    "validator_stats",
+]
@@ -4,53 +4,328 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
 import shlex
 import socket
 import subprocess
-import uuid
-from typing import Any, Callable, Dict, Mapping, MutableMapping, Optional, Sequence
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from labs.core import normalize_resource_path
 from labs.mcp.exceptions import MCPUnavailableError
+from labs.mcp.jsonrpc import (
+    unwrap_batch_items,
+    unwrap_response,
+    validate_many_request,
+    validate_request,
+)
 from labs.transport import (
     InvalidPayloadError,
     PayloadTooLargeError,
     decode_payload,
     encode_payload,
+    iter_payload_batches,
     read_message,
     write_message,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from labs.mcp.balancer import BalancedMCPValidator
+    from labs.mcp.shm import SharedMemoryMCPValidator
+    from labs.mcp.tcp_client import TcpMCPValidator
+
 
 _LOGGER = logging.getLogger(__name__)
 _SCHEMAS_WARNING_EMITTED = False
 
 
-def _jsonrpc_request(asset: Dict[str, Any]) -> Dict[str, Any]:
-    return {
-        "jsonrpc": "2.0",
-        "id": str(uuid.uuid4()),
-        "method": "validate",
-        "params": {"asset": asset},
-    }
+class _PersistentAdapter:
+    """A long-lived adapter process exchanging newline-delimited JSON-RPC.
 
+    Requests are serialised over the process's stdin/stdout. The process is
+    started lazily, killed when a request times out, and restarted on the
+    next request after it exits; a request interrupted by a crash is retried
+    once on the fresh process.
+    """
 
-def _unwrap_jsonrpc(payload: Dict[str, Any]) -> Dict[str, Any]:
-    if payload.get("jsonrpc") == "2.0":
-        if "error" in payload:
-            error = payload["error"]
-            message = error.get("message") if isinstance(error, dict) else str(error)
-            raise MCPUnavailableError(f"MCP error response: {message}")
-        result = payload.get("result")
-        if isinstance(result, dict):
-            return result
-        raise MCPUnavailableError("MCP response missing result payload")
-    return payload
+    def __init__(
+        self,
+        command: Sequence[str],
+        env: Optional[MutableMapping[str, str]],
+        *,
+        max_requests: Optional[int] = None,
+    ) -> None:
+        self._command = command
+        self._env = env
+        self._max_requests = max_requests if max_requests and max_requests > 0 else None
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._stderr: Deque[str] = deque(maxlen=20)
+        self._stderr_reader: Optional[threading.Thread] = None
+        self.starts = 0
+        self.served = 0
+
+    def request(self, payload: Dict[str, Any], data: bytes, *, timeout: float) -> Dict[str, Any]:
+        with self._lock:
+            failure = "adapter exited"
+            for _ in range(2):
+                process = self._ensure_started()
+                assert process.stdin is not None
+                try:
+                    process.stdin.write(data)
+                    process.stdin.flush()
+                except OSError:
+                    failure = self._stop()
+                    continue
+
+                response = self._await_response(payload.get("id"), timeout)
+                if response is not None:
+                    self.served += 1
+                    if self._max_requests is not None and self.served >= self._max_requests:
+                        self._stop(graceful=True)
+                    return response
+                failure = self._stop()
+        raise MCPUnavailableError(f"MCP adapter failed: {failure}")
+
+    def check(self) -> bool:
+        """Return False (and reap the process) if a started adapter has exited.
+
+        A worker busy with a request counts as healthy; that request reports
+        its own failure.
+        """
+
+        if not self._lock.acquire(blocking=False):
+            return True
+        try:
+            process = self._process
+            if process is None or process.poll() is None:
+                return True
+            self._stop()
+            return False
+        finally:
+            self._lock.release()
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop(graceful=True)
+
+    def _await_response(self, request_id: Any, timeout: float) -> Optional[Dict[str, Any]]:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise queue.Empty
+                line = self._responses.get(timeout=remaining)
+            except queue.Empty:
+                self._stop()
+                raise MCPUnavailableError("MCP validation timed out") from None
+            if line is None:
+                return None
+            try:
+                response = decode_payload(line)
+            except (PayloadTooLargeError, InvalidPayloadError) as exc:
+                raise MCPUnavailableError(f"Invalid MCP response: {exc}") from exc
+            if response.get("id") in (None, request_id):
+                return response
+
+    def _ensure_started(self) -> subprocess.Popen:
+        process = self._process
+        if process is not None and process.poll() is None:
+            return process
+        self._stop()
+        try:
+            process = subprocess.Popen(  # noqa: S603 - user-controlled command expected
+                self._command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=self._env,
+            )
+        except OSError as exc:  # pragma: no cover - system-dependent failure
+            raise MCPUnavailableError(f"Failed to launch MCP adapter: {exc}") from exc
+        responses: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._stderr.clear()
+        threading.Thread(target=self._pump_stdout, args=(process, responses), daemon=True).start()
+        self._stderr_reader = threading.Thread(
+            target=self._pump_stderr, args=(process,), daemon=True
+        )
+        self._stderr_reader.start()
+        self._process = process
+        self._responses = responses
+        self.starts += 1
+        self.served = 0
+        return process
+
+    @staticmethod
+    def _pump_stdout(process: subprocess.Popen, responses: "queue.Queue[Optional[bytes]]") -> None:
+        assert process.stdout is not None
+        for line in iter(process.stdout.readline, b""):
+            if line.strip():
+                responses.put(line)
+        responses.put(None)
+
+    def _pump_stderr(self, process: subprocess.Popen) -> None:
+        assert process.stderr is not None
+        for line in iter(process.stderr.readline, b""):
+            self._stderr.append(line.decode("utf-8", errors="replace").rstrip())
+
+    def _stop(self, *, graceful: bool = False) -> str:
+        """Terminate the current process and describe how it ended.
+
+        A *graceful* stop closes stdin and gives the adapter a moment to exit
+        on its own before it is killed.
+        """
+
+        process, self._process = self._process, None
+        if process is None:
+            return "adapter exited"
+        if process.stdin is not None:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        if graceful:
+            try:
+                process.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                pass
+        if process.poll() is None:
+            process.kill()
+        try:
+            process.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:  # pragma: no cover - defensive
+            pass
+        if self._stderr_reader is not None:
+            self._stderr_reader.join(timeout=0.5)
+        message = self._stderr[-1] if self._stderr else ""
+        return message or f"exit status {process.returncode}"
 
 
+class _AdapterPool:
+    """Dispatch requests across persistent adapter workers, least-loaded first.
+
+    Ties rotate so idle workers share the load. A worker whose request fails
+    is passed over for ``unhealthy_cooldown`` seconds while healthy workers
+    remain. Before dispatching, at most once per ``health_interval`` seconds,
+    :meth:`check_health` reaps workers whose process has exited so they are
+    passed over too.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        env: Optional[MutableMapping[str, str]],
+        *,
+        workers: int,
+        max_requests: Optional[int] = None,
+        unhealthy_cooldown: float = 5.0,
+        health_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        self._workers = [
+            _PersistentAdapter(command, env, max_requests=max_requests) for _ in range(workers)
+        ]
+        self._unhealthy_cooldown = unhealthy_cooldown
+        self._health_interval = health_interval
+        self._next_health_check = 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight = [0] * workers
+        self._unhealthy_until = [0.0] * workers
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    def request(self, payload: Dict[str, Any], data: bytes, *, timeout: float) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            due = now >= self._next_health_check
+            if due:
+                self._next_health_check = now + self._health_interval
+        if due:
+            self.check_health()
+        index = self._acquire()
+        try:
+            return self._workers[index].request(payload, data, timeout=timeout)
+        except MCPUnavailableError:
+            with self._lock:
+                self._unhealthy_until[index] = self._clock() + self._unhealthy_cooldown
+            raise
+        finally:
+            with self._lock:
+                self._in_flight[index] -= 1
+
+    def check_health(self) -> List[bool]:
+        """Probe every worker, marking ones whose process died as unhealthy."""
+
+        results = [worker.check() for worker in self._workers]
+        with self._lock:
+            now = self._clock()
+            for index, healthy in enumerate(results):
+                if not healthy:
+                    self._unhealthy_until[index] = now + self._unhealthy_cooldown
+        return results
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            now = self._clock()
+            return [
+                {
+                    "in_flight": self._in_flight[index],
+                    "starts": worker.starts,
+                    "served": worker.served,
+                    "healthy": self._unhealthy_until[index] <= now,
+                }
+                for index, worker in enumerate(self._workers)
+            ]
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.close()
+
+    def _acquire(self) -> int:
+        count = len(self._workers)
+        with self._lock:
+            now = self._clock()
+            healthy = [index for index in range(count) if self._unhealthy_until[index] <= now]
+            candidates = healthy or list(range(count))
+            index = min(candidates, key=lambda i: (self._in_flight[i], (i - self._next) % count))
+            self._next = (index + 1) % count
+            self._in_flight[index] += 1
+            return index
+
 
 class StdioMCPValidator:
-    """Invoke an MCP adapter over STDIO to validate Synesthetic assets."""
+    """Invoke an MCP adapter over STDIO to validate Synesthetic assets.
+
+    By default each request spawns the adapter and reads one response. With
+    ``persistent=True`` a single adapter process (for example
+    ``python -m labs.mcp_stub --loop``) serves every request over
+    newline-delimited JSON-RPC; ``workers > 1`` (which requires
+    ``persistent=True``) runs a pool of such processes and ``max_requests``
+    recycles each one after that many requests. Call :meth:`close` to stop
+    them.
+    """
 
     def __init__(
         self,
@@ -58,12 +333,28 @@ class StdioMCPValidator:
         *,
         env: Optional[Mapping[str, str]] = None,
         timeout: float = 10.0,
+        persistent: bool = False,
+        workers: int = 1,
+        max_requests: Optional[int] = None,
     ) -> None:
         if not command:
             raise ValueError("command must include at least one argument")
+        if workers <= 0:
+            raise ValueError("workers must be a positive integer")
+        if workers > 1 and not persistent:
+            raise ValueError("workers > 1 requires persistent=True")
         self._command: Sequence[str] = tuple(command)
         self._env = dict(env) if env is not None else None
         self._timeout = timeout
+        self._adapter: Union[_PersistentAdapter, _AdapterPool, None] = None
+        if workers > 1:
+            self._adapter = _AdapterPool(
+                self._command, self._combined_env(), workers=workers, max_requests=max_requests
+            )
+        elif persistent:
+            self._adapter = _PersistentAdapter(
+                self._command, self._combined_env(), max_requests=max_requests
+            )
 
     def _combined_env(self) -> Optional[MutableMapping[str, str]]:
         if self._env is None:
@@ -72,14 +363,40 @@ class StdioMCPValidator:
         merged.update(self._env)
         return merged
 
+    def close(self) -> None:
+        if self._adapter is not None:
+            self._adapter.close()
+
     def validate(self, asset: Dict[str, Any]) -> Dict[str, Any]:
         """Send *asset* to the MCP adapter and return the validation payload."""
 
+        return unwrap_response(self._round_trip(validate_request(asset)))
+
+    def validate_many(
+        self,
+        assets: Sequence[Mapping[str, Any]],
+        *,
+        batch_limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Validate *assets* via ``validate_many``, one adapter round trip per chunk.
+
+        With a worker pool, chunks are validated concurrently across workers.
+        """
+
+        parallelism = len(self._adapter) if isinstance(self._adapter, _AdapterPool) else 1
+        return _validate_in_batches(
+            self._round_trip, assets, batch_limit=batch_limit, parallelism=parallelism
+        )
+
+    def _round_trip(self, request_payload: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            request_bytes = encode_payload(_jsonrpc_request(asset))
+            request_bytes = encode_payload(request_payload)
         except PayloadTooLargeError as exc:
             raise MCPUnavailableError(f"MCP request payload too large: {exc}") from exc
 
+        if self._adapter is not None:
+            return self._adapter.request(request_payload, request_bytes, timeout=self._timeout)
+
         request = request_bytes.decode("utf-8")
         try:
             process = subprocess.Popen(  # noqa: S603 - user-controlled command expected
@@ -119,7 +436,7 @@ class StdioMCPValidator:
         if not isinstance(payload, dict):
             raise MCPUnavailableError("Invalid MCP response payload")
 
-        return _unwrap_jsonrpc(payload)
+        return payload
 
 
 class SocketMCPValidator:
@@ -134,8 +451,20 @@ class SocketMCPValidator:
     def validate(self, asset: Dict[str, Any]) -> Dict[str, Any]:
         """Send *asset* to the MCP socket server and return the validation payload."""
 
+        return unwrap_response(self._round_trip(validate_request(asset)))
+
+    def validate_many(
+        self,
+        assets: Sequence[Mapping[str, Any]],
+        *,
+        batch_limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Validate *assets* via ``validate_many``, one connection per chunk."""
+
+        return _validate_in_batches(self._round_trip, assets, batch_limit=batch_limit)
+
+    def _round_trip(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            payload = _jsonrpc_request(asset)
             with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
                 client.settimeout(self._timeout)
                 client.connect(self._path)
@@ -156,7 +485,26 @@ class SocketMCPValidator:
             raise MCPUnavailableError(f"Invalid MCP response: {exc}") from exc
         if not isinstance(response, dict):
             raise MCPUnavailableError("Invalid MCP response payload")
-        return _unwrap_jsonrpc(response)
+        return response
+
+
+def _validate_in_batches(
+    round_trip: Callable[[Dict[str, Any]], Dict[str, Any]],
+    assets: Sequence[Mapping[str, Any]],
+    *,
+    batch_limit: Optional[int],
+    parallelism: int = 1,
+) -> List[Dict[str, Any]]:
+    def _run(chunk: List[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        return unwrap_batch_items(round_trip(validate_many_request(chunk)), len(chunk))
+
+    chunks = list(iter_payload_batches(assets, max_items=batch_limit))
+    if parallelism > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=min(parallelism, len(chunks))) as executor:
+            chunk_results = list(executor.map(_run, chunks))
+    else:
+        chunk_results = [_run(chunk) for chunk in chunks]
+    return [item for items in chunk_results for item in items]
 
 
 def resolve_mcp_endpoint() -> str:
@@ -165,16 +513,57 @@ def resolve_mcp_endpoint() -> str:
     endpoint_raw = os.getenv("MCP_ENDPOINT", "").strip().lower()
     if endpoint_raw in {"", None}:
         return "tcp"
-    if endpoint_raw in {"stdio", "socket", "tcp"}:
+    if endpoint_raw in {"stdio", "socket", "tcp", "shm"}:
         return endpoint_raw
     return "tcp"
 
 
+def _positive_int_env(name: str, *, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise MCPUnavailableError(f"{name} must be an integer") from exc
+    if value < 0:
+        raise MCPUnavailableError(f"{name} must not be negative")
+    return value or default
+
+
 def build_validator_from_env(*, timeout: float = 10.0) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
     """Construct an MCP validator from environment configuration."""
 
+    return build_transport_from_env(timeout=timeout).validate
+
+
+def build_transport_from_env(
+    *, timeout: float = 10.0
+) -> Union[
+    StdioMCPValidator,
+    SocketMCPValidator,
+    "TcpMCPValidator",
+    "BalancedMCPValidator",
+    "SharedMemoryMCPValidator",
+]:
+    """Construct the MCP transport client selected by environment configuration.
+
+    The returned object exposes ``validate(asset)`` and, for the bundled
+    transports, ``validate_many(assets, batch_limit=...)``. Unless the STDIO
+    transport is selected, a non-empty ``MCP_ENDPOINTS`` list takes precedence
+    over ``MCP_HOST``/``MCP_PORT`` and ``MCP_SOCKET_PATH`` and yields a
+    :class:`labs.mcp.balancer.BalancedMCPValidator`.
+    """
+
     endpoint = resolve_mcp_endpoint()
 
+    if endpoint != "stdio":
+        from labs.mcp.balancer import balanced_validator_from_env
+
+        balanced = balanced_validator_from_env(timeout=timeout)
+        if balanced is not None:
+            return balanced
+
     if endpoint == "stdio":
         command_value = os.getenv("MCP_ADAPTER_CMD")
         if not command_value:
@@ -193,8 +582,20 @@ def build_validator_from_env(*, timeout: float = 10.0) -> Callable[[Dict[str, An
                 _SCHEMAS_WARNING_EMITTED = True
             env_overrides["SYN_SCHEMAS_DIR"] = normalize_resource_path(schemas_dir)
 
-        validator = StdioMCPValidator(command, env=env_overrides or None, timeout=timeout)
-        return validator.validate
+        persistent_raw = os.getenv("MCP_ADAPTER_PERSISTENT", "").strip().lower()
+        persistent = persistent_raw in {"1", "true", "yes", "on"}
+        workers = _positive_int_env("MCP_ADAPTER_WORKERS", default=1)
+        if workers > 1 and not persistent:
+            raise MCPUnavailableError("MCP_ADAPTER_WORKERS > 1 requires MCP_ADAPTER_PERSISTENT=1")
+        max_requests = _positive_int_env("MCP_ADAPTER_MAX_REQUESTS", default=0)
+        return StdioMCPValidator(
+            command,
+            env=env_overrides or None,
+            timeout=timeout,
+            persistent=persistent,
+            workers=workers,
+            max_requests=max_requests or None,
+        )
 
     if endpoint == "socket":
         socket_path_raw = os.getenv("MCP_SOCKET_PATH")
@@ -204,8 +605,19 @@ def build_validator_from_env(*, timeout: float = 10.0) -> Callable[[Dict[str, An
                 "MCP_SOCKET_PATH environment variable is required when MCP_ENDPOINT=socket"
             )
 
-        validator = SocketMCPValidator(socket_path, timeout=timeout)
-        return validator.validate
+        return SocketMCPValidator(socket_path, timeout=timeout)
+
+    if endpoint == "shm":
+        socket_path_raw = os.getenv("MCP_SOCKET_PATH")
+        socket_path = normalize_resource_path(socket_path_raw) if socket_path_raw else None
+        if not socket_path:
+            raise MCPUnavailableError(
+                "MCP_SOCKET_PATH environment variable is required when MCP_ENDPOINT=shm"
+            )
+
+        from labs.mcp.shm import SharedMemoryMCPValidator
+
+        return SharedMemoryMCPValidator(socket_path, timeout=timeout)
 
     if endpoint == "tcp":
         host = os.getenv("MCP_HOST", "127.0.0.1").strip()
@@ -226,8 +638,7 @@ def build_validator_from_env(*, timeout: float = 10.0) -> Callable[[Dict[str, An
 
         from labs.mcp.tcp_client import TcpMCPValidator
 
-        validator = TcpMCPValidator(host.strip(), port, timeout=timeout)
-        return validator.validate
+        return TcpMCPValidator(host.strip(), port, timeout=timeout)
 
     raise MCPUnavailableError(f"Unsupported MCP_ENDPOINT value: {endpoint}")
 
@@ -236,6 +647,7 @@ __all__ = [
     "MCPUnavailableError",
     "SocketMCPValidator",
     "StdioMCPValidator",
+    "build_transport_from_env",
     "build_validator_from_env",
     "resolve_mcp_endpoint",
 ]
@@ -41,6 +41,56 @@ def _success_response(request: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _batch_response(request: Dict[str, Any]) -> Dict[str, Any]:
+    params = request.get("params")
+    assets = params.get("assets", []) if isinstance(params, dict) else []
+    items = [
+        {
+            "status": "ok",
+            "asset_id": asset.get("asset_id") if isinstance(asset, dict) else None,
+            "issues": [],
+        }
+        for asset in assets
+    ]
+    return {
+        "jsonrpc": "2.0",
+        "id": request.get("id"),
+        "result": {"ok": True, "reason": "validation_passed", "items": items},
+    }
+
+
+def _handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Dispatch *request* to the stub's ``validate`` or ``validate_many`` handler."""
+
+    if request.get("jsonrpc") == "2.0" and request.get("method") == "validate_many":
+        return _batch_response(request)
+    return _success_response(request)
+
+
+def _serve_loop(*, fail: bool = False) -> int:
+    """Answer newline-delimited requests from stdin until it closes."""
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        if fail:
+            print("stub failure requested", file=sys.stderr)
+            return 1
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            response: Dict[str, Any] = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32700, "message": f"parse error: {exc}"},
+            }
+        else:
+            response = _handle_request(request)
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Stub MCP adapter for Labs")
     parser.add_argument(
@@ -48,8 +98,16 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Force the stub to exit with a non-zero status after reading the request.",
     )
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Keep serving newline-delimited requests until stdin closes.",
+    )
     args = parser.parse_args(argv)
 
+    if args.loop:
+        return _serve_loop(fail=args.fail)
+
     try:
         request = _load_request()
     except Exception as exc:  # pragma: no cover - defensive input guard
@@ -60,7 +118,7 @@ def main(argv: list[str] | None = None) -> int:
         print("stub failure requested", file=sys.stderr)
         return 1
 
-    response = _success_response(request)
+    response = _handle_request(request)
     print(json.dumps(response))
     return 0
 
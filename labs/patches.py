@@ -5,7 +5,7 @@ from __future__ import annotations
 import datetime as _dt
 import os
 import uuid
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from labs.agents.critic import CriticAgent
 from labs.logging import log_jsonl
@@ -74,8 +74,14 @@ def apply_patch(
     *,
     critic: Optional[CriticAgent] = None,
     log_path: str = _DEFAULT_PATCH_LOG,
+    base_valid: bool = False,
 ) -> Dict[str, Any]:
-    """Apply *patch* onto *asset*, validate via critic, and log the operation."""
+    """Apply *patch* onto *asset*, validate via critic, and log the operation.
+
+    Pass ``base_valid=True`` when *asset* is known to pass validation; the
+    critic is then told which top-level keys the patch changed so validators
+    supporting incremental checks only re-validate those subtrees.
+    """
 
     updates = patch.get("updates", {})
     patched_asset: Dict[str, Any] = dict(asset)
@@ -85,8 +91,14 @@ def apply_patch(
     patched_asset.setdefault("asset_id", asset.get("asset_id"))
     patch_id = patch.get("id")
 
+    changed: Optional[List[str]] = None
+    if base_valid and isinstance(updates, Mapping):
+        changed = [str(key) for key in updates]
+        if "asset_id" not in asset:
+            changed.append("asset_id")
+
     critic = critic or CriticAgent()
-    review = critic.review(dict(patched_asset), patch_id=patch_id)
+    review = critic.review(dict(patched_asset), patch_id=patch_id, changed=changed)
 
     record = {
         "action": "apply",
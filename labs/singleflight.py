@@ -0,0 +1,100 @@
+"""Coalesce concurrent duplicate calls so only one caller performs the work."""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """Book-keeping for a single in-flight invocation."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share the result of an in-flight call with concurrent duplicate callers.
+
+    The first caller for a given key runs the supplied function; callers that
+    arrive with the same key while it is running block until it completes and
+    receive an independent copy of its result (or the same exception). Once
+    the call finishes the key is released, so later callers start a new flight.
+    """
+
+    def __init__(self, *, copier: Callable[[Any], Any] = copy.deepcopy) -> None:
+        self._copier = copier
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._counters = {"calls": 0, "executions": 0, "hits": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run *fn* once for *key*, sharing its outcome with concurrent callers."""
+
+        with self._lock:
+            self._counters["calls"] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._counters["hits"] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._counters["executions"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return self._copier(call.result)
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            call.error = exc
+            self._release(key, call)
+            raise
+
+        if self._release(key, call, pending=True):
+            # Snapshot before handing the original back so followers never
+            # observe mutations made by the leader's caller.
+            call.result = self._copier(result)
+        call.done.set()
+        return result
+
+    def _release(self, key: Hashable, call: _Call, *, pending: bool = False) -> bool:
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+            waiters = call.waiters
+        if not pending:
+            call.done.set()
+        return waiters > 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters describing how many calls were coalesced."""
+
+        with self._lock:
+            snapshot = dict(self._counters)
+            snapshot["in_flight"] = len(self._calls)
+        return snapshot
+
+
+def flight_key(*parts: Any) -> str:
+    """Return a stable, hashable key for *parts* (which may include dicts)."""
+
+    return json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+
+
+__all__ = ["SingleFlight", "flight_key"]
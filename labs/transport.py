@@ -3,11 +3,29 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Mapping
+import struct
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+try:  # pragma: no cover - optional dependency
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
 
 MAX_PAYLOAD_BYTES = 1024 * 1024
 _DELIMITER = b"\n"
 
+FRAMING_NEWLINE = "newline"
+FRAMING_LENGTH = "length-prefixed"
+FRAMING_METHOD = "labs.framing"
+LENGTH_HEADER = struct.Struct(">I")
+MIN_CHUNK = 64 * 1024
+
+CODEC_JSON = "json"
+CODEC_JSON_COMPACT = "json-compact"
+CODEC_ZLIB = "zlib"
+CODEC_MSGPACK = "msgpack"
+
 
 class PayloadTooLargeError(RuntimeError):
     """Raised when a transport payload exceeds the configured size limit."""
@@ -33,16 +51,63 @@ def encode_payload(payload: Mapping[str, Any]) -> bytes:
     return data + _DELIMITER
 
 
-def decode_payload(data: bytes) -> Dict[str, Any]:
-    """Decode transport *data* into a JSON object enforcing the size cap."""
+def encode_frame(
+    payload: Mapping[str, Any],
+    framing: str = FRAMING_NEWLINE,
+    codec: Optional["Codec"] = None,
+) -> bytes:
+    """Serialize *payload* for the wire using *framing* and *codec*.
 
-    if data.endswith(_DELIMITER):
-        data = data[:-1]
-    _ensure_under_limit(data)
+    Newline framing appends the delimiter; length-prefixed framing prepends a
+    4-byte big-endian body length instead. Binary codecs can only travel
+    length-prefixed since their bodies may contain the delimiter.
+    """
+
+    if codec is None or codec.name == CODEC_JSON:
+        if framing != FRAMING_LENGTH:
+            return encode_payload(payload)
+        text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        data = text.encode("utf-8")
+        _ensure_under_limit(data)
+    else:
+        data = codec.encode(payload)
+        if framing != FRAMING_LENGTH:
+            if codec.binary:
+                raise ValueError(f"codec {codec.name!r} requires length-prefixed framing")
+            return data + _DELIMITER
+    return LENGTH_HEADER.pack(len(data)) + data
+
+
+def decode_payload(
+    data: Union[bytes, bytearray, memoryview],
+    codec: Optional["Codec"] = None,
+) -> Dict[str, Any]:
+    """Decode transport *data* into a JSON object enforcing the size cap.
+
+    ``json.loads`` reads the bytes directly (a trailing delimiter is plain
+    whitespace to it), so the body is not sliced or decoded separately. A
+    ``memoryview`` (e.g. a shared-memory ring slot) is decoded straight to
+    text without an intermediate ``bytes`` copy. Other codecs enforce the
+    cap on the decoded size themselves.
+    """
+
+    if codec is not None and codec.name != CODEC_JSON:
+        loaded = codec.decode(data)
+        if not isinstance(loaded, dict):
+            raise InvalidPayloadError("transport payload must decode to a JSON object")
+        return loaded
+
+    size = len(data)
+    if size and data[-1:] == _DELIMITER:
+        size -= 1
+    if size > MAX_PAYLOAD_BYTES:
+        raise PayloadTooLargeError(
+            f"payload size {size} bytes exceeds cap of {MAX_PAYLOAD_BYTES} bytes"
+        )
     try:
-        loaded = json.loads(data.decode("utf-8"))
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
-        snippet = data[:200].decode("utf-8", errors="replace")
+        loaded = json.loads(str(data, "utf-8") if isinstance(data, memoryview) else data)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:  # pragma: no cover - defensive guard
+        snippet = bytes(data[:200]).decode("utf-8", errors="replace")
         raise InvalidPayloadError(f"invalid JSON payload: {exc}: {snippet}") from exc
 
     if not isinstance(loaded, dict):
@@ -50,42 +115,414 @@ def decode_payload(data: bytes) -> Dict[str, Any]:
     return loaded
 
 
-def read_message(sock) -> bytes:
-    """Read a newline-delimited message from *sock* enforcing the size cap."""
-
-    chunks = bytearray()
-    while True:
-        chunk = sock.recv(4096)
-        if not chunk:
-            raise ConnectionError("socket closed before newline-delimited payload was received")
-        chunks.extend(chunk)
-        if len(chunks) > MAX_PAYLOAD_BYTES + len(_DELIMITER):
+class Codec:
+    """Turns JSON-RPC payloads into frame bodies and back.
+
+    ``encode`` enforces :data:`MAX_PAYLOAD_BYTES` on the uncompressed
+    encoding and ``decode`` enforces it on the decoded size, so compression
+    never raises the effective cap. ``binary`` codecs need length-prefixed
+    framing.
+    """
+
+    name = CODEC_JSON
+    binary = False
+
+    def encode(self, payload: Mapping[str, Any]) -> bytes:
+        text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        data = text.encode("utf-8")
+        _ensure_under_limit(data)
+        return data
+
+    def decode(self, data: Union[bytes, bytearray, memoryview]) -> Any:
+        _ensure_under_limit(data)
+        try:
+            return json.loads(str(data, "utf-8") if isinstance(data, memoryview) else data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            snippet = bytes(data[:200]).decode("utf-8", errors="replace")
+            raise InvalidPayloadError(f"invalid JSON payload: {exc}: {snippet}") from exc
+
+
+class CompactJsonCodec(Codec):
+    """JSON without key sorting or ASCII escaping; cheaper to produce."""
+
+    name = CODEC_JSON_COMPACT
+
+    def encode(self, payload: Mapping[str, Any]) -> bytes:
+        data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        _ensure_under_limit(data)
+        return data
+
+
+class ZlibCodec(CompactJsonCodec):
+    """Deflate-compressed compact JSON."""
+
+    name = CODEC_ZLIB
+    binary = True
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def encode(self, payload: Mapping[str, Any]) -> bytes:
+        return zlib.compress(super().encode(payload), self.level)
+
+    def decode(self, data: Union[bytes, bytearray, memoryview]) -> Any:
+        inflater = zlib.decompressobj()
+        try:
+            raw = inflater.decompress(data, MAX_PAYLOAD_BYTES + 1)
+        except zlib.error as exc:
+            raise InvalidPayloadError(f"invalid compressed payload: {exc}") from exc
+        if len(raw) > MAX_PAYLOAD_BYTES or inflater.unconsumed_tail:
             raise PayloadTooLargeError(
-                f"payload size {len(chunks)} bytes exceeds cap of {MAX_PAYLOAD_BYTES} bytes"
+                f"decompressed payload exceeds cap of {MAX_PAYLOAD_BYTES} bytes"
             )
-        if chunks.endswith(_DELIMITER):
-            break
-    return bytes(chunks)
+        if not inflater.eof:
+            raise InvalidPayloadError("invalid compressed payload: truncated stream")
+        return super().decode(raw)
+
+
+class MsgpackCodec(Codec):
+    """MessagePack bodies; registered only when ``msgpack`` is installed."""
+
+    name = CODEC_MSGPACK
+    binary = True
+
+    def encode(self, payload: Mapping[str, Any]) -> bytes:
+        data = msgpack.packb(payload, use_bin_type=True)
+        _ensure_under_limit(data)
+        return data
+
+    def decode(self, data: Union[bytes, bytearray, memoryview]) -> Any:
+        _ensure_under_limit(data)
+        try:
+            return msgpack.unpackb(data, raw=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise InvalidPayloadError(f"invalid msgpack payload: {exc}") from exc
+
+
+_CODECS: Dict[str, Codec] = {
+    CODEC_JSON: Codec(),
+    CODEC_JSON_COMPACT: CompactJsonCodec(),
+    CODEC_ZLIB: ZlibCodec(),
+}
+if msgpack is not None:  # pragma: no cover - optional dependency
+    _CODECS[CODEC_MSGPACK] = MsgpackCodec()
+
+
+def available_codecs() -> Tuple[str, ...]:
+    """Return the names of the codecs usable in this process."""
+
+    return tuple(_CODECS)
+
+
+def get_codec(name: str) -> Codec:
+    """Return the registered codec called *name*."""
+
+    try:
+        return _CODECS[name]
+    except KeyError:
+        raise ValueError(f"unsupported codec: {name}") from None
+
+
+def select_codec(preferences: Sequence[Any], framing: str) -> Codec:
+    """Pick the first codec in *preferences* usable with *framing*.
+
+    Falls back to plain JSON when nothing in the list is available.
+    """
+
+    for name in preferences:
+        codec = _CODECS.get(name) if isinstance(name, str) else None
+        if codec is not None and (framing == FRAMING_LENGTH or not codec.binary):
+            return codec
+    return _CODECS[CODEC_JSON]
+
+
+def iter_payload_batches(
+    items: Iterable[Mapping[str, Any]],
+    *,
+    max_items: Optional[int] = None,
+    max_bytes: int = MAX_PAYLOAD_BYTES,
+    envelope_bytes: int = 256,
+) -> Iterator[List[Mapping[str, Any]]]:
+    """Split *items* into batches that respect *max_items* and *max_bytes*.
+
+    Sizes are measured on the compact JSON encoding used by
+    :func:`encode_payload`; *envelope_bytes* reserves room for the surrounding
+    request. An item that alone exceeds the budget is yielded by itself so the
+    caller surfaces the usual :class:`PayloadTooLargeError`.
+    """
+
+    budget = max_bytes - envelope_bytes
+    batch: List[Mapping[str, Any]] = []
+    batch_bytes = 0
+    for item in items:
+        size = len(json.dumps(item, sort_keys=True, separators=(",", ":")).encode("utf-8")) + 1
+        full = max_items is not None and len(batch) >= max_items
+        if batch and (full or batch_bytes + size > budget):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(item)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
+def split_frame(
+    buffer: Union[bytes, bytearray],
+    start: int = 0,
+    *,
+    framing: str = FRAMING_NEWLINE,
+    scanned: int = 0,
+) -> Tuple[Optional[bytes], int]:
+    """Return the next complete frame in *buffer* starting at offset *start*.
+
+    Buffer-level counterpart of :class:`MessageReader` for callers that do
+    their own reads, such as selector loops. Returns ``(frame, offset)``.
+    When a frame is complete, *frame* is its body (newline frames keep the
+    delimiter, which :func:`decode_payload` ignores) and *offset* is where
+    the next frame starts. Otherwise *frame* is ``None`` and *offset* is how
+    far the buffer has been searched for a delimiter; pass it back as
+    *scanned* once more bytes arrive. Frames over
+    :data:`MAX_PAYLOAD_BYTES` raise :class:`PayloadTooLargeError`.
+    """
+
+    if framing == FRAMING_LENGTH:
+        if len(buffer) - start < LENGTH_HEADER.size:
+            return None, scanned
+        (length,) = LENGTH_HEADER.unpack_from(buffer, start)
+        if length > MAX_PAYLOAD_BYTES:
+            raise PayloadTooLargeError(
+                f"payload size {length} bytes exceeds cap of {MAX_PAYLOAD_BYTES} bytes"
+            )
+        end = start + LENGTH_HEADER.size + length
+        if len(buffer) < end:
+            return None, scanned
+        return bytes(buffer[start + LENGTH_HEADER.size : end]), end
+
+    index = buffer.find(_DELIMITER, max(start, scanned))
+    if index < 0:
+        if len(buffer) - start > MAX_PAYLOAD_BYTES + len(_DELIMITER):
+            raise PayloadTooLargeError(
+                f"payload size {len(buffer) - start} bytes exceeds cap of {MAX_PAYLOAD_BYTES} bytes"
+            )
+        return None, len(buffer)
+    end = index + len(_DELIMITER)
+    return bytes(buffer[start:end]), end
+
+
+class MessageReader:
+    """Buffered frame reader for a connected stream socket.
+
+    Reads use ``recv_into`` on one reusable buffer whose request size doubles
+    (up to the payload cap) whenever a read fills it, so large messages take
+    few syscalls. In newline mode only newly received bytes are scanned for
+    the delimiter. In length-prefixed mode the 4-byte header gives the body
+    size and the remainder of the body is read with exact-size
+    ``recv_into`` calls, with no scanning at all. Bytes past the end of one
+    message are kept for the next, so pipelined payloads are never lost.
+    """
+
+    def __init__(
+        self,
+        sock,
+        *,
+        framing: str = FRAMING_NEWLINE,
+        chunk_size: int = MIN_CHUNK,
+        max_chunk: int = MAX_PAYLOAD_BYTES,
+    ) -> None:
+        if framing not in {FRAMING_NEWLINE, FRAMING_LENGTH}:
+            raise ValueError(f"unsupported framing: {framing}")
+        self._sock = sock
+        self.framing = framing
+        self._chunk = max(1, chunk_size)
+        self._max_chunk = max(self._chunk, max_chunk)
+        self._buffer = bytearray(self._chunk)
+        self._start = 0
+        self._end = 0
+        self._scanned = 0
+
+    @property
+    def buffered(self) -> int:
+        return self._end - self._start
+
+    def read(self) -> Optional[bytes]:
+        """Return the next message body, or ``None`` on a clean close."""
+
+        if self.framing == FRAMING_LENGTH:
+            return self._read_length_prefixed()
+        return self._read_delimited()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            message = self.read()
+            if message is None:
+                return
+            yield message
+
+    def _fill(self) -> int:
+        """Receive into the free tail of the buffer, growing/compacting as needed."""
+
+        if self._start and self._start == self._end:
+            self._start = self._end = self._scanned = 0
+        free = len(self._buffer) - self._end
+        if free < self._chunk:
+            if self._start:
+                pending = self._end - self._start
+                self._buffer[:pending] = self._buffer[self._start : self._end]
+                self._scanned -= self._start
+                self._start, self._end = 0, pending
+            free = len(self._buffer) - self._end
+            if free < self._chunk:
+                self._buffer.extend(bytes(self._chunk - free))
+        view = memoryview(self._buffer)[self._end : self._end + self._chunk]
+        try:
+            received = self._sock.recv_into(view, self._chunk)
+        finally:
+            view.release()
+        if received == self._chunk and self._chunk < self._max_chunk:
+            self._chunk = min(self._chunk * 2, self._max_chunk)
+        self._end += received
+        return received
+
+    def _take(self, length: int) -> bytes:
+        message = bytes(self._buffer[self._start : self._start + length])
+        self._start += length
+        self._scanned = self._start
+        return message
+
+    def _read_delimited(self) -> Optional[bytes]:
+        while True:
+            index = self._buffer.find(_DELIMITER, max(self._scanned, self._start), self._end)
+            if index >= 0:
+                if index - self._start > MAX_PAYLOAD_BYTES:
+                    raise PayloadTooLargeError(
+                        f"payload size {index - self._start} bytes exceeds cap of {MAX_PAYLOAD_BYTES} bytes"
+                    )
+                return self._take(index - self._start + 1)
+            self._scanned = self._end
+            if self._end - self._start > MAX_PAYLOAD_BYTES + len(_DELIMITER):
+                raise PayloadTooLargeError(
+                    f"payload size {self._end - self._start} bytes exceeds cap of {MAX_PAYLOAD_BYTES} bytes"
+                )
+            if not self._fill():
+                if self._end > self._start:
+                    raise ConnectionError("socket closed before newline-delimited payload was received")
+                return None
+
+    def _read_length_prefixed(self) -> Optional[bytes]:
+        header_size = LENGTH_HEADER.size
+        while self._end - self._start < header_size:
+            if not self._fill():
+                if self._end > self._start:
+                    raise ConnectionError("socket closed before length-prefixed header was received")
+                return None
+        (length,) = LENGTH_HEADER.unpack_from(self._buffer, self._start)
+        if length > MAX_PAYLOAD_BYTES:
+            raise PayloadTooLargeError(
+                f"payload size {length} bytes exceeds cap of {MAX_PAYLOAD_BYTES} bytes"
+            )
+        self._start += header_size
+        available = self._end - self._start
+        if available >= length:
+            return self._take(length)
+
+        body = bytearray(length)
+        body[:available] = self._buffer[self._start : self._end]
+        self._start = self._end = self._scanned = 0
+        view = memoryview(body)
+        try:
+            received = available
+            while received < length:
+                count = self._sock.recv_into(view[received:], length - received)
+                if not count:
+                    raise ConnectionError("socket closed before length-prefixed payload was received")
+                received += count
+        finally:
+            view.release()
+        return bytes(body)
+
+
+def read_message(sock) -> bytes:
+    """Read a newline-delimited message from *sock* enforcing the size cap.
+
+    This one-shot helper discards anything received after the delimiter; use
+    :class:`MessageReader` for connections that carry several messages.
+    """
+
+    message = MessageReader(sock).read()
+    if message is None:
+        raise ConnectionError("socket closed before newline-delimited payload was received")
+    return message
+
+
+def iter_messages(sock, *, chunk_size: int = MIN_CHUNK, framing: str = FRAMING_NEWLINE) -> Iterator[bytes]:
+    """Yield messages from *sock* until the peer closes it.
+
+    Unlike :func:`read_message`, bytes received past a delimiter are kept for
+    the next message, so pipelined payloads sharing one ``recv`` survive.
+    """
+
+    return iter(MessageReader(sock, framing=framing, chunk_size=chunk_size))
+
+
+def write_message(
+    sock,
+    payload: Mapping[str, Any],
+    *,
+    framing: str = FRAMING_NEWLINE,
+    codec: Optional[Codec] = None,
+) -> None:
+    """Send *payload* over *sock* using *framing* (newline-delimited by default)."""
+
+    sock.sendall(encode_frame(payload, framing, codec))
+
 
+def framing_request(
+    framing: str = FRAMING_LENGTH,
+    codecs: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Return the handshake asking a server to switch to *framing*.
 
-def write_message(sock, payload: Mapping[str, Any]) -> None:
-    """Send *payload* over *sock* using the newline-delimited framing."""
+    *codecs* lists wire codecs in order of preference; the server answers
+    with the first one it supports (plain JSON when none match). The
+    handshake itself travels newline-framed JSON; servers that do not know
+    ``labs.framing`` answer ``method not found`` and the connection stays on
+    newline framing.
+    """
 
-    data = encode_payload(payload)
-    totalsent = 0
-    while totalsent < len(data):
-        sent = sock.send(data[totalsent:])
-        if sent == 0:
-            raise ConnectionError("socket connection broken during send")
-        totalsent += sent
+    params: Dict[str, Any] = {"framing": framing}
+    if codecs:
+        params["codecs"] = list(codecs)
+    return {"jsonrpc": "2.0", "id": FRAMING_METHOD, "method": FRAMING_METHOD, "params": params}
 
 
 __all__ = [
+    "CODEC_JSON",
+    "CODEC_JSON_COMPACT",
+    "CODEC_MSGPACK",
+    "CODEC_ZLIB",
+    "Codec",
+    "CompactJsonCodec",
+    "FRAMING_LENGTH",
+    "FRAMING_METHOD",
+    "FRAMING_NEWLINE",
+    "LENGTH_HEADER",
     "MAX_PAYLOAD_BYTES",
+    "MIN_CHUNK",
     "InvalidPayloadError",
+    "MessageReader",
+    "MsgpackCodec",
     "PayloadTooLargeError",
+    "ZlibCodec",
+    "available_codecs",
     "decode_payload",
+    "encode_frame",
     "encode_payload",
+    "framing_request",
+    "get_codec",
+    "iter_messages",
+    "iter_payload_batches",
     "read_message",
+    "select_codec",
+    "split_frame",
     "write_message",
 ]
@@ -8,11 +8,16 @@ repository.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
+import threading
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+from .dereference import Dereferencer, RefResolutionError
 
 JsonDict = Dict[str, object]
 
@@ -29,11 +34,11 @@ def _default_schema_root() -> Path:
     return _repo_root() / "meta" / "schemas"
 
 
-def _iter_schema_roots() -> Iterator[Path]:
-    """Yield schema directories in priority order."""
+def _schema_root_candidates(env_value: str) -> List[Path]:
+    """Return every schema directory candidate in priority order, existing or not."""
 
     seen: set[Path] = set()
-    env_value = os.getenv("SYN_SCHEMAS_DIR", "").strip()
+    roots: List[Path] = []
     if env_value:
         for chunk in env_value.split(os.pathsep):
             if not chunk:
@@ -47,8 +52,7 @@ def _iter_schema_roots() -> Iterator[Path]:
             if resolved in seen:
                 continue
             seen.add(resolved)
-            if resolved.exists() and resolved.is_dir():
-                yield resolved
+            roots.append(resolved)
 
     candidates: List[Path] = []
     candidates.append(_default_schema_root())
@@ -72,8 +76,16 @@ def _iter_schema_roots() -> Iterator[Path]:
         if resolved in seen:
             continue
         seen.add(resolved)
-        if resolved.exists() and resolved.is_dir():
-            yield resolved
+        roots.append(resolved)
+    return roots
+
+
+def _iter_schema_roots() -> Iterator[Path]:
+    """Yield schema directories in priority order."""
+
+    for root in _schema_root_candidates(os.getenv("SYN_SCHEMAS_DIR", "").strip()):
+        if root.exists() and root.is_dir():
+            yield root
 
 
 def _version_key(version: Optional[str]) -> Tuple[int, int, int, int]:
@@ -104,11 +116,6 @@ def _iter_schema_files(root: Path) -> Iterator[Tuple[Path, Optional[str]]]:
             yield entry, None
 
 
-def _load_schema(path: Path) -> JsonDict:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
-
-
 def _build_response(
     *,
     name: str,
@@ -117,6 +124,7 @@ def _build_response(
     schema: Optional[JsonDict] = None,
     ok: bool = True,
     reason: Optional[str] = None,
+    resolution: str = "preserve",
 ) -> JsonDict:
     payload: JsonDict = {
         "ok": ok,
@@ -126,14 +134,27 @@ def _build_response(
     }
     if schema is not None:
         payload["schema"] = schema
+    if resolution != "preserve":
+        payload["resolution"] = resolution
     if reason:
         payload["reason"] = reason
     return payload
 
 
-def _catalog_schemas() -> Dict[str, List[Tuple[Optional[str], Path]]]:
-    catalog: Dict[str, List[Tuple[Optional[str], Path]]] = {}
-    for root in _iter_schema_roots():
+Catalog = Dict[str, List[Tuple[Optional[str], Path]]]
+
+
+def _version_directories(root: Path) -> List[Path]:
+    try:
+        entries = [entry for entry in root.iterdir() if entry.is_dir()]
+    except OSError:
+        return []
+    return sorted(entry for entry in entries if _SEMVER_PATTERN.match(entry.name))
+
+
+def _scan_catalog(roots: List[Path]) -> Catalog:
+    catalog: Catalog = {}
+    for root in roots:
         for schema_path, version in _iter_schema_files(root):
             name = schema_path.name[:-len(_SCHEMA_SUFFIX)]
             catalog.setdefault(name, []).append((version, schema_path))
@@ -142,13 +163,173 @@ def _catalog_schemas() -> Dict[str, List[Tuple[Optional[str], Path]]]:
     return catalog
 
 
-def list_schemas() -> JsonDict:
-    """Return a summary of all discoverable schemas."""
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
 
-    catalog = _catalog_schemas()
-    if not catalog:
-        return {"ok": False, "reason": "schema_directory_unavailable"}
 
+class _CatalogIndex:
+    """In-memory ``name -> versions -> path`` index plus parsed-schema cache.
+
+    The index is rebuilt only when ``SYN_SCHEMAS_DIR`` changes or the mtime
+    of a watched directory (every root candidate and every semver-named
+    version directory, empty or not, seen in the last scan) changes, since
+    adding, removing or renaming a schema file updates its directory's
+    mtime. Validating the index costs one ``stat`` per watched directory,
+    independent of the number of schemas.
+
+    Parsed schemas are reused while the file's ``(mtime_ns, size)`` is
+    unchanged; when the stat changes the file is re-read and re-parsed only
+    if its SHA-256 differs. Cached schemas are shared between callers and
+    must be treated as read-only.
+
+    ``inline``/``bundled`` forms are cached per (path, resolution) together
+    with the SHA-256 of every file their ``$ref`` chain touched, so each form
+    is computed once per schema version and recomputed only when one of
+    those files changes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._env: Optional[str] = None
+        self._candidates: List[Path] = []
+        self._watched: List[Tuple[Path, Optional[int]]] = []
+        self._catalog: Catalog = {}
+        self._summary: Optional[Dict[str, JsonDict]] = None
+        self._schemas: Dict[Path, Tuple[int, int, str, JsonDict]] = {}
+        self._resolved: Dict[Tuple[Path, str], Tuple[Dict[Path, str], JsonDict]] = {}
+        self.scans = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._env = None
+            self._watched = []
+            self._catalog = {}
+            self._summary = None
+            self._schemas.clear()
+            self._resolved.clear()
+
+    def roots(self) -> List[Path]:
+        self.catalog()
+        with self._lock:
+            return [root for root in self._candidates if root.is_dir()]
+
+    def catalog(self) -> Catalog:
+        env_value = os.getenv("SYN_SCHEMAS_DIR", "").strip()
+        with self._lock:
+            unchanged = all(_mtime_ns(path) == mtime for path, mtime in self._watched)
+            if env_value == self._env and unchanged:
+                return self._catalog
+            if env_value != self._env:
+                self._candidates = _schema_root_candidates(env_value)
+            watched = [(root, _mtime_ns(root)) for root in self._candidates]
+            roots = [root for root, mtime in watched if mtime is not None and root.is_dir()]
+            catalog = _scan_catalog(roots)
+            # Watch empty version directories too, so a schema written into one is picked up.
+            for root in roots:
+                directories = _version_directories(root)
+                watched.extend((directory, _mtime_ns(directory)) for directory in directories)
+            self._env, self._watched, self._catalog = env_value, watched, catalog
+            self._summary = None
+            self.scans += 1
+            return catalog
+
+    def summary(self) -> Dict[str, JsonDict]:
+        catalog = self.catalog()
+        with self._lock:
+            if self._summary is None or catalog is not self._catalog:
+                self._summary = _summarise(catalog)
+            return self._summary
+
+    def load(self, path: Path) -> JsonDict:
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._schemas.get(path)
+        if cached is not None and cached[:2] == signature:
+            return cached[3]
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if cached is not None and cached[2] == digest:
+            schema = cached[3]
+        else:
+            schema = json.loads(data)
+        with self._lock:
+            self._schemas[path] = (signature[0], signature[1], digest, schema)
+        return schema
+
+    def digest(self, path: Path) -> str:
+        self.load(path)
+        with self._lock:
+            return self._schemas[path][2]
+
+    def resolved(self, path: Path, resolution: str) -> JsonDict:
+        """Return the schema at *path* in *resolution* (``preserve`` is the file as-is)."""
+
+        schema = self.load(path)
+        if resolution == "preserve":
+            return schema
+        key = (path, resolution)
+        with self._lock:
+            cached = self._resolved.get(key)
+        if cached is not None and all(
+            self.digest(dependency) == digest for dependency, digest in cached[0].items()
+        ):
+            return cached[1]
+
+        # One dereferencer per root file: schema versions often share an ``$id``,
+        # so documents keyed by URI must never leak between roots.
+        referenced: List[Path] = []
+
+        def load_ref(uri: str) -> JsonDict:
+            target = self.path_for_uri(uri)
+            referenced.append(target)
+            return self.load(target)
+
+        dereferencer = Dereferencer(load_ref)
+        base_uri = path.resolve().as_uri()
+        if resolution == "inline":
+            result = dereferencer.inline(schema, base_uri=base_uri)
+        else:
+            result = dereferencer.bundle(schema, base_uri=base_uri)
+
+        dependencies = {target: self.digest(target) for target in (path, *referenced)}
+        with self._lock:
+            self._resolved[key] = (dependencies, result)
+        return result
+
+    def path_for_uri(self, uri: str) -> Path:
+        """Map a ``$ref`` document URI onto a file in the schema roots or a ``file:`` path."""
+
+        parsed = urlparse(uri)
+        if parsed.scheme == "file":
+            return Path(unquote(parsed.path))
+        if parsed.scheme not in {"http", "https"}:
+            raise ValueError(f"unsupported $ref target: {uri}")
+        segments = [segment for segment in parsed.path.split("/") if segment]
+        if not segments:
+            raise ValueError(f"unsupported $ref target: {uri}")
+        filename = segments[-1]
+        versions = [segment for segment in segments[:-1] if _SEMVER_PATTERN.match(segment)]
+        for root in self.roots():
+            candidates = [root / versions[-1] / filename] if versions else []
+            candidates.append(root / filename)
+            for candidate in candidates:
+                if candidate.is_file():
+                    return candidate
+        raise FileNotFoundError(f"schema_not_found:{uri}")
+
+
+_CATALOG = _CatalogIndex()
+
+
+def _catalog_schemas() -> Catalog:
+    return _CATALOG.catalog()
+
+
+def _summarise(catalog: Catalog) -> Dict[str, JsonDict]:
     summary: Dict[str, JsonDict] = {}
     for name, versions in catalog.items():
         entries: List[JsonDict] = []
@@ -162,6 +343,15 @@ def list_schemas() -> JsonDict:
             "versions": entries,
             "latest": entries[-1]["version"],
         }
+    return summary
+
+
+def list_schemas() -> JsonDict:
+    """Return a summary of all discoverable schemas (served from the catalog index)."""
+
+    summary = _CATALOG.summary()
+    if not summary:
+        return {"ok": False, "reason": "schema_directory_unavailable"}
 
     return {"ok": True, "schemas": summary}
 
@@ -181,9 +371,16 @@ def get_schema(
     *,
     resolution: Optional[str] = None,
 ) -> JsonDict:
-    """Load a schema by *name*, preferring the highest available version."""
+    """Load a schema by *name*, preferring the highest available version.
 
-    _normalise_resolution(resolution)
+    ``resolution`` selects the form of ``schema``: ``preserve`` (default) is
+    the file as-is, ``inline`` has every ``$ref`` expanded in place, and
+    ``bundled`` keeps only local references with cross-file targets copied
+    into ``$defs``. The returned ``schema`` comes from the catalog's caches
+    and is shared with other callers; copy it before mutating.
+    """
+
+    mode = _normalise_resolution(resolution)
 
     if not isinstance(name, str) or not name.strip():
         raise ValueError("schema name must be a non-empty string")
@@ -202,15 +399,25 @@ def get_schema(
             fallback_requested = True
             if not candidates:
                 # Fallback to direct filesystem check in case the cache missed it
-                for root in _iter_schema_roots():
+                for root in _CATALOG.roots():
                     candidate_path = root / version / f"{normalized}{_SCHEMA_SUFFIX}"
                     if candidate_path.exists():
-                        schema_data = _load_schema(candidate_path)
+                        try:
+                            schema_data = _CATALOG.resolved(candidate_path, mode)
+                        except RefResolutionError as exc:
+                            return _build_response(
+                                name=normalized,
+                                version=version,
+                                source=candidate_path,
+                                ok=False,
+                                reason=f"schema_resolution_failed:{exc}",
+                            )
                         response = _build_response(
                             name=normalized,
                             version=version,
                             source=candidate_path,
                             schema=schema_data,
+                            resolution=mode,
                         )
                         response["requested_version"] = version
                         return response
@@ -234,7 +441,15 @@ def get_schema(
     # Choose the last entry because the catalog is sorted in ascending order.
     selected_version, selected_path = candidates[-1]
     try:
-        schema_payload = _load_schema(selected_path)
+        schema_payload = _CATALOG.resolved(selected_path, mode)
+    except RefResolutionError as exc:
+        return _build_response(
+            name=normalized,
+            version=selected_version,
+            source=selected_path,
+            ok=False,
+            reason=f"schema_resolution_failed:{exc}",
+        )
     except OSError as exc:
         return _build_response(
             name=normalized,
@@ -249,19 +464,27 @@ def get_schema(
         version=selected_version,
         source=selected_path,
         schema=schema_payload,
+        resolution=mode,
     )
     if fallback_requested and version and selected_version != version:
         payload["requested_version"] = version
     return payload
 
 
-def validate_many(assets, *, strict: bool = True):
+def validate_many(
+    assets,
+    *,
+    strict: bool = True,
+    processes: Optional[int] = None,
+    chunksize: Optional[int] = None,
+):
     """Validate a batch of assets via the local schema catalogue.
 
     The upstream MCP package exposes ``validate_many`` with transport-backed
     behaviour.  For the local compatibility layer we defer to the in-repo
     validator so that the call signature matches tests without depending on the
-    external adapter binary.
+    external adapter binary. ``processes > 1`` validates in a pool of worker
+    processes (``chunksize`` assets per task); results keep the input order.
     """
 
     from typing import Iterable, MutableMapping  # local import to avoid cycle
@@ -277,12 +500,22 @@ def validate_many(assets, *, strict: bool = True):
     except ImportError as exc:  # pragma: no cover - defensive: labs module missing
         raise RuntimeError("labs.mcp.validate unavailable") from exc
 
-    for candidate in assets:
-        if not isinstance(candidate, MutableMapping):
-            raise TypeError("each asset must be a mutable mapping")
-        result = validate_asset(candidate)
-        ok = ok and bool(result.get("ok"))
-        results.append(result)
+    if processes is not None and processes > 1:
+        from labs.mcp.parallel import validate_chunks  # noqa: WPS433 - intentional local import
+
+        candidates = list(assets)
+        for candidate in candidates:
+            if not isinstance(candidate, MutableMapping):
+                raise TypeError("each asset must be a mutable mapping")
+        results = validate_chunks(candidates, processes=processes, chunksize=chunksize)
+        ok = all(bool(result.get("ok")) for result in results)
+    else:
+        for candidate in assets:
+            if not isinstance(candidate, MutableMapping):
+                raise TypeError("each asset must be a mutable mapping")
+            result = validate_asset(candidate)
+            ok = ok and bool(result.get("ok"))
+            results.append(result)
 
     payload: JsonDict = {"ok": ok, "items": results}
     payload["reason"] = "validation_passed" if ok else "validation_failed"
@@ -0,0 +1,305 @@
+"""``$ref`` dereferencing for the ``inline`` and ``bundled`` schema resolutions.
+
+``inline`` replaces every ``$ref`` with the schema it points at, so the
+result carries no references at all (required by consumers such as Azure
+that reject remote ``$ref``). ``bundled`` keeps references but makes them
+all local: the root schema plus a ``$defs`` section holding every
+cross-file target. Only JSON-pointer fragments are supported; ``$anchor``
+references raise :class:`RefResolutionError`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from pathlib import PurePosixPath
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import unquote, urldefrag, urljoin, urlparse
+
+JsonDict = Dict[str, Any]
+Loader = Callable[[str], Any]
+RefKey = Tuple[str, str]
+
+ROOT_URI = "urn:labs:schema-root"
+# Keywords whose values are instance data, never subschemas.
+_DATA_KEYWORDS = frozenset({"const", "enum", "default", "examples"})
+_DEFS_KEYWORDS = ("$defs", "definitions")
+_MISSING = object()
+
+
+class RefResolutionError(ValueError):
+    """Raised when a ``$ref`` cannot be located."""
+
+
+class CyclicRefError(RefResolutionError):
+    """Raised when inlining would recurse forever through a reference cycle."""
+
+
+def contains_refs(node: Any) -> bool:
+    """Return whether *node* has a ``$ref`` in any schema position."""
+
+    if isinstance(node, Mapping):
+        if isinstance(node.get("$ref"), str):
+            return True
+        return any(key not in _DATA_KEYWORDS and contains_refs(value) for key, value in node.items())
+    if isinstance(node, list):
+        return any(contains_refs(item) for item in node)
+    return False
+
+
+def _join(base: str, ref: str) -> str:
+    # ``urljoin`` ignores the base for non-hierarchical schemes such as ``urn:``.
+    if ref.startswith("#"):
+        return urldefrag(base)[0] + ref
+    return urljoin(base, ref)
+
+
+def _pointer_tokens(pointer: str) -> Iterator[str]:
+    if not pointer:
+        return
+    if not pointer.startswith("/"):
+        raise RefResolutionError(f"invalid JSON pointer: {pointer}")
+    for token in pointer[1:].split("/"):
+        yield token.replace("~1", "/").replace("~0", "~")
+
+
+class Dereferencer:
+    """Resolve ``$ref`` across documents fetched by *loader* (URI → parsed JSON).
+
+    Documents are loaded once per URI. Inlined reference targets are memoised
+    per ``(document URI, pointer)``, so a definition used many times within
+    one root document is expanded once and then shared. The memo lives as
+    long as the instance; ``mcp.core`` uses one per root schema file, since
+    schema versions may share an ``$id``. Results share structure and must
+    be treated as read-only.
+    """
+
+    def __init__(self, loader: Loader) -> None:
+        self._loader = loader
+        self._lock = threading.RLock()
+        self._documents: Dict[str, Any] = {}
+        self._resources: Dict[str, RefKey] = {}
+        self._inline_memo: Dict[RefKey, Any] = {}
+
+    @property
+    def documents(self) -> List[str]:
+        """URIs of every document loaded or registered so far."""
+
+        with self._lock:
+            return list(self._documents)
+
+    def add_document(self, uri: str, document: Any) -> None:
+        """Register *document* under *uri*; a different document for a known URI raises."""
+
+        with self._lock:
+            known = self._documents.get(uri, _MISSING)
+            if known is not _MISSING:
+                if known is not document and known != document:
+                    raise RefResolutionError(f"conflicting documents for {uri}")
+                return
+            self._documents[uri] = document
+            self._index_resources(document, uri, uri, "")
+
+    def inline(self, schema: JsonDict, *, base_uri: Optional[str] = None) -> JsonDict:
+        """Return *schema* with every ``$ref`` replaced by its (recursively inlined) target.
+
+        A ``$ref`` with sibling keywords becomes an ``allOf`` entry so none of
+        the constraints are lost. Root ``$defs``/``definitions`` are dropped.
+        """
+
+        root_uri = self._root_uri(schema, base_uri)
+        with self._lock:
+            self.add_document(root_uri, schema)
+            result = self._inline(schema, root_uri, ((root_uri, ""),))
+        if isinstance(result, dict):
+            result = {key: value for key, value in result.items() if key not in _DEFS_KEYWORDS}
+        return result
+
+    def bundle(self, schema: JsonDict, *, base_uri: Optional[str] = None) -> JsonDict:
+        """Return *schema* with cross-file targets copied into ``$defs`` and every ``$ref`` made local."""
+
+        root_uri = self._root_uri(schema, base_uri)
+        defs: Dict[str, Any] = {}
+        existing = schema.get("$defs") if isinstance(schema.get("$defs"), Mapping) else {}
+        names: Dict[RefKey, str] = {}
+        with self._lock:
+            self.add_document(root_uri, schema)
+            bundled = self._bundle(schema, root_uri, root_uri, defs, names, set(existing), top=True)
+        if defs:
+            bundled["$defs"] = {**bundled.get("$defs", {}), **defs}
+        return bundled
+
+    @staticmethod
+    def _root_uri(schema: Mapping[str, Any], base_uri: Optional[str]) -> str:
+        schema_id = schema.get("$id") if isinstance(schema, Mapping) else None
+        if base_uri:
+            base = base_uri
+        else:
+            # Anonymous roots are keyed by content so distinct schemas never share a document slot.
+            digest = hashlib.sha256(json.dumps(schema, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+            base = f"{ROOT_URI}:{digest[:16]}"
+        uri = urljoin(base, schema_id) if isinstance(schema_id, str) and schema_id else base
+        return urldefrag(uri)[0]
+
+    def _index_resources(self, node: Any, base: str, document: str, pointer: str) -> None:
+        if isinstance(node, Mapping):
+            schema_id = node.get("$id")
+            if isinstance(schema_id, str) and schema_id and pointer:
+                base = urldefrag(urljoin(base, schema_id))[0]
+                self._resources.setdefault(base, (document, pointer))
+            for key, value in node.items():
+                if key not in _DATA_KEYWORDS:
+                    token = key.replace("~", "~0").replace("/", "~1")
+                    self._index_resources(value, base, document, f"{pointer}/{token}")
+        elif isinstance(node, list):
+            for index, item in enumerate(node):
+                self._index_resources(item, base, document, f"{pointer}/{index}")
+
+    def _locate(self, ref: str, base: str) -> Tuple[RefKey, Any, str]:
+        """Return ``((document, pointer), node, base URI in effect at node)`` for *ref*."""
+
+        uri, fragment = urldefrag(_join(base, ref))
+        if uri not in self._documents and uri not in self._resources:
+            try:
+                document = self._loader(uri)
+            except RefResolutionError:
+                raise
+            except (OSError, ValueError) as exc:
+                raise RefResolutionError(f"cannot load $ref target {uri}: {exc}") from exc
+            self.add_document(uri, document)
+
+        if uri in self._documents:
+            document_uri, prefix = uri, ""
+        else:
+            document_uri, prefix = self._resources[uri]
+        fragment = unquote(fragment)
+        if fragment and not fragment.startswith("/"):
+            raise RefResolutionError(f"unsupported anchor reference: {ref}")
+
+        pointer = prefix + fragment
+        node: Any = self._documents[document_uri]
+        node_base = document_uri
+        for token in _pointer_tokens(pointer):
+            if isinstance(node, Mapping):
+                schema_id = node.get("$id")
+                if isinstance(schema_id, str) and schema_id and node is not self._documents[document_uri]:
+                    node_base = urljoin(node_base, schema_id)
+                if token not in node:
+                    raise RefResolutionError(f"unresolvable $ref {ref}: missing {token!r}")
+                node = node[token]
+            elif isinstance(node, list):
+                try:
+                    node = node[int(token)]
+                except (ValueError, IndexError):
+                    raise RefResolutionError(f"unresolvable $ref {ref}: bad index {token!r}") from None
+            else:
+                raise RefResolutionError(f"unresolvable $ref {ref}")
+        return (document_uri, pointer), node, node_base
+
+    def _inline(self, node: Any, base: str, stack: Tuple[RefKey, ...]) -> Any:
+        if isinstance(node, list):
+            return [self._inline(item, base, stack) for item in node]
+        if not isinstance(node, Mapping):
+            return node
+
+        schema_id = node.get("$id")
+        if isinstance(schema_id, str) and schema_id:
+            base = urljoin(base, schema_id)
+        out: JsonDict = {}
+        for key, value in node.items():
+            if key == "$ref" and isinstance(value, str):
+                continue
+            out[key] = value if key in _DATA_KEYWORDS else self._inline(value, base, stack)
+
+        ref = node.get("$ref")
+        if not isinstance(ref, str):
+            return out
+        target = self._inline_ref(ref, base, stack)
+        if not out:
+            return target
+        out["allOf"] = [*out.get("allOf", []), target]
+        return out
+
+    def _inline_ref(self, ref: str, base: str, stack: Tuple[RefKey, ...]) -> Any:
+        key, node, node_base = self._locate(ref, base)
+        memo = self._inline_memo.get(key, _MISSING)
+        if memo is not _MISSING:
+            return memo
+        if key in stack:
+            raise CyclicRefError(f"cyclic $ref cannot be inlined: {key[0]}#{key[1]}")
+        result = self._inline(node, node_base, stack + (key,))
+        self._inline_memo[key] = result
+        return result
+
+    def _bundle(
+        self,
+        node: Any,
+        base: str,
+        root_uri: str,
+        defs: Dict[str, Any],
+        names: Dict[RefKey, str],
+        taken: set,
+        *,
+        top: bool = False,
+    ) -> Any:
+        if isinstance(node, list):
+            return [self._bundle(item, base, root_uri, defs, names, taken) for item in node]
+        if not isinstance(node, Mapping):
+            return node
+
+        schema_id = node.get("$id")
+        if isinstance(schema_id, str) and schema_id and not top:
+            base = urljoin(base, schema_id)
+        out: JsonDict = {}
+        for key, value in node.items():
+            if key == "$id" and not top:
+                # Nested resources are flattened into the root, so every local pointer is root-relative.
+                continue
+            if key == "$ref" and isinstance(value, str):
+                out[key] = self._bundle_ref(value, base, root_uri, defs, names, taken)
+            elif key in _DATA_KEYWORDS:
+                out[key] = value
+            else:
+                out[key] = self._bundle(value, base, root_uri, defs, names, taken)
+        return out
+
+    def _bundle_ref(
+        self,
+        ref: str,
+        base: str,
+        root_uri: str,
+        defs: Dict[str, Any],
+        names: Dict[RefKey, str],
+        taken: set,
+    ) -> str:
+        key, node, node_base = self._locate(ref, base)
+        document_uri, pointer = key
+        if document_uri == root_uri:
+            return "#" + pointer
+        name = names.get(key)
+        if name is None:
+            name = names[key] = self._def_name(document_uri, pointer, taken)
+            defs[name] = None  # reserve before descending so cycles resolve to the same name
+            defs[name] = self._bundle(node, node_base, root_uri, defs, names, taken)
+        return f"#/$defs/{name}"
+
+    @staticmethod
+    def _def_name(document_uri: str, pointer: str, taken: set) -> str:
+        stem = PurePosixPath(urlparse(document_uri).path).name or "schema"
+        for suffix in (".schema.json", ".json"):
+            if stem.endswith(suffix):
+                stem = stem[: -len(suffix)]
+                break
+        raw = stem + pointer.replace("/", ".") if pointer else stem
+        base_name = re.sub(r"[^A-Za-z0-9_.-]", "_", raw).strip(".") or "schema"
+        name, counter = base_name, 2
+        while name in taken:
+            name = f"{base_name}-{counter}"
+            counter += 1
+        taken.add(name)
+        return name
+
+
+__all__ = ["CyclicRefError", "Dereferencer", "RefResolutionError", "contains_refs"]
@@ -5,6 +5,15 @@ from __future__ import annotations
 import pathlib
 import sys
 
+import pytest
+
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_schema_cache(tmp_path, monkeypatch):
+    """Keep the on-disk schema descriptor cache inside each test's tmp dir."""
+
+    monkeypatch.setenv("LABS_SCHEMA_CACHE_DIR", str(tmp_path / "schema-cache"))
@@ -0,0 +1,144 @@
+"""Tests for the asyncio MCP transport and validators."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+from typing import Any, Dict
+
+import pytest
+
+from labs.agents.generator import GeneratorAgent
+from labs.async_transport import STREAM_LIMIT, read_message, write_message
+from labs.mcp import socket_main, tcp_main
+from labs.mcp.async_client import AsyncSocketMCPValidator, AsyncTcpMCPValidator, validate_all
+from labs.mcp.exceptions import MCPUnavailableError
+from labs.transport import FRAMING_LENGTH, MAX_PAYLOAD_BYTES, PayloadTooLargeError, decode_payload
+
+
+def _asset(prompt: str = "async asset") -> Dict[str, Any]:
+    return GeneratorAgent(schema_version="0.7.4").propose(prompt, seed=3)
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.fixture
+def tcp_server():
+    try:
+        server = tcp_main.create_server("127.0.0.1", 0, max_workers=4)
+    except PermissionError:  # pragma: no cover - sandbox restriction
+        pytest.skip("TCP sockets are not permitted in this sandbox")
+    thread = _serve(server)
+    yield server
+    server.shutdown(timeout=2.0)
+    thread.join(timeout=2.0)
+
+
+@pytest.mark.parametrize("framing", [None, FRAMING_LENGTH])
+def test_async_read_write_round_trip(framing) -> None:
+    async def _run():
+        left, right = socket.socketpair()
+        reader, writer = await asyncio.open_connection(sock=left, limit=STREAM_LIMIT)
+        peer_reader, peer_writer = await asyncio.open_connection(sock=right, limit=STREAM_LIMIT)
+        kwargs = {"framing": framing} if framing else {}
+        payload = {"id": 1, "data": "z" * 300_000}
+        await write_message(writer, payload, **kwargs)
+        await write_message(writer, {"id": 2}, **kwargs)
+        writer.close()
+        messages = [await read_message(peer_reader, **kwargs) for _ in range(3)]
+        peer_writer.close()
+        return payload, messages
+
+    payload, messages = asyncio.run(_run())
+
+    assert decode_payload(messages[0]) == payload
+    assert decode_payload(messages[1]) == {"id": 2}
+    assert messages[2] is None
+
+
+def test_async_read_message_enforces_cap() -> None:
+    async def _run():
+        left, right = socket.socketpair()
+        reader, _ = await asyncio.open_connection(sock=left, limit=STREAM_LIMIT)
+        sender = threading.Thread(target=right.sendall, args=(b"x" * (MAX_PAYLOAD_BYTES + 10),), daemon=True)
+        sender.start()
+        try:
+            with pytest.raises(PayloadTooLargeError):
+                await read_message(reader)
+        finally:
+            right.close()
+
+    asyncio.run(_run())
+
+
+def test_async_tcp_validator_pipelines_many_requests(tcp_server) -> None:
+    host, port = tcp_server.address[:2]
+    assets = [_asset(f"asset {index}") for index in range(4)] * 50
+
+    async def _run():
+        async with AsyncTcpMCPValidator(host, port, timeout=10.0) as validator:
+            results = await validate_all(validator, assets, concurrency=200)
+            batch = await validator.validate_many([assets[0], {"name": "bad"}], batch_limit=1)
+            return results, batch, validator.connects
+
+    results, batch, connects = asyncio.run(_run())
+
+    assert len(results) == 200 and all(result["ok"] for result in results)
+    assert [item["ok"] for item in batch] == [True, False]
+    assert connects == 1
+
+
+def test_async_tcp_validator_negotiates_codec(tcp_server) -> None:
+    host, port = tcp_server.address[:2]
+
+    async def _run():
+        async with AsyncTcpMCPValidator(host, port, timeout=5.0, codecs=["zlib"]) as validator:
+            result = await validator.validate(_asset())
+            return result, validator._channel.codec.name
+
+    result, codec = asyncio.run(_run())
+
+    assert result["ok"] is True
+    assert codec == "zlib"
+
+
+def test_async_tcp_validator_errors() -> None:
+    async def _run():
+        validator = AsyncTcpMCPValidator("127.0.0.1", 65530, timeout=2.0)
+        with pytest.raises(MCPUnavailableError, match="connection error"):
+            await validator.validate({"asset_id": "missing"})
+        with pytest.raises(MCPUnavailableError, match="too large"):
+            await AsyncSocketMCPValidator("/nonexistent.sock").validate({"data": "x" * (MAX_PAYLOAD_BYTES + 10)})
+
+    asyncio.run(_run())
+
+
+def test_async_socket_validator(tmp_path) -> None:
+    path = str(tmp_path / "mcp.sock")
+    try:
+        server = socket_main.create_server(path, max_workers=4)
+    except (PermissionError, OSError) as exc:  # pragma: no cover - sandbox restriction
+        pytest.skip(f"Unix domain sockets unavailable: {exc}")
+    thread = _serve(server)
+
+    async def _run():
+        validator = AsyncSocketMCPValidator(path, timeout=5.0)
+        results = await validate_all(validator, [_asset()] * 20, concurrency=10)
+        batch = await validator.validate_many([_asset(), {"name": "bad"}])
+        return results, batch
+
+    try:
+        results, batch = asyncio.run(_run())
+    finally:
+        server.shutdown(timeout=2.0)
+        thread.join(timeout=2.0)
+
+    assert all(result["ok"] for result in results)
+    assert [item["ok"] for item in batch] == [True, False]
+    with pytest.raises(MCPUnavailableError, match="unavailable"):
+        asyncio.run(AsyncSocketMCPValidator(path, timeout=1.0).validate(_asset()))
@@ -0,0 +1,158 @@
+"""Tests for the multi-endpoint MCP balancer."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List
+
+import pytest
+
+from labs.mcp.balancer import BalancedMCPValidator, parse_endpoint
+from labs.mcp.exceptions import MCPMethodNotFoundError, MCPUnavailableError
+from labs.mcp_stdio import SocketMCPValidator, build_transport_from_env
+
+
+class _FakeClient:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.seen: List[Dict[str, Any]] = []
+        self.down = False
+        self.closed = False
+
+    def validate(self, asset: Dict[str, Any]) -> Dict[str, Any]:
+        if self.down:
+            raise MCPUnavailableError(f"{self.name} is down")
+        self.seen.append(asset)
+        return {"ok": True, "endpoint": self.name, "asset_id": asset.get("asset_id")}
+
+    def validate_many(self, assets, *, batch_limit=None) -> List[Dict[str, Any]]:
+        return [self.validate(asset) for asset in assets]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _balancer(count: int = 3, **kwargs):
+    clients = [_FakeClient(f"e{index}") for index in range(count)]
+    return BalancedMCPValidator([(client.name, client) for client in clients], **kwargs), clients
+
+
+def test_least_outstanding_rotates_across_idle_endpoints() -> None:
+    balancer, clients = _balancer()
+
+    endpoints = [balancer.validate({"asset_id": str(index)})["endpoint"] for index in range(6)]
+
+    assert endpoints == ["e0", "e1", "e2", "e0", "e1", "e2"]
+
+
+def test_least_outstanding_prefers_fewest_in_flight() -> None:
+    balancer, clients = _balancer(count=2)
+    release = threading.Event()
+    entered = threading.Event()
+    original = clients[0].validate
+
+    def _slow(asset):
+        entered.set()
+        release.wait(timeout=5.0)
+        return original(asset)
+
+    clients[0].validate = _slow
+    worker = threading.Thread(target=balancer.validate, args=({"asset_id": "slow"},))
+    worker.start()
+    entered.wait(timeout=5.0)
+    endpoints = [balancer.validate({"asset_id": str(index)})["endpoint"] for index in range(3)]
+    release.set()
+    worker.join(timeout=5.0)
+
+    assert endpoints == ["e1", "e1", "e1"]
+
+
+def test_hash_strategy_keeps_assets_on_one_endpoint() -> None:
+    balancer, clients = _balancer(count=4, strategy="hash")
+    assets = [{"asset_id": f"a{index}"} for index in range(40)]
+
+    first = [balancer.validate(asset)["endpoint"] for asset in assets]
+    second = [balancer.validate(asset)["endpoint"] for asset in assets]
+    batch = balancer.validate_many(assets)
+
+    assert first == second == [item["endpoint"] for item in batch]
+    assert [item["asset_id"] for item in batch] == [asset["asset_id"] for asset in assets]
+    assert len(set(first)) > 1
+
+
+def test_failing_endpoint_is_ejected_and_readmitted() -> None:
+    clock = _Clock()
+    balancer, clients = _balancer(count=2, ejection=5.0, clock=clock)
+    clients[0].down = True
+
+    results = [balancer.validate({"asset_id": str(index)}) for index in range(4)]
+    stats = {entry["endpoint"]: entry for entry in balancer.stats()}
+
+    assert all(result["endpoint"] == "e1" for result in results)
+    assert stats["e0"]["healthy"] is False and stats["e0"]["failures"] == 1
+
+    clients[0].down = False
+    clock.now += 5.0
+    endpoints = {balancer.validate({"asset_id": str(index)})["endpoint"] for index in range(4)}
+
+    assert endpoints == {"e0", "e1"}
+    assert all(entry["healthy"] for entry in balancer.stats())
+
+
+def test_all_endpoints_down_raises_and_backoff_grows() -> None:
+    clock = _Clock()
+    balancer, clients = _balancer(count=2, ejection=1.0, max_ejection=3.0, clock=clock)
+    for client in clients:
+        client.down = True
+
+    for _ in range(3):
+        with pytest.raises(MCPUnavailableError, match="All MCP endpoints failed"):
+            balancer.validate({"asset_id": "x"})
+
+    clock.now += 2.0
+    assert not any(entry["healthy"] for entry in balancer.stats())
+    clock.now += 1.0
+    assert all(entry["healthy"] for entry in balancer.stats())
+
+
+def test_method_not_found_propagates_without_ejection() -> None:
+    balancer, clients = _balancer(count=2)
+
+    def _missing(assets, *, batch_limit=None):
+        raise MCPMethodNotFoundError("no validate_many")
+
+    clients[0].validate_many = _missing
+    with pytest.raises(MCPMethodNotFoundError):
+        balancer.validate_many([{"asset_id": "a"}])
+    assert all(entry["healthy"] for entry in balancer.stats())
+
+
+def test_parse_endpoint_forms() -> None:
+    assert parse_endpoint("tcp://127.0.0.1:9000")[0] == "tcp:127.0.0.1:9000"
+    assert parse_endpoint("localhost:9001")[0] == "tcp:localhost:9001"
+    name, client = parse_endpoint("unix:///tmp/mcp.sock")
+    assert name == "unix:/tmp/mcp.sock" and isinstance(client, SocketMCPValidator)
+    assert parse_endpoint("/tmp/other.sock")[0] == "unix:/tmp/other.sock"
+    with pytest.raises(MCPUnavailableError):
+        parse_endpoint("no-port")
+
+
+def test_build_transport_from_env_uses_endpoint_list(monkeypatch) -> None:
+    monkeypatch.setenv("MCP_ENDPOINT", "tcp")
+    monkeypatch.setenv("MCP_ENDPOINTS", "127.0.0.1:9000, unix:///tmp/mcp.sock")
+    monkeypatch.setenv("MCP_BALANCE", "hash")
+
+    transport = build_transport_from_env(timeout=1.0)
+
+    assert isinstance(transport, BalancedMCPValidator)
+    assert transport.strategy == "hash"
+    assert [entry["endpoint"] for entry in transport.stats()] == ["tcp:127.0.0.1:9000", "unix:/tmp/mcp.sock"]
+    transport.close()
@@ -0,0 +1,56 @@
+"""Tests for frozen JSON values and zero-copy schema descriptors."""
+
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from labs.frozen import FrozenDict, FrozenList, freeze, thaw
+from labs.mcp.client import MCPClient, load_schema_bundle
+
+
+def test_freeze_is_recursive_read_only_and_hashable() -> None:
+    frozen = freeze({"a": [1, {"b": 2}], "c": {"d": None}})
+
+    assert isinstance(frozen, dict) and isinstance(frozen["a"], FrozenList)
+    assert isinstance(frozen["a"][1], FrozenDict)
+    assert hash(frozen) == hash(freeze({"c": {"d": None}, "a": [1, {"b": 2}]}))
+    assert freeze(frozen) is frozen
+    for mutate in (
+        lambda: frozen.__setitem__("x", 1),
+        lambda: frozen.update(x=1),
+        lambda: frozen.pop("a"),
+        lambda: frozen["a"].append(3),
+        lambda: frozen["c"].setdefault("e", 1),
+    ):
+        with pytest.raises(TypeError):
+            mutate()
+
+
+def test_frozen_values_serialise_and_thaw() -> None:
+    payload = {"a": [1, {"b": 2}], "c": "x"}
+    frozen = freeze(payload)
+
+    assert json.dumps(frozen, sort_keys=True) == json.dumps(payload, sort_keys=True)
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    for mutable in (thaw(frozen), copy.deepcopy(frozen)):
+        assert mutable == payload and type(mutable) is dict and type(mutable["a"][1]) is dict
+        mutable["a"].append(3)
+    assert frozen["a"] == [1, {"b": 2}]
+
+
+def test_client_descriptor_access_is_zero_copy(monkeypatch) -> None:
+    monkeypatch.setenv("LABS_SCHEMA_CACHE", "0")
+    client = MCPClient()
+
+    descriptor = client.fetch_schema(version="0.7.3")
+
+    assert isinstance(descriptor, FrozenDict)
+    assert client.fetch_schema(version="0.7.3") is descriptor
+    assert client.descriptor is descriptor
+    assert load_schema_bundle(version="0.7.3", client=client) is descriptor["schema"]
+    with pytest.raises(TypeError):
+        descriptor["schema"]["$id"] = "mutated"
@@ -0,0 +1,105 @@
+"""Tests for incremental subtree re-validation after patches."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from labs.agents.critic import CriticAgent
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import validate
+from labs.patches import apply_patch
+
+
+@pytest.fixture(params=["0.7.3", "0.7.4"])
+def base(request):
+    asset = GeneratorAgent(schema_version=request.param).propose("incremental", seed=3)
+    assert validate.validate_asset(asset)["ok"] is True
+    return asset
+
+
+@pytest.fixture(params=["1", "0"], ids=["compiled", "jsonschema"])
+def compiler(request, monkeypatch):
+    monkeypatch.setenv("LABS_SCHEMA_COMPILER", request.param)
+    validate._VALIDATOR_CACHE.clear()
+    yield
+    validate._VALIDATOR_CACHE.clear()
+
+
+_UPDATES = [
+    {"tone": []},
+    {"shader": "nope", "tone": 5},
+    {"tone": {"synth": {"type": 3}}},
+    {"control": {"mappings": "x"}},
+    {"meta_info": {"title": "Patched"}},
+]
+
+
+@pytest.mark.parametrize("updates", _UPDATES)
+def test_incremental_matches_full_validation(base, compiler, updates) -> None:
+    patched = dict(base, **updates)
+
+    assert validate.validate_changes(patched, list(updates)) == validate.validate_asset(patched)
+
+
+def test_pointers_map_to_top_level_keys(base, compiler) -> None:
+    patched = json.loads(json.dumps(base))
+    patched["tone"] = {"synth": {"type": 3}}
+
+    assert validate.validate_changes(patched, ["/tone/synth/type"]) == validate.validate_asset(patched)
+
+
+def test_only_changed_subtrees_are_checked(base, monkeypatch) -> None:
+    validate._VALIDATOR_CACHE.clear()
+    broken_elsewhere = dict(base, shader=7, tone={})
+
+    # An invalid untouched key is not re-checked: the caller vouches for the base.
+    assert validate.validate_changes(broken_elsewhere, ["tone"])["ok"] is True
+    assert validate.validate_asset(broken_elsewhere)["ok"] is False
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [["$schema"], ["/"], ["undeclared_key"], ["prompt_removed"]],
+)
+def test_root_level_changes_fall_back(base, monkeypatch, changed) -> None:
+    calls = []
+    original = validate.validate_asset
+    monkeypatch.setattr(validate, "validate_asset", lambda asset: calls.append(asset) or original(asset))
+    patched = dict(base, undeclared_key=1)
+
+    result = validate.validate_changes(patched, changed)
+
+    assert calls == [patched]
+    assert result == original(patched)
+
+
+def test_schemas_with_other_root_keywords_fall_back(tmp_path, monkeypatch) -> None:
+    schema_path = tmp_path / "bounded.schema.json"
+    schema_path.write_text(json.dumps({"type": "object", "properties": {"a": {}, "b": {}}, "maxProperties": 1}))
+    asset = {"$schema": str(schema_path), "a": 1, "b": 2}
+
+    result = validate.validate_changes(asset, ["b"])
+
+    assert result["ok"] is False
+    assert result["errors"][0]["path"] == "/"
+
+
+def test_apply_patch_with_known_good_base_uses_incremental_path(base, tmp_path) -> None:
+    calls = []
+
+    class RecordingValidator(validate.LocalValidator):
+        def validate_changes(self, asset, changed):
+            calls.append(list(changed))
+            return super().validate_changes(asset, changed)
+
+    critic = CriticAgent(validator=RecordingValidator(), log_path=str(tmp_path / "critic.jsonl"))
+    patch = {"id": "patch-inc", "updates": {"tone": []}}
+
+    full = apply_patch(base, patch, critic=critic, log_path=str(tmp_path / "patches.jsonl"))
+    incremental = apply_patch(base, patch, critic=critic, log_path=str(tmp_path / "patches.jsonl"), base_valid=True)
+
+    assert len(calls) == 1 and calls[0][0] == "tone"
+    assert incremental["review"]["mcp_response"] == full["review"]["mcp_response"]
+    assert incremental["review"]["ok"] is False
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import threading
+import time
 from typing import Any, List
 
 import pytest
@@ -125,3 +128,125 @@ def test_load_schema_bundle_fetches_inline(monkeypatch) -> None:
     load_schema_bundle(version="0.7.3", client=client)
     assert calls[1]["resolution"] == "inline"
     assert calls[1]["force"] is False
+
+
+class _RecordingTransport:
+    def __init__(self, *, batch_supported: bool = True) -> None:
+        self.batch_calls: List[int] = []
+        self.single_calls = 0
+        self.batch_supported = batch_supported
+
+    def validate(self, asset: dict[str, Any]) -> dict[str, Any]:
+        self.single_calls += 1
+        return {"ok": True, "asset_id": asset.get("asset_id")}
+
+    def validate_many(self, assets, *, batch_limit=None) -> List[dict[str, Any]]:
+        from labs.mcp.exceptions import MCPMethodNotFoundError
+
+        if not self.batch_supported:
+            raise MCPMethodNotFoundError("validate_many unsupported")
+        self.batch_calls.append(len(assets))
+        return [{"ok": True, "asset_id": asset.get("asset_id")} for asset in assets]
+
+
+def test_mcp_client_prefers_transport_batch_validation(monkeypatch) -> None:
+    transport = _RecordingTransport()
+    monkeypatch.setattr("labs.mcp_stdio.build_transport_from_env", lambda: transport)
+    client = MCPClient(batch_limit=5)
+
+    assets = [_dummy_asset(f"asset-{index}") for index in range(3)]
+    assets = [dict(asset, **{"$schema": asset["$schema"].replace("0.7.3", "0.7.4")}) for asset in assets]
+    results = client.validate(assets)
+
+    assert transport.batch_calls == [3]
+    assert transport.single_calls == 0
+    assert [item["asset_id"] for item in results] == ["asset-0", "asset-1", "asset-2"]
+
+
+def test_mcp_client_batch_method_not_found_falls_back_per_asset(monkeypatch) -> None:
+    transport = _RecordingTransport(batch_supported=False)
+    monkeypatch.setattr("labs.mcp_stdio.build_transport_from_env", lambda: transport)
+    client = MCPClient(batch_limit=5)
+
+    results = client.validate([_dummy_asset("one"), _dummy_asset("two")])
+
+    assert transport.single_calls == 2
+    assert len(results) == 2
+    assert all(item["ok"] for item in results)
+
+
+class _SlowSingleTransport:
+    def __init__(self, *, fail_on: str | None = None) -> None:
+        self.active = 0
+        self.peak = 0
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def validate(self, asset: dict[str, Any]) -> dict[str, Any]:
+        from labs.mcp.exceptions import MCPUnavailableError
+
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.05)
+            if asset.get("name") == self.fail_on:
+                raise MCPUnavailableError("adapter dropped")
+            return {"ok": True, "name": asset.get("name")}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_mcp_client_parallel_validation_preserves_order(monkeypatch) -> None:
+    transport = _SlowSingleTransport()
+    monkeypatch.setattr("labs.mcp_stdio.build_transport_from_env", lambda: transport)
+    client = MCPClient(batch_limit=10, concurrency=4)
+
+    assets = [_dummy_asset(str(index)) for index in range(8)]
+    results = client.validate(assets)
+
+    assert [item["name"] for item in results] == [f"Asset {index}" for index in range(8)]
+    assert 1 < transport.peak <= 4
+
+
+def test_mcp_client_parallel_unavailable_falls_back_to_core(monkeypatch) -> None:
+    transport = _SlowSingleTransport(fail_on="Asset 2")
+    monkeypatch.setattr("labs.mcp_stdio.build_transport_from_env", lambda: transport)
+    monkeypatch.setattr(
+        "mcp.core.validate_many",
+        lambda payload, *, strict=True: {"ok": True, "items": [{"ok": True, "source": "core"} for _ in payload]},
+    )
+    client = MCPClient(batch_limit=10, concurrency=3)
+
+    results = client.validate([_dummy_asset(str(index)) for index in range(5)])
+
+    assert [item["source"] for item in results] == ["core"] * 5
+    assert client._transport_validator is False
+
+
+def test_mcp_client_concurrency_env(monkeypatch) -> None:
+    monkeypatch.setenv("MCP_VALIDATE_CONCURRENCY", "7")
+    assert MCPClient().concurrency == 7
+    monkeypatch.setenv("MCP_VALIDATE_CONCURRENCY", "bogus")
+    assert MCPClient().concurrency == MCPClient.DEFAULT_VALIDATE_CONCURRENCY
+
+
+def test_mcp_client_legacy_projection_leaves_asset_untouched() -> None:
+    client = MCPClient()
+    asset = _dummy_asset("legacy")
+    asset["rule_bundle"]["meta_info"] = {"provenance": {"trace_id": "t"}, "title": "rules"}
+    asset["prompt"] = "keep me"
+    snapshot = copy.deepcopy(asset)
+
+    prepared = client._prepare_asset_for_validation(asset)
+
+    assert asset == snapshot
+    assert "asset_id" not in prepared and "prompt" not in prepared
+    assert prepared["meta_info"] == {}
+    assert prepared["rule_bundle"] == {"rules": [], "meta_info": {"title": "rules"}}
+    assert prepared["shader"] is asset["shader"]
+    assert prepared["rule_bundle"]["rules"] is asset["rule_bundle"]["rules"]
+
+    current = dict(asset, **{"$schema": "https://schemas.synesthetic.dev/0.7.4/synesthetic-asset.schema.json"})
+    assert client._prepare_asset_for_validation(current) is current
@@ -0,0 +1,104 @@
+"""Tests for the indexed schema catalog in mcp.core."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from mcp import core
+
+
+def _write_schema(root: Path, version: str, payload: dict, name: str = "demo") -> Path:
+    directory = root / version
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.schema.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def schema_root(tmp_path, monkeypatch):
+    root = tmp_path / "schemas"
+    root.mkdir()
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(root))
+    core._CATALOG.clear()
+    yield root
+    core._CATALOG.clear()
+
+
+def test_repeated_calls_reuse_index_and_parsed_schema(schema_root) -> None:
+    _write_schema(schema_root, "1.0.0", {"title": "one"})
+    scans = core._CATALOG.scans
+
+    first = core.get_schema("demo")
+    second = core.get_schema("demo")
+    listing = core.list_schemas()
+
+    assert first["schema"] is second["schema"]
+    assert listing["schemas"]["demo"]["latest"] == "1.0.0"
+    assert core.list_schemas()["schemas"] is listing["schemas"]
+    assert core._CATALOG.scans == scans + 1
+
+
+def test_new_version_directory_invalidates_index(schema_root) -> None:
+    _write_schema(schema_root, "1.0.0", {"title": "one"})
+    assert core.get_schema("demo")["version"] == "1.0.0"
+
+    _write_schema(schema_root, "1.1.0", {"title": "newer"})
+    _bump_mtime(schema_root)
+
+    result = core.get_schema("demo")
+    assert result["version"] == "1.1.0"
+    assert result["schema"] == {"title": "newer"}
+
+
+def test_new_file_in_version_directory_invalidates_index(schema_root) -> None:
+    _write_schema(schema_root, "1.0.0", {"title": "one"})
+    assert "other" not in core.list_schemas()["schemas"]
+
+    _write_schema(schema_root, "1.0.0", {"title": "other"}, name="other")
+    _bump_mtime(schema_root / "1.0.0")
+
+    assert core.get_schema("other")["schema"] == {"title": "other"}
+
+
+def test_file_in_previously_empty_version_directory_is_found(schema_root) -> None:
+    _write_schema(schema_root, "1.0.0", {"title": "one"})
+    (schema_root / "0.2.0").mkdir()
+    assert "b" not in core.list_schemas()["schemas"]
+
+    _write_schema(schema_root, "0.2.0", {"title": "b"}, name="b")
+    _bump_mtime(schema_root / "0.2.0")
+
+    assert core.get_schema("b")["schema"] == {"title": "b"}
+
+
+def test_schema_edits_reparse_only_when_content_changes(schema_root) -> None:
+    path = _write_schema(schema_root, "1.0.0", {"title": "one"})
+    original = core.get_schema("demo")["schema"]
+
+    _bump_mtime(path)
+    assert core.get_schema("demo")["schema"] is original
+
+    path.write_text(json.dumps({"title": "edited"}), encoding="utf-8")
+    _bump_mtime(path)
+    assert core.get_schema("demo")["schema"] == {"title": "edited"}
+
+
+def test_env_change_switches_roots(schema_root, tmp_path, monkeypatch) -> None:
+    _write_schema(schema_root, "1.0.0", {"title": "one"})
+    other = tmp_path / "other"
+    _write_schema(other, "2.0.0", {"title": "two"}, name="elsewhere")
+
+    assert core.get_schema("elsewhere")["ok"] is False
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(other))
+
+    assert core.get_schema("elsewhere")["version"] == "2.0.0"
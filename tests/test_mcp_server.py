@@ -0,0 +1,213 @@
+"""Tests for the shared MCP JSON-RPC server."""
+
+from __future__ import annotations
+
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+import pytest
+
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import socket_main
+from labs.mcp.server import dispatch
+from labs.mcp_stdio import SocketMCPValidator
+from labs.transport import decode_payload, iter_messages, write_message
+
+
+def _asset(prompt: str = "server asset") -> Dict[str, Any]:
+    return GeneratorAgent(schema_version="0.7.4").propose(prompt, seed=5)
+
+
+def _rpc(method: str, params: Dict[str, Any], request_id: str = "1") -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+
+def test_dispatch_validates_with_schema() -> None:
+    valid = dispatch(_rpc("validate", {"asset": _asset()}))
+    invalid = dispatch(_rpc("validate", {"asset": {"name": "no schema"}}))
+
+    assert valid["result"]["ok"] is True
+    assert invalid["result"]["ok"] is False
+    assert invalid["result"]["errors"][0]["path"] == "/$schema"
+
+
+def test_dispatch_validate_many_and_get_schema() -> None:
+    batch = dispatch(_rpc("validate_many", {"assets": [_asset(), {"name": "bad"}]}))
+    schema = dispatch(_rpc("get_schema", {"name": "synesthetic-asset", "version": "0.7.3"}))
+
+    assert [item["ok"] for item in batch["result"]["items"]] == [True, False]
+    assert schema["result"]["version"] == "0.7.3"
+
+
+def test_dispatch_rejects_unknown_methods_and_bad_params() -> None:
+    assert dispatch(_rpc("explode", {}))["error"]["code"] == -32601
+    assert dispatch(_rpc("validate", {"asset": "nope"}))["error"]["code"] == -32602
+
+
+@pytest.fixture
+def socket_server(tmp_path):
+    path = str(tmp_path / "mcp.sock")
+    try:
+        server = socket_main.create_server(path, max_workers=4)
+    except (PermissionError, OSError) as exc:  # pragma: no cover - sandbox restriction
+        pytest.skip(f"Unix domain sockets unavailable: {exc}")
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server, path
+    server.shutdown(timeout=2.0)
+    thread.join(timeout=2.0)
+
+
+def test_socket_server_handles_concurrent_clients(socket_server) -> None:
+    server, path = socket_server
+    validator = SocketMCPValidator(path, timeout=5.0)
+    asset = _asset()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: validator.validate(asset), range(32)))
+
+    assert all(result["ok"] for result in results)
+    assert server.stats()["connections"] == 32
+
+
+def test_socket_server_keeps_connection_open_and_orders_responses(socket_server) -> None:
+    _, path = socket_server
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(5.0)
+        client.connect(path)
+        for index in range(5):
+            write_message(client, _rpc("validate", {"asset": {"name": f"n{index}"}}, request_id=str(index)))
+        messages = iter_messages(client)
+        ids = [decode_payload(next(messages))["id"] for _ in range(5)]
+
+    assert ids == ["0", "1", "2", "3", "4"]
+
+
+def test_socket_server_shutdown_unlinks_path(tmp_path) -> None:
+    path = tmp_path / "mcp.sock"
+    try:
+        server = socket_main.create_server(str(path))
+    except (PermissionError, OSError) as exc:  # pragma: no cover - sandbox restriction
+        pytest.skip(f"Unix domain sockets unavailable: {exc}")
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+
+    assert SocketMCPValidator(str(path)).validate(_asset())["ok"] is True
+    server.shutdown(timeout=1.0)
+    thread.join(timeout=2.0)
+
+    assert not thread.is_alive()
+    assert not path.exists()
+
+
+def _start_tcp_server(**kwargs):
+    from labs.mcp import tcp_main
+
+    try:
+        server = tcp_main.create_server("127.0.0.1", 0, **kwargs)
+    except PermissionError:  # pragma: no cover - sandbox restriction
+        pytest.skip("TCP sockets are not permitted in this sandbox")
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    return server, thread
+
+
+def test_tcp_server_serves_validate_validate_many_and_get_schema() -> None:
+    from labs.mcp.tcp_client import TcpMCPValidator, get_schema_from_mcp
+
+    server, thread = _start_tcp_server(max_workers=4)
+    host, port = server.address[:2]
+    validator = TcpMCPValidator(host, port, timeout=5.0)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: validator.validate(_asset()), range(16)))
+        batch = validator.validate_many([_asset(), {"name": "bad"}])
+        schema = get_schema_from_mcp("synesthetic-asset", version="0.7.4", host=host, port=port)
+    finally:
+        validator.close()
+        server.shutdown(timeout=2.0)
+        thread.join(timeout=2.0)
+
+    assert all(result["ok"] for result in results)
+    assert [item["ok"] for item in batch] == [True, False]
+    assert schema["version"] == "0.7.4"
+    assert server.stats()["connections"] <= 2
+
+
+def test_tcp_server_process_pool_mode() -> None:
+    from labs.mcp.tcp_client import TcpMCPValidator
+
+    server, thread = _start_tcp_server(processes=2)
+    host, port = server.address[:2]
+    validator = TcpMCPValidator(host, port, timeout=30.0)
+    try:
+        result = validator.validate(_asset())
+    finally:
+        validator.close()
+        server.shutdown(timeout=5.0)
+        thread.join(timeout=5.0)
+
+    assert result["ok"] is True
+
+
+def test_tcp_server_negotiates_length_prefixed_framing() -> None:
+    from labs.mcp.tcp_client import TcpMCPValidator
+    from labs.transport import FRAMING_LENGTH
+
+    server, thread = _start_tcp_server(max_workers=2)
+    host, port = server.address[:2]
+    validator = TcpMCPValidator(host, port, timeout=5.0, framing=FRAMING_LENGTH)
+    try:
+        results = [validator.validate(_asset()) for _ in range(3)]
+        batch = validator.validate_many([_asset(), _asset("second")])
+        channel = validator._connection._channel
+    finally:
+        validator.close()
+        server.shutdown(timeout=2.0)
+        thread.join(timeout=2.0)
+
+    assert channel.framing == FRAMING_LENGTH
+    assert all(result["ok"] for result in results)
+    assert [item["ok"] for item in batch] == [True, True]
+
+
+@pytest.mark.parametrize("codecs", [("zlib",), ("json-compact",), ("msgpack", "zlib")])
+def test_tcp_server_negotiates_codec(codecs) -> None:
+    from labs.mcp.tcp_client import TcpMCPValidator
+
+    server, thread = _start_tcp_server(max_workers=2)
+    host, port = server.address[:2]
+    validator = TcpMCPValidator(host, port, timeout=5.0, codecs=codecs)
+    try:
+        result = validator.validate(_asset())
+        batch = validator.validate_many([_asset(), {"name": "bad"}])
+        channel = validator._connection._channel
+    finally:
+        validator.close()
+        server.shutdown(timeout=2.0)
+        thread.join(timeout=2.0)
+
+    assert channel.codec.name in codecs
+    assert result["ok"] is True
+    assert [item["ok"] for item in batch] == [True, False]
+
+
+def test_framing_handshake_falls_back_to_newline() -> None:
+    from labs.mcp.jsonrpc import method_not_found
+    from labs.mcp.tcp_client import MultiplexedConnection
+    from labs.transport import FRAMING_LENGTH, FRAMING_NEWLINE, read_message
+
+    left, right = socket.socketpair()
+    with left, right:
+        def _reply() -> None:
+            write_message(right, method_not_found(decode_payload(read_message(right))))
+
+        responder = threading.Thread(target=_reply)
+        responder.start()
+        reader, codec = MultiplexedConnection("127.0.0.1", 1, framing=FRAMING_LENGTH)._negotiate(left)
+        responder.join()
+
+    assert reader.framing == FRAMING_NEWLINE
+    assert codec is None
@@ -0,0 +1,75 @@
+"""Tests for process-pool batch validation."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import parallel
+from labs.mcp.validate import validate_many
+from mcp import core as mcp_core
+
+
+@pytest.fixture(scope="module")
+def assets():
+    agent = GeneratorAgent(schema_version="0.7.4")
+    batch = [agent.propose(f"parallel {seed}", seed=seed) for seed in range(6)]
+    batch[2] = dict(batch[2], tone=[])
+    batch[4] = {key: value for key, value in batch[4].items() if key != "$schema"}
+    yield batch
+    parallel.shutdown_pool()
+
+
+def test_pool_results_match_sequential_order(assets) -> None:
+    sequential = validate_many(assets)
+    pooled = validate_many(assets, processes=2, chunksize=2)
+
+    assert pooled == sequential
+    assert pooled["ok"] is False and pooled["reason"] == "validation_failed"
+    assert [item["ok"] for item in pooled["items"]] == [True, True, False, True, False, True]
+
+
+def test_core_validate_many_accepts_processes(assets) -> None:
+    expected = mcp_core.validate_many(assets)
+
+    assert mcp_core.validate_many(assets, processes=2, chunksize=4) == expected
+    with pytest.raises(TypeError):
+        mcp_core.validate_many([assets[0], "nope"], processes=2)
+
+
+def test_pools_of_different_sizes_coexist(assets) -> None:
+    first = parallel._get_pool(2)
+    pending = first.submit(parallel._validate_chunk, assets[:2])
+
+    assert parallel._get_pool(3) is not first
+    assert parallel._get_pool(2) is first
+    assert pending.result(timeout=60) == validate_many(assets[:2])["items"]
+
+
+def test_validate_files_reads_in_workers(assets, tmp_path: Path) -> None:
+    paths = []
+    for index, asset in enumerate(assets):
+        path = tmp_path / f"{index}.json"
+        path.write_text(json.dumps(asset))
+        paths.append(path)
+    (tmp_path / "broken.json").write_text("{not json")
+    (tmp_path / "list.json").write_text("[]")
+    paths += [tmp_path / "broken.json", tmp_path / "list.json", tmp_path / "missing.json"]
+
+    items = parallel.validate_files(paths, processes=2, chunksize=3)
+
+    assert items[: len(assets)] == validate_many(assets)["items"]
+    assert [item["ok"] for item in items[len(assets):]] == [False, False, False]
+    assert items[-3]["errors"][0]["msg"].startswith("asset_unreadable:")
+    assert items[-2]["errors"] == [{"path": "/", "msg": "asset must be a JSON object"}]
+
+
+def test_single_chunk_runs_in_process(assets, monkeypatch) -> None:
+    monkeypatch.setattr(parallel, "_get_pool", lambda processes: pytest.fail("pool should not start"))
+
+    assert parallel.validate_chunks(assets, processes=4, chunksize=len(assets)) == validate_many(assets)["items"]
+    with pytest.raises(ValueError):
+        parallel.validate_chunks(assets, processes=0)
@@ -6,10 +6,14 @@ import json
 import os
 import types
 
+import pytest
+
 from labs import cli
 from labs.agents.generator import GeneratorAgent
 from labs.agents.critic import CriticAgent
+from labs.mcp.result_cache import ValidationResultCache
 from labs.mcp_stdio import MCPUnavailableError, resolve_mcp_endpoint
+from labs.patches import apply_patch
 from labs.generator.external import AzureOpenAIGenerator
 
 
@@ -54,8 +58,8 @@ def test_cli_critique_fails_when_mcp_unreachable(monkeypatch, tmp_path, capsys)
     generator = GeneratorAgent(log_path=str(tmp_path / "generator.jsonl"))
 
     class LoggedCriticAgent(CriticAgent):
-        def __init__(self, validator=None) -> None:  # pragma: no cover - trivial init
-            super().__init__(validator=validator, log_path=str(tmp_path / "critic.jsonl"))
+        def __init__(self, validator=None, **kwargs) -> None:  # pragma: no cover - trivial init
+            super().__init__(validator=validator, log_path=str(tmp_path / "critic.jsonl"), **kwargs)
 
     monkeypatch.setattr(cli, "CriticAgent", LoggedCriticAgent)
     asset = generator.propose("cli validation test")
@@ -82,8 +86,8 @@ def test_cli_critique_relaxed_mode_warns_validation(monkeypatch, tmp_path, capsy
     generator = GeneratorAgent(log_path=str(tmp_path / "generator.jsonl"))
 
     class LoggedCriticAgent(CriticAgent):
-        def __init__(self, validator=None) -> None:  # pragma: no cover - trivial init
-            super().__init__(validator=validator, log_path=str(tmp_path / "critic.jsonl"))
+        def __init__(self, validator=None, **kwargs) -> None:  # pragma: no cover - trivial init
+            super().__init__(validator=validator, log_path=str(tmp_path / "critic.jsonl"), **kwargs)
 
     monkeypatch.setattr(cli, "CriticAgent", LoggedCriticAgent)
     asset = generator.propose("cli validation relaxed test")
@@ -119,8 +123,8 @@ def test_cli_generate_persists_validated_asset(monkeypatch, tmp_path, capsys) ->
     monkeypatch.setattr(cli, "GeneratorAgent", LoggedGeneratorAgent)
 
     class LoggedCriticAgent(CriticAgent):
-        def __init__(self, validator=None) -> None:  # pragma: no cover - trivial init
-            super().__init__(validator=validator, log_path=str(critic_log))
+        def __init__(self, validator=None, **kwargs) -> None:  # pragma: no cover - trivial init
+            super().__init__(validator=validator, log_path=str(critic_log), **kwargs)
 
     monkeypatch.setattr(cli, "CriticAgent", LoggedCriticAgent)
 
@@ -190,8 +194,8 @@ def test_cli_generate_relaxed_mode_warns_validation(monkeypatch, tmp_path, capsy
     monkeypatch.setattr(cli, "GeneratorAgent", LoggedGeneratorAgent)
 
     class LoggedCriticAgent(CriticAgent):
-        def __init__(self, validator=None) -> None:  # pragma: no cover - trivial init
-            super().__init__(validator=validator, log_path=str(critic_log))
+        def __init__(self, validator=None, **kwargs) -> None:  # pragma: no cover - trivial init
+            super().__init__(validator=validator, log_path=str(critic_log), **kwargs)
 
     monkeypatch.setattr(cli, "CriticAgent", LoggedCriticAgent)
 
@@ -262,8 +266,8 @@ def test_cli_generate_with_external_engine(monkeypatch, tmp_path, capsys) -> Non
     monkeypatch.setattr(cli, "build_external_generator", lambda engine: azure)
 
     class LoggedCriticAgent(CriticAgent):
-        def __init__(self, validator=None) -> None:  # pragma: no cover - trivial init
-            super().__init__(validator=validator, log_path=str(tmp_path / "critic.jsonl"))
+        def __init__(self, validator=None, **kwargs) -> None:  # pragma: no cover - trivial init
+            super().__init__(validator=validator, log_path=str(tmp_path / "critic.jsonl"), **kwargs)
 
     monkeypatch.setattr(cli, "CriticAgent", LoggedCriticAgent)
 
@@ -369,8 +373,8 @@ def test_cli_generate_flags_precedence(monkeypatch, tmp_path, capsys) -> None:
     monkeypatch.setattr(cli, "build_external_generator", build_external)
 
     class LoggedCriticAgent(CriticAgent):
-        def __init__(self, validator=None) -> None:  # pragma: no cover - trivial init
-            super().__init__(validator=validator, log_path=str(tmp_path / "critic.jsonl"))
+        def __init__(self, validator=None, **kwargs) -> None:  # pragma: no cover - trivial init
+            super().__init__(validator=validator, log_path=str(tmp_path / "critic.jsonl"), **kwargs)
 
     monkeypatch.setattr(cli, "CriticAgent", LoggedCriticAgent)
     monkeypatch.setattr(cli, "build_validator_from_env", lambda: (lambda payload: {"status": "ok", "asset_id": payload["asset_id"]}))
@@ -429,10 +433,11 @@ def test_cli_apply_command(monkeypatch, capsys) -> None:
     def fake_build_validator_optional():
         return lambda payload: {"status": "ok", "asset_id": payload["asset_id"]}
 
-    def fake_apply(payload_asset, payload_patch, critic):
+    def fake_apply(payload_asset, payload_patch, critic, base_valid=False):
         assert payload_asset == asset
         assert payload_patch == patch
         assert critic is not None
+        assert base_valid is False
         return {"asset": payload_asset, "review": {"ok": True}}
 
     monkeypatch.setattr(cli, "_build_validator_optional", fake_build_validator_optional)
@@ -446,6 +451,59 @@ def test_cli_apply_command(monkeypatch, capsys) -> None:
     assert output["review"]["ok"] is True
 
 
+def test_cli_apply_uses_incremental_validation_for_cached_base(monkeypatch, capsys, tmp_path) -> None:
+    monkeypatch.setenv("LABS_VALIDATION_TIER", "tiered")
+    asset = GeneratorAgent(schema_version="0.7.4").propose("cached base", seed=8)
+    patch = {"id": "patch-21", "updates": {"tone": []}}
+    cache = ValidationResultCache(fingerprint=lambda identifier: ("urn:synesthetic-asset", "v1"))
+    cache.put(asset, {"ok": True, "reason": "validation_passed", "errors": []})
+    seen = {}
+
+    def fake_apply(payload_asset, payload_patch, critic, base_valid=False):
+        seen.update(base_valid=base_valid, tier=critic.validation_tier)
+        log_path = str(tmp_path / "patches.jsonl")
+        return apply_patch(payload_asset, payload_patch, critic=critic, log_path=log_path, base_valid=base_valid)
+
+    monkeypatch.setattr(cli.ValidationResultCache, "from_env", classmethod(lambda cls, **_: cache))
+    monkeypatch.setattr(cli, "_build_validator_optional", lambda: lambda payload: pytest.fail("must stay local"))
+    monkeypatch.setattr(cli, "apply_patch", fake_apply)
+
+    exit_code = cli.main(["apply", json.dumps(asset), json.dumps(patch)])
+    output = json.loads(capsys.readouterr().out)
+
+    assert exit_code == 1
+    assert seen == {"base_valid": True, "tier": "tiered"}
+    assert output["review"]["validation_tier"] == "local"
+
+
+def test_cli_apply_leaves_remote_tier_to_the_mcp(monkeypatch, capsys, tmp_path) -> None:
+    monkeypatch.setenv("LABS_VALIDATION_TIER", "remote")
+    asset = GeneratorAgent(schema_version="0.7.4").propose("cached base", seed=8)
+    patch = {"id": "patch-22", "updates": {"tone": []}}
+    cache = ValidationResultCache(fingerprint=lambda identifier: ("urn:synesthetic-asset", "v1"))
+    cache.put(asset, {"ok": True, "reason": "validation_passed", "errors": []})
+    calls = []
+
+    def validator(payload):
+        calls.append(payload)
+        return {"ok": False, "reason": "validation_failed", "errors": []}
+
+    def fake_apply(payload_asset, payload_patch, critic, base_valid=False):
+        log_path = str(tmp_path / "patches.jsonl")
+        return apply_patch(payload_asset, payload_patch, critic=critic, log_path=log_path, base_valid=base_valid)
+
+    monkeypatch.setattr(cli.ValidationResultCache, "from_env", classmethod(lambda cls, **_: cache))
+    monkeypatch.setattr(cli, "_build_validator_optional", lambda: validator)
+    monkeypatch.setattr(cli, "apply_patch", fake_apply)
+
+    exit_code = cli.main(["apply", json.dumps(asset), json.dumps(patch)])
+    output = json.loads(capsys.readouterr().out)
+
+    assert exit_code == 1
+    assert len(calls) == 1
+    assert output["review"]["validation_tier"] == "remote"
+
+
 def test_cli_rate_command(monkeypatch, capsys) -> None:
     rating = {"score": 0.9}
 
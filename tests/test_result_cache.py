@@ -0,0 +1,154 @@
+"""Tests for the content-hash validation result cache."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+
+from labs.agents.critic import CriticAgent
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import MCPClient
+from labs.mcp.result_cache import ValidationResultCache, canonical_asset_hash
+
+_SCHEMA = "https://schemas.synesthetic.dev/0.7.4/synesthetic-asset.schema.json"
+
+
+class _Fingerprint:
+    def __init__(self) -> None:
+        self.content_hash = "v1"
+
+    def __call__(self, identifier: str):
+        return ("urn:synesthetic-asset", self.content_hash)
+
+
+def _asset(name: str = "alpha") -> Dict[str, Any]:
+    return {"$schema": _SCHEMA, "name": name, "control": {"mappings": []}}
+
+
+def test_canonical_hash_ignores_key_order() -> None:
+    assert canonical_asset_hash({"a": 1, "b": [1, 2]}) == canonical_asset_hash({"b": [1, 2], "a": 1})
+
+
+def test_cache_round_trips_verdicts_and_skips_transient_failures() -> None:
+    cache = ValidationResultCache(fingerprint=_Fingerprint())
+
+    assert cache.put(_asset(), {"ok": True, "reason": "validation_passed"})
+    assert not cache.put(_asset("beta"), {"ok": False, "reason": "mcp_unavailable"})
+
+    hit = cache.get(_asset())
+    assert hit == {"ok": True, "reason": "validation_passed"}
+    hit["ok"] = False
+    assert cache.get(_asset())["ok"] is True
+    assert cache.get(_asset("beta")) is None
+    assert cache.stats()["hits"] == 2
+
+
+def test_cache_invalidates_when_schema_content_changes() -> None:
+    fingerprint = _Fingerprint()
+    cache = ValidationResultCache(fingerprint=fingerprint)
+    cache.put(_asset(), {"ok": True})
+
+    fingerprint.content_hash = "v2"
+
+    assert cache.get(_asset()) is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_cache_persists_through_sqlite(tmp_path) -> None:
+    path = tmp_path / "results.sqlite"
+    ValidationResultCache(path=str(path), fingerprint=_Fingerprint()).put(_asset(), {"ok": True})
+
+    reopened = ValidationResultCache(path=str(path), fingerprint=_Fingerprint())
+    assert reopened.get(_asset()) == {"ok": True}
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = ValidationResultCache(max_entries=2, fingerprint=_Fingerprint())
+    for name in ("a", "b", "c"):
+        cache.put(_asset(name), {"ok": True})
+
+    assert cache.get(_asset("a")) is None
+    assert cache.get(_asset("c")) == {"ok": True}
+
+
+def test_default_fingerprint_resolves_bundled_schema() -> None:
+    cache = ValidationResultCache()
+    asset = GeneratorAgent(schema_version="0.7.4").propose("cache fingerprint", seed=3)
+
+    assert cache.put(asset, {"ok": True})
+    assert cache.get(asset) == {"ok": True}
+    assert cache.get({"$schema": "unknown.json"}) is None
+
+
+def test_critic_and_client_share_cached_verdict(tmp_path) -> None:
+    calls: List[Dict[str, Any]] = []
+
+    def validator(payload: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(payload)
+        return {"ok": True, "reason": "validation_passed"}
+
+    cache = ValidationResultCache()
+    asset = GeneratorAgent(schema_version="0.7.4").propose("shared verdict", seed=11)
+    critic = CriticAgent(validator=validator, log_path=str(tmp_path / "critic.jsonl"), result_cache=cache)
+
+    first = critic.review(asset)
+    second = critic.review(asset)
+
+    assert len(calls) == 1
+    assert "validation_cached" not in first
+    assert second["validation_cached"] is True
+    assert second["ok"] is True
+
+    client = MCPClient(schema_version="0.7.4", result_cache=cache)
+
+    def unexpected(*_: Any) -> List[Dict[str, Any]]:  # pragma: no cover - asserted below
+        raise AssertionError("cached verdict should skip validation")
+
+    client._validate_prepared = unexpected  # type: ignore[assignment]
+    assert client.confirm(asset)["reason"] == "validation_passed"
+
+
+def test_legacy_assets_share_entries_on_the_prepared_form(tmp_path) -> None:
+    calls: List[Dict[str, Any]] = []
+
+    def validator(payload: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(payload)
+        return {"ok": True, "reason": "validation_passed"}
+
+    cache = ValidationResultCache(fingerprint=_Fingerprint())
+    asset = GeneratorAgent(schema_version="0.7.3").propose("legacy verdict", seed=4)
+    asset.update(asset_id="legacy-1", provenance={"agent": "test"})
+    critic = CriticAgent(validator=validator, log_path=str(tmp_path / "critic.jsonl"), result_cache=cache)
+
+    critic.review(asset)
+
+    assert "provenance" not in calls[0] and "asset_id" not in calls[0]
+    client = MCPClient(schema_version="0.7.3", result_cache=cache)
+    client._validate_prepared = lambda *_args, **_kwargs: pytest.fail("cached verdict should skip validation")
+    assert client.confirm(asset)["reason"] == "validation_passed"
+
+
+def test_client_fingerprint_follows_fetched_descriptor(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("LABS_SCHEMA_CACHE", "0")
+    served = {"title": "v1"}
+
+    def resolve(self, name, version, resolution):
+        return {"name": name, "version": version, "schema": dict(served), "schema_id": "urn:remote"}
+
+    monkeypatch.setattr(MCPClient, "_resolve_schema_descriptor", resolve)
+    database = str(tmp_path / "results.sqlite")
+    client = MCPClient(schema_version="0.7.4")
+    cache = ValidationResultCache(path=database, fingerprint=client.schema_fingerprint)
+    cache.put(_asset(), {"ok": True, "reason": "validation_passed"})
+
+    assert client.schema_fingerprint(_SCHEMA)[0] == "urn:remote"
+    assert client.descriptor is None
+    assert cache.get(_asset()) is not None
+
+    # A later run fetches the changed server schema; the stored verdict is discarded.
+    served["title"] = "v2"
+    rerun = MCPClient(schema_version="0.7.4")
+    later = ValidationResultCache(path=database, fingerprint=rerun.schema_fingerprint)
+    assert later.get(_asset()) is None
+    assert later.stats()["invalidations"] == 1
@@ -0,0 +1,146 @@
+"""Tests for the on-disk schema descriptor cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, List
+
+from labs.mcp import MCPClient
+from labs.mcp.schema_cache import SchemaDescriptorCache, schema_content_hash
+
+_KEY = ("synesthetic-asset", "0.7.3", "inline")
+
+
+def _descriptor(schema_id: str = "urn:test", title: str = "first") -> Dict[str, Any]:
+    return {
+        "ok": True,
+        "name": "synesthetic-asset",
+        "version": "0.7.3",
+        "schema": {"$id": schema_id, "title": title},
+        "schema_id": schema_id,
+        "resolution": "inline",
+    }
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_serves_fresh_entries_without_loader(tmp_path) -> None:
+    cache = SchemaDescriptorCache(tmp_path, ttl=60.0)
+    calls: List[int] = []
+
+    def loader() -> Dict[str, Any]:
+        calls.append(1)
+        return _descriptor()
+
+    first = cache.fetch(_KEY, loader)
+    second = SchemaDescriptorCache(tmp_path, ttl=60.0).fetch(_KEY, loader)
+
+    assert calls == [1]
+    assert first == second
+
+
+def test_cache_serves_stale_and_refreshes_in_background(tmp_path) -> None:
+    clock = _Clock()
+    cache = SchemaDescriptorCache(tmp_path, ttl=10.0, max_stale=100.0, clock=clock)
+    cache.fetch(_KEY, lambda: _descriptor(title="first"))
+
+    clock.now += 50.0
+    served = cache.fetch(_KEY, lambda: _descriptor(title="second"))
+    cache.wait_for_refreshes(timeout=2.0)
+
+    assert served["schema"]["title"] == "first"
+    refreshed = cache.fetch(_KEY, lambda: _descriptor(title="third"))
+    assert refreshed["schema"]["title"] == "second"
+
+
+def test_cache_reloads_synchronously_when_too_stale(tmp_path) -> None:
+    clock = _Clock()
+    cache = SchemaDescriptorCache(tmp_path, ttl=10.0, max_stale=10.0, clock=clock)
+    cache.fetch(_KEY, lambda: _descriptor(title="first"))
+
+    clock.now += 100.0
+    served = cache.fetch(_KEY, lambda: _descriptor(title="second"))
+
+    assert served["schema"]["title"] == "second"
+
+
+def test_cache_discards_entries_with_mismatched_hash(tmp_path) -> None:
+    cache = SchemaDescriptorCache(tmp_path, ttl=60.0)
+    cache.fetch(_KEY, lambda: _descriptor(title="first"))
+
+    [path] = list(tmp_path.glob("*.json"))
+    record = json.loads(path.read_text(encoding="utf-8"))
+    record["descriptor"]["schema"]["title"] = "tampered"
+    path.write_text(json.dumps(record), encoding="utf-8")
+
+    served = cache.fetch(_KEY, lambda: _descriptor(title="reloaded"))
+    assert served["schema"]["title"] == "reloaded"
+    assert schema_content_hash(served["schema"]) == json.loads(path.read_text(encoding="utf-8"))["content_hash"]
+
+
+def test_cache_force_bypasses_entry(tmp_path) -> None:
+    cache = SchemaDescriptorCache(tmp_path, ttl=60.0)
+    cache.fetch(_KEY, lambda: _descriptor(title="first"))
+    served = cache.fetch(_KEY, lambda: _descriptor(title="forced"), force=True)
+    assert served["schema"]["title"] == "forced"
+
+
+def test_cache_disabled_via_env(monkeypatch) -> None:
+    monkeypatch.setenv("LABS_SCHEMA_CACHE", "0")
+    assert SchemaDescriptorCache.from_env() is None
+
+
+def test_mcp_clients_share_disk_cache_across_instances(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("LABS_SCHEMA_CACHE_DIR", str(tmp_path / "shared"))
+    first = MCPClient()
+    first.fetch_schema(version="0.7.3")
+
+    second = MCPClient()
+
+    def unexpected(*_: Any) -> Dict[str, Any]:  # pragma: no cover - asserted below
+        raise AssertionError("descriptor should come from the disk cache")
+
+    monkeypatch.setattr(second, "_resolve_schema_descriptor", unexpected)
+    descriptor = second.fetch_schema(version="0.7.3")
+
+    assert descriptor["version"] == "0.7.3"
+    assert descriptor["schema"]["$id"].endswith("0.7.3/synesthetic-asset.schema.json")
+
+
+def test_cache_entries_are_keyed_by_schema_source(tmp_path, monkeypatch) -> None:
+    calls: List[str] = []
+
+    def resolve(self, name: str, version: str, resolution: str) -> Dict[str, Any]:
+        calls.append(os.environ["MCP_PORT"])
+        return _descriptor(title=os.environ["MCP_PORT"])
+
+    monkeypatch.setattr(MCPClient, "_resolve_schema_descriptor", resolve)
+    monkeypatch.setenv("MCP_PORT", "9001")
+    MCPClient().fetch_schema(version="0.7.3")
+    monkeypatch.setenv("MCP_PORT", "9002")
+    descriptor = MCPClient().fetch_schema(version="0.7.3")
+
+    assert calls == ["9001", "9002"]
+    assert descriptor["schema"]["title"] == "9002"
+
+
+def test_local_entries_revalidate_on_source_file_hash(tmp_path) -> None:
+    source = tmp_path / "synesthetic-asset.schema.json"
+    source.write_text("{}", encoding="utf-8")
+    cache = SchemaDescriptorCache(tmp_path / "cache", ttl=60.0)
+
+    def loader(title: str):
+        return lambda: {**_descriptor(title=title), "source": "mcp.core", "path": str(source)}
+
+    cache.fetch(_KEY, loader("first"))
+    assert cache.fetch(_KEY, loader("unused"))["schema"]["title"] == "first"
+
+    source.write_text('{"edited": true}', encoding="utf-8")
+    assert cache.fetch(_KEY, loader("second"))["schema"]["title"] == "second"
@@ -0,0 +1,133 @@
+"""Tests for the generated-code schema validator."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from jsonschema import Draft202012Validator
+
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import validate
+from labs.mcp.schema_compiler import UnsupportedSchemaError, clear_cache, compile_schema, get_compiled
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+_SCHEMA: Dict[str, Any] = {
+    "$id": "urn:test:compiler",
+    "type": "object",
+    "required": ["name", "tags", "level"],
+    "properties": {
+        "name": {"type": "string", "minLength": 2, "maxLength": 8, "pattern": "^[a-z]+$"},
+        "tags": {"type": "array", "items": {"type": "string"}, "minItems": 1, "uniqueItems": True},
+        "level": {"type": ["integer", "null"], "minimum": 0, "exclusiveMaximum": 10},
+        "mode": {"enum": ["a", "b"]},
+        "mix": {"enum": [1, "1", None]},
+        "fixed": {"const": {"k": [1, True]}},
+        "ratio": {"type": "number", "maximum": 1.5, "exclusiveMinimum": 0},
+        "nested": {
+            "type": "object",
+            "properties": {"deep": {"type": "object", "additionalProperties": {"type": "integer"}}},
+            "additionalProperties": False,
+            "minProperties": 1,
+            "maxProperties": 2,
+        },
+        "never": False,
+        "empty": {"type": "array", "items": False},
+    },
+}
+
+_INSTANCES = [
+    {"name": "abc", "tags": ["x"], "level": 3},
+    {"name": "abc", "tags": ["x"], "level": None, "ratio": 1},
+    "not an object",
+    {"tags": ["x"], "level": 1},
+    {"name": "a", "tags": ["x"], "level": 1},
+    {"name": "abcdefghij", "tags": ["x"], "level": 1},
+    {"name": "ABC", "tags": ["x"], "level": 1},
+    {"name": "abc", "tags": [], "level": 1},
+    {"name": "abc", "tags": ["x", "x"], "level": 1},
+    {"name": "abc", "tags": ["x", 5], "level": 1},
+    {"name": "abc", "tags": ["x"], "level": -1},
+    {"name": "abc", "tags": ["x"], "level": 10},
+    {"name": "abc", "tags": ["x"], "level": 2.0},
+    {"name": "abc", "tags": ["x"], "level": 2.5},
+    {"name": "abc", "tags": ["x"], "level": True},
+    {"name": "abc", "tags": ["x"], "level": 1, "mode": "c"},
+    {"name": "abc", "tags": ["x"], "level": 1, "mix": True},
+    {"name": "abc", "tags": ["x"], "level": 1, "mix": 1.0},
+    {"name": "abc", "tags": ["x"], "level": 1, "fixed": {"k": [1, 1]}},
+    {"name": "abc", "tags": ["x"], "level": 1, "fixed": {"k": [1, True]}},
+    {"name": "abc", "tags": ["x"], "level": 1, "ratio": 0},
+    {"name": "abc", "tags": ["x"], "level": 1, "ratio": 2},
+    {"name": "abc", "tags": ["x"], "level": 1, "nested": {}},
+    {"name": "abc", "tags": ["x"], "level": 1, "nested": {"a": 1, "b": 2, "c": 3}},
+    {"name": "abc", "tags": ["x"], "level": 1, "nested": {"zeta": 1, "alpha": 2}},
+    {"name": "abc", "tags": ["x"], "level": 1, "nested": {"deep": {"a": 1, "b": "two"}}},
+    {"name": "abc", "tags": ["x"], "level": 1, "never": 1},
+    {"name": "abc", "tags": ["x"], "level": 1, "empty": [1]},
+    {"name": "abc", "tags": ["x"], "level": 1, "empty": [1, 2]},
+    {"name": 7, "tags": "x", "level": "high", "mode": "z"},
+]
+
+
+def _reference_error(schema, instance):
+    error = next(Draft202012Validator(schema).iter_errors(instance), None)
+    return None if error is None else validate._format_error(error)
+
+
+def _compiled_error(schema, instance):
+    error = compile_schema(schema).first_error(instance)
+    return None if error is None else validate._format_pointer(*error)
+
+
+@pytest.mark.parametrize("instance", _INSTANCES)
+def test_compiled_first_error_matches_jsonschema(instance) -> None:
+    assert _compiled_error(_SCHEMA, instance) == _reference_error(_SCHEMA, instance)
+
+
+@pytest.mark.parametrize("version", ["0.7.3", "0.7.4"])
+def test_bundled_schemas_compile_and_match(version: str) -> None:
+    schema = json.loads((_ROOT / "meta" / "schemas" / version / "synesthetic-asset.schema.json").read_text())
+    asset = GeneratorAgent(schema_version=version).propose("compiler", seed=2)
+    broken = dict(asset, shader="nope", parameter_index=["ok", 3])
+    missing = {key: value for key, value in asset.items() if key != "tone"}
+
+    for instance in (asset, broken, missing, {}):
+        assert _compiled_error(schema, instance) == _reference_error(schema, instance)
+
+
+def test_unsupported_keywords_are_rejected() -> None:
+    with pytest.raises(UnsupportedSchemaError):
+        compile_schema({"anyOf": [{"type": "string"}]})
+    with pytest.raises(UnsupportedSchemaError):
+        compile_schema({"properties": {"a": {"$ref": "#/$defs/a"}}, "$defs": {"a": {}}})
+    assert compile_schema({"format": "date-time", "title": "ignored"}).is_valid("anything")
+
+
+def test_get_compiled_caches_by_id_and_content() -> None:
+    clear_cache()
+    first = get_compiled(dict(_SCHEMA))
+    again = get_compiled(json.loads(json.dumps(_SCHEMA)))
+    changed = get_compiled(dict(_SCHEMA, minProperties=1))
+
+    assert first is again
+    assert changed is not first and changed.digest != first.digest
+    assert get_compiled({"$id": "urn:test:ref", "$ref": "#"}) is None
+
+
+def test_validate_asset_uses_compiler_and_falls_back(monkeypatch) -> None:
+    asset = GeneratorAgent(schema_version="0.7.4").propose("compiler path", seed=4)
+    broken = dict(asset, tone=[])
+
+    validate._VALIDATOR_CACHE.clear()
+    compiled = [validate.validate_asset(asset), validate.validate_asset(broken)]
+    validate._VALIDATOR_CACHE.clear()
+    monkeypatch.setenv("LABS_SCHEMA_COMPILER", "0")
+    generic = [validate.validate_asset(asset), validate.validate_asset(broken)]
+    validate._VALIDATOR_CACHE.clear()
+
+    assert compiled == generic
+    assert compiled[1]["errors"] == [{"path": "/tone", "msg": "[] is not of type 'object'"}]
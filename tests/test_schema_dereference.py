@@ -0,0 +1,179 @@
+"""Tests for ``$ref`` dereferencing behind ``get_schema(resolution=...)``."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from mcp import core
+from mcp.dereference import CyclicRefError, Dereferencer, RefResolutionError, contains_refs
+
+_BASE = "https://schemas.synesthetic.dev/1.0.0/"
+
+
+def _write(root: Path, name: str, payload: dict, version: str = "1.0.0") -> Path:
+    directory = root / version
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.schema.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def schema_root(tmp_path, monkeypatch):
+    root = tmp_path / "schemas"
+    root.mkdir()
+    monkeypatch.setenv("SYN_SCHEMAS_DIR", str(root))
+    core._CATALOG.clear()
+    _write(
+        root,
+        "common",
+        {
+            "$id": _BASE + "common.schema.json",
+            "$defs": {
+                "name": {"type": "string", "minLength": 1},
+                "tag": {"type": "object", "properties": {"label": {"$ref": "#/$defs/name"}}},
+            },
+        },
+    )
+    _write(
+        root,
+        "demo",
+        {
+            "$id": _BASE + "demo.schema.json",
+            "type": "object",
+            "properties": {
+                "title": {"$ref": "common.schema.json#/$defs/name"},
+                "tags": {"type": "array", "items": {"$ref": "common.schema.json#/$defs/tag"}},
+                "count": {"$ref": "#/$defs/count", "maximum": 9},
+            },
+            "$defs": {"count": {"type": "integer", "minimum": 0}},
+        },
+    )
+    yield root
+    core._CATALOG.clear()
+
+
+def test_inline_expands_local_and_cross_file_refs(schema_root) -> None:
+    result = core.get_schema("demo", resolution="inline")
+    schema = result["schema"]
+
+    assert result["ok"] is True and result["resolution"] == "inline"
+    assert not contains_refs(schema)
+    assert "$defs" not in schema
+    assert schema["properties"]["title"] == {"type": "string", "minLength": 1}
+    assert schema["properties"]["tags"]["items"]["properties"]["label"] == {"type": "string", "minLength": 1}
+    assert schema["properties"]["count"] == {"maximum": 9, "allOf": [{"type": "integer", "minimum": 0}]}
+
+
+def test_bundled_keeps_only_local_refs(schema_root) -> None:
+    schema = core.get_schema("demo", resolution="bundled")["schema"]
+    defs = schema["$defs"]
+
+    assert schema["properties"]["title"] == {"$ref": "#/$defs/common._defs.name"}
+    assert schema["properties"]["count"]["$ref"] == "#/$defs/count"
+    assert defs["common._defs.tag"]["properties"]["label"] == {"$ref": "#/$defs/common._defs.name"}
+    assert set(defs) == {"count", "common._defs.name", "common._defs.tag"}
+
+
+def test_preserve_is_untouched_and_ref_free_schemas_pass_through(schema_root) -> None:
+    _write(schema_root, "plain", {"type": "object"})
+
+    preserved = core.get_schema("demo")
+    assert "resolution" not in preserved
+    assert preserved["schema"]["properties"]["title"] == {"$ref": "common.schema.json#/$defs/name"}
+    assert core.get_schema("plain", resolution="bundled")["schema"] == {"type": "object"}
+
+
+def test_resolved_schemas_are_memoised_until_a_dependency_changes(schema_root) -> None:
+    first = core.get_schema("demo", resolution="inline")["schema"]
+    assert core.get_schema("demo", resolution="inline")["schema"] is first
+
+    common = _write(
+        schema_root,
+        "common",
+        {"$id": _BASE + "common.schema.json", "$defs": {"name": {"type": "string"}, "tag": {"type": "object"}}},
+    )
+    _bump_mtime(common)
+
+    refreshed = core.get_schema("demo", resolution="inline")["schema"]
+    assert refreshed is not first
+    assert refreshed["properties"]["title"] == {"type": "string"}
+
+
+def test_cycles_fail_inline_but_bundle(schema_root) -> None:
+    _write(
+        schema_root,
+        "tree",
+        {
+            "$id": _BASE + "tree.schema.json",
+            "type": "object",
+            "properties": {"children": {"type": "array", "items": {"$ref": "#"}}},
+        },
+    )
+
+    inline = core.get_schema("tree", resolution="inline")
+    bundled = core.get_schema("tree", resolution="bundled")
+
+    assert inline["ok"] is False
+    assert inline["reason"].startswith("schema_resolution_failed:cyclic $ref")
+    assert bundled["schema"]["properties"]["children"]["items"] == {"$ref": "#"}
+
+
+def test_missing_targets_are_reported(schema_root) -> None:
+    _write(schema_root, "broken", {"$id": _BASE + "broken.schema.json", "$ref": "absent.schema.json"})
+
+    result = core.get_schema("broken", resolution="inline")
+
+    assert result["ok"] is False
+    assert "absent.schema.json" in result["reason"]
+
+
+def test_dereferencer_memoises_shared_targets() -> None:
+    shared = {"$defs": {"x": {"type": "object", "properties": {"a": {"type": "integer"}}}}}
+    loads = []
+
+    def loader(uri: str) -> dict:
+        loads.append(uri)
+        return shared
+
+    dereferencer = Dereferencer(loader)
+    first = dereferencer.inline({"properties": {"p": {"$ref": "urn:shared#/$defs/x"}}})
+    second = dereferencer.inline({"items": {"$ref": "urn:shared#/$defs/x"}})
+
+    assert first["properties"]["p"] is second["items"]
+    assert loads == ["urn:shared"]
+    with pytest.raises(RefResolutionError):
+        dereferencer.inline({"$ref": "urn:shared#anchor"})
+    with pytest.raises(CyclicRefError):
+        dereferencer.inline({"$defs": {"a": {"$ref": "#/$defs/b"}, "b": {"$ref": "#/$defs/a"}}, "$ref": "#/$defs/a"})
+
+
+def test_versions_sharing_an_id_resolve_independently(schema_root) -> None:
+    shared_id = "https://schemas.synesthetic.dev/x.schema.json"
+    for version, kind in (("0.1.0", "string"), ("0.2.0", "integer")):
+        payload = {"$id": shared_id, "properties": {"p": {"$ref": "#/$defs/a"}}, "$defs": {"a": {"type": kind}}}
+        _write(schema_root, "x", payload, version=version)
+
+    old = core.get_schema("x", version="0.1.0", resolution="inline")["schema"]
+    new = core.get_schema("x", version="0.2.0", resolution="inline")["schema"]
+
+    assert old["properties"] == {"p": {"type": "string"}}
+    assert new["properties"] == {"p": {"type": "integer"}}
+
+
+def test_conflicting_documents_for_one_uri_raise() -> None:
+    dereferencer = Dereferencer(lambda uri: {})
+    dereferencer.add_document("urn:doc", {"type": "string"})
+    dereferencer.add_document("urn:doc", {"type": "string"})
+
+    with pytest.raises(RefResolutionError):
+        dereferencer.add_document("urn:doc", {"type": "integer"})
@@ -0,0 +1,119 @@
+"""Tests for the shared-memory MCP transport."""
+
+from __future__ import annotations
+
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import shm_main
+from labs.mcp.exceptions import MCPUnavailableError
+from labs.mcp.shm import SharedMemoryMCPValidator, _Ring
+from labs.mcp_stdio import build_transport_from_env, resolve_mcp_endpoint
+from labs.transport import MAX_PAYLOAD_BYTES, PayloadTooLargeError
+
+
+def _asset(prompt: str = "shm asset") -> Dict[str, Any]:
+    return GeneratorAgent(schema_version="0.7.4").propose(prompt, seed=9)
+
+
+def test_ring_wraps_frames_and_refuses_when_full() -> None:
+    backing = mmap.mmap(-1, _Ring.size(64))
+    ring = _Ring(memoryview(backing), 64)
+    received: List[bytes] = []
+
+    for index in range(10):
+        body = bytes([65 + index]) * 20
+        assert ring.put(body)
+        assert ring.drain(lambda view: received.append(bytes(view))) == 1
+    assert ring.put(b"x" * 30) and not ring.put(b"y" * 30)
+
+    assert received == [bytes([65 + index]) * 20 for index in range(10)]
+    ring.release()
+
+
+def test_ring_rejects_oversized_frame_header() -> None:
+    backing = mmap.mmap(-1, _Ring.size(64))
+    view = memoryview(backing)
+    view[16:20] = (MAX_PAYLOAD_BYTES + 1).to_bytes(4, "little")
+    view[0:8] = (4).to_bytes(8, "little")
+    ring = _Ring(view, 64)
+
+    with pytest.raises(PayloadTooLargeError):
+        ring.drain(lambda _: None)
+    ring.release()
+
+
+@pytest.fixture
+def shm_server(tmp_path):
+    path = str(tmp_path / "mcp-shm.sock")
+    try:
+        server = shm_main.create_server(path, max_workers=4)
+    except (PermissionError, OSError) as exc:  # pragma: no cover - sandbox restriction
+        pytest.skip(f"Unix domain sockets unavailable: {exc}")
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server, path
+    server.shutdown(timeout=2.0)
+    thread.join(timeout=2.0)
+
+
+def test_shm_validator_round_trips_concurrently(shm_server) -> None:
+    server, path = shm_server
+    validator = SharedMemoryMCPValidator(path, timeout=10.0)
+    asset = _asset()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: validator.validate(asset), range(64)))
+        batch = validator.validate_many([asset, {"name": "bad"}])
+        large = validator.validate({"name": "large", "data": "x" * (MAX_PAYLOAD_BYTES // 2)})
+    finally:
+        validator.close()
+
+    assert all(result["ok"] for result in results)
+    assert [item["ok"] for item in batch] == [True, False]
+    assert large["ok"] is False
+    assert validator.connects == 1
+    assert server.stats()["requests"] == 66
+
+
+def test_shm_validator_payload_cap_and_missing_server(shm_server, tmp_path) -> None:
+    _, path = shm_server
+    validator = SharedMemoryMCPValidator(path)
+
+    with pytest.raises(MCPUnavailableError, match="too large"):
+        validator.validate({"data": "x" * (MAX_PAYLOAD_BYTES + 10)})
+    with pytest.raises(MCPUnavailableError, match="unavailable"):
+        SharedMemoryMCPValidator(str(tmp_path / "missing.sock")).validate(_asset())
+
+
+def test_shm_validator_reconnects_after_close(tmp_path) -> None:
+    path = str(tmp_path / "mcp-shm.sock")
+    validator = SharedMemoryMCPValidator(path, timeout=5.0)
+    for _ in range(2):
+        try:
+            server = shm_main.create_server(path, max_workers=2)
+        except (PermissionError, OSError) as exc:  # pragma: no cover - sandbox restriction
+            pytest.skip(f"Unix domain sockets unavailable: {exc}")
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        try:
+            assert validator.validate(_asset())["ok"] is True
+        finally:
+            server.shutdown(timeout=2.0)
+            thread.join(timeout=2.0)
+        validator.close()
+
+    assert validator.connects == 2
+
+
+def test_build_transport_from_env_shm(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("MCP_ENDPOINT", "shm")
+    monkeypatch.setenv("MCP_SOCKET_PATH", str(tmp_path / "mcp.sock"))
+
+    assert resolve_mcp_endpoint() == "shm"
+    assert isinstance(build_transport_from_env(timeout=1.0), SharedMemoryMCPValidator)
@@ -0,0 +1,137 @@
+"""Tests for singleflight request coalescing."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import MCPClient
+from labs.singleflight import SingleFlight
+
+
+def _run_concurrently(count: int, target) -> List[Any]:
+    results: List[Any] = [None] * count
+    barrier = threading.Barrier(count)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        results[index] = target()
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5.0)
+    return results
+
+
+def test_singleflight_coalesces_concurrent_duplicates() -> None:
+    flight = SingleFlight()
+    calls: List[int] = []
+
+    def work() -> Dict[str, Any]:
+        calls.append(1)
+        time.sleep(0.1)
+        return {"value": [1, 2, 3]}
+
+    results = _run_concurrently(6, lambda: flight.do("key", work))
+
+    assert len(calls) == 1
+    assert all(result == {"value": [1, 2, 3]} for result in results)
+    assert len({id(result) for result in results}) == len(results)
+    stats = flight.stats()
+    assert stats["calls"] == 6
+    assert stats["executions"] == 1
+    assert stats["hits"] == 5
+    assert stats["in_flight"] == 0
+
+
+def test_singleflight_releases_key_after_completion() -> None:
+    flight = SingleFlight()
+    counter = {"n": 0}
+
+    def work() -> int:
+        counter["n"] += 1
+        return counter["n"]
+
+    assert flight.do("key", work) == 1
+    assert flight.do("key", work) == 2
+    assert flight.stats()["hits"] == 0
+
+
+def test_singleflight_shares_errors_with_waiters() -> None:
+    flight = SingleFlight()
+
+    def failing() -> None:
+        time.sleep(0.1)
+        raise RuntimeError("boom")
+
+    def call() -> str:
+        try:
+            flight.do("key", failing)
+        except RuntimeError as exc:
+            return str(exc)
+        return "no error"  # pragma: no cover - defensive
+
+    assert _run_concurrently(3, call) == ["boom", "boom", "boom"]
+    assert flight.stats()["executions"] == 1
+
+
+def test_generator_propose_coalesces_seeded_requests(tmp_path, monkeypatch) -> None:
+    generator = GeneratorAgent(log_path=str(tmp_path / "generator.jsonl"), schema_version="0.7.4")
+    original = generator._propose
+
+    def slow_propose(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        time.sleep(0.1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(generator, "_propose", slow_propose)
+
+    assets = _run_concurrently(4, lambda: generator.propose("shared prompt", seed=7))
+
+    assert len({asset["asset_id"] for asset in assets}) == 1
+    assert len({id(asset) for asset in assets}) == 4
+    assert generator.coalescing_stats["executions"] == 1
+    assert generator.coalescing_stats["hits"] == 3
+    log_lines = (tmp_path / "generator.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(log_lines) == 1
+
+
+def test_generator_propose_without_seed_is_not_coalesced(tmp_path) -> None:
+    generator = GeneratorAgent(log_path=str(tmp_path / "generator.jsonl"))
+    generator.propose("unseeded")
+    generator.propose("unseeded")
+    assert generator.coalescing_stats["calls"] == 0
+
+
+def test_mcp_client_fetch_schema_coalesces_cold_cache(monkeypatch) -> None:
+    client = MCPClient()
+    resolved: List[str] = []
+    original = client._resolve_schema_descriptor
+
+    def slow_resolve(*args: Any) -> Dict[str, Any]:
+        resolved.append(args[1])
+        time.sleep(0.1)
+        return original(*args)
+
+    monkeypatch.setattr(client, "_resolve_schema_descriptor", slow_resolve)
+
+    descriptors = _run_concurrently(5, lambda: client.fetch_schema(version="0.7.3"))
+
+    assert resolved == ["0.7.3"]
+    assert all(descriptor["version"] == "0.7.3" for descriptor in descriptors)
+    assert client.coalescing_stats["hits"] == 4
+
+
+@pytest.mark.parametrize("seed", [None, 3])
+def test_external_generator_exposes_coalescing_stats(seed) -> None:
+    from labs.generator.external import OpenAIGenerator
+
+    generator = OpenAIGenerator(log_path="/dev/null", mock_mode=True)
+    generator.generate("stats prompt", seed=seed)
+    expected = 0 if seed is None else 1
+    assert generator.coalescing_stats["executions"] == expected
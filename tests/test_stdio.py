@@ -0,0 +1,170 @@
+"""Tests for the STDIO MCP validator and bundled stub adapter."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from labs.mcp.exceptions import MCPUnavailableError
+from labs.mcp_stdio import StdioMCPValidator
+
+
+def _stub_command(*extra: str) -> list[str]:
+    return [sys.executable, "-m", "labs.mcp_stub", *extra]
+
+
+def test_stdio_validate_round_trip() -> None:
+    validator = StdioMCPValidator(_stub_command())
+
+    response = validator.validate({"asset_id": "stdio-1"})
+
+    assert response == {"status": "ok", "asset_id": "stdio-1", "issues": []}
+
+
+def test_stdio_validate_many_chunks_by_batch_limit() -> None:
+    validator = StdioMCPValidator(_stub_command())
+    assets = [{"asset_id": f"stdio-{index}"} for index in range(5)]
+
+    results = validator.validate_many(assets, batch_limit=2)
+
+    assert [item["asset_id"] for item in results] == [asset["asset_id"] for asset in assets]
+    assert all(item["status"] == "ok" for item in results)
+
+
+def test_stdio_persistent_reuses_one_adapter_process() -> None:
+    validator = StdioMCPValidator(_stub_command("--loop"), persistent=True)
+    try:
+        first = validator.validate({"asset_id": "p-1"})
+        batch = validator.validate_many([{"asset_id": "p-2"}, {"asset_id": "p-3"}], batch_limit=1)
+    finally:
+        validator.close()
+
+    assert first["asset_id"] == "p-1"
+    assert [item["asset_id"] for item in batch] == ["p-2", "p-3"]
+    assert validator._adapter.starts == 1
+
+
+def test_stdio_persistent_restarts_after_crash() -> None:
+    validator = StdioMCPValidator(_stub_command("--loop"), persistent=True)
+    try:
+        validator.validate({"asset_id": "before"})
+        validator._adapter._process.kill()
+        response = validator.validate({"asset_id": "after"})
+    finally:
+        validator.close()
+
+    assert response["asset_id"] == "after"
+    assert validator._adapter.starts == 2
+
+
+def test_stdio_persistent_times_out_and_kills_adapter() -> None:
+    command = [sys.executable, "-c", "import time; time.sleep(30)"]
+    validator = StdioMCPValidator(command, persistent=True, timeout=0.3)
+
+    with pytest.raises(MCPUnavailableError) as excinfo:
+        validator.validate({"asset_id": "slow"})
+
+    assert "timed out" in str(excinfo.value)
+    assert validator._adapter._process is None
+
+
+def test_stdio_persistent_reports_adapter_failure() -> None:
+    validator = StdioMCPValidator(_stub_command("--loop", "--fail"), persistent=True)
+
+    with pytest.raises(MCPUnavailableError) as excinfo:
+        validator.validate({"asset_id": "broken"})
+
+    assert "stub failure requested" in str(excinfo.value)
+
+
+def test_stdio_pool_spreads_requests_across_workers() -> None:
+    validator = StdioMCPValidator(_stub_command("--loop"), persistent=True, workers=2)
+    try:
+        results = validator.validate_many([{"asset_id": f"w-{index}"} for index in range(4)], batch_limit=1)
+        stats = validator._adapter.stats()
+    finally:
+        validator.close()
+
+    assert [item["asset_id"] for item in results] == ["w-0", "w-1", "w-2", "w-3"]
+    assert [worker["starts"] for worker in stats] == [1, 1]
+    assert sum(worker["served"] for worker in stats) == 4
+
+
+def test_stdio_pool_health_check_reaps_dead_workers() -> None:
+    validator = StdioMCPValidator(_stub_command("--loop"), persistent=True, workers=2)
+    try:
+        validator.validate_many([{"asset_id": "a"}, {"asset_id": "b"}], batch_limit=1)
+        dead = validator._adapter._workers[1]._process
+        dead.kill()
+        dead.wait()
+
+        assert validator._adapter.check_health() == [True, False]
+        assert [worker["healthy"] for worker in validator._adapter.stats()] == [True, False]
+        assert validator.validate({"asset_id": "c"})["asset_id"] == "c"
+    finally:
+        validator.close()
+
+
+def test_stdio_pool_checks_health_before_dispatch() -> None:
+    validator = StdioMCPValidator(_stub_command("--loop"), persistent=True, workers=2)
+    pool = validator._adapter
+    try:
+        validator.validate_many([{"asset_id": "a"}, {"asset_id": "b"}], batch_limit=1)
+        dead = pool._workers[1]._process
+        dead.kill()
+        dead.wait()
+        pool._next_health_check = 0.0
+
+        results = [validator.validate({"asset_id": f"c{index}"})["asset_id"] for index in range(2)]
+        stats = pool.stats()
+    finally:
+        validator.close()
+
+    assert results == ["c0", "c1"]
+    assert [worker["healthy"] for worker in stats] == [True, False]
+    assert [worker["starts"] for worker in stats] == [1, 1]
+    assert stats[0]["served"] == 3
+
+
+def test_stdio_persistent_recycles_after_max_requests() -> None:
+    validator = StdioMCPValidator(_stub_command("--loop"), persistent=True, max_requests=2)
+    try:
+        for index in range(5):
+            validator.validate({"asset_id": f"r-{index}"})
+    finally:
+        validator.close()
+
+    assert validator._adapter.starts == 3
+
+
+def test_build_transport_from_env_configures_worker_pool(monkeypatch) -> None:
+    from labs.mcp_stdio import build_transport_from_env
+
+    monkeypatch.setenv("MCP_ENDPOINT", "stdio")
+    monkeypatch.setenv("MCP_ADAPTER_CMD", f"{sys.executable} -m labs.mcp_stub --loop")
+    monkeypatch.setenv("MCP_ADAPTER_PERSISTENT", "1")
+    monkeypatch.setenv("MCP_ADAPTER_WORKERS", "3")
+    monkeypatch.setenv("MCP_ADAPTER_MAX_REQUESTS", "100")
+
+    transport = build_transport_from_env()
+    try:
+        assert len(transport._adapter) == 3
+        assert transport.validate({"asset_id": "env"})["asset_id"] == "env"
+    finally:
+        transport.close()
+
+
+def test_worker_pool_requires_persistent_mode(monkeypatch) -> None:
+    from labs.mcp_stdio import build_transport_from_env
+
+    with pytest.raises(ValueError):
+        StdioMCPValidator(_stub_command("--loop"), workers=2)
+
+    monkeypatch.setenv("MCP_ENDPOINT", "stdio")
+    monkeypatch.setenv("MCP_ADAPTER_CMD", f"{sys.executable} -m labs.mcp_stub --loop")
+    monkeypatch.delenv("MCP_ADAPTER_PERSISTENT", raising=False)
+    monkeypatch.setenv("MCP_ADAPTER_WORKERS", "2")
+
+    with pytest.raises(MCPUnavailableError, match="MCP_ADAPTER_PERSISTENT"):
+        build_transport_from_env()
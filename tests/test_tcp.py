@@ -132,6 +132,7 @@ def test_tcp_payload_cap() -> None:
 
     assert "too large" in str(excinfo.value)
 
+    validator.close()
     thread.join(timeout=1.0)
     assert not thread.is_alive()
     # Connection closes without completing a payload; we expect the server to record a ConnectionError.
@@ -186,3 +187,166 @@ def test_resolve_mcp_endpoint_invalid_defaults_to_tcp(monkeypatch) -> None:
     endpoint = resolve_mcp_endpoint()
 
     assert endpoint == "tcp"
+
+
+def test_tcp_validate_many_round_trip() -> None:
+    def handler(raw: bytes) -> Dict[str, object]:
+        request = decode_payload(raw)
+        assert request["method"] == "validate_many"
+        assets = request["params"]["assets"]
+        return {
+            "jsonrpc": "2.0",
+            "id": request.get("id"),
+            "result": {
+                "ok": True,
+                "reason": "validation_passed",
+                "items": [{"ok": True, "asset_id": asset["asset_id"]} for asset in assets],
+            },
+        }
+
+    try:
+        thread, port, errors = _start_tcp_server(handler)
+    except PermissionError:
+        pytest.skip("TCP sockets are not permitted in this sandbox")
+
+    validator = TcpMCPValidator("127.0.0.1", port)
+    results = validator.validate_many([{"asset_id": "a"}, {"asset_id": "b"}, {"asset_id": "c"}])
+
+    thread.join(timeout=1.0)
+    assert not errors
+    assert [item["asset_id"] for item in results] == ["a", "b", "c"]
+
+
+def test_tcp_validate_many_method_not_found() -> None:
+    from labs.mcp.exceptions import MCPMethodNotFoundError
+
+    def handler(raw: bytes) -> Dict[str, object]:
+        request = decode_payload(raw)
+        return {
+            "jsonrpc": "2.0",
+            "id": request.get("id"),
+            "error": {"code": -32601, "message": "method not found"},
+        }
+
+    try:
+        thread, port, errors = _start_tcp_server(handler)
+    except PermissionError:
+        pytest.skip("TCP sockets are not permitted in this sandbox")
+
+    validator = TcpMCPValidator("127.0.0.1", port)
+    with pytest.raises(MCPMethodNotFoundError):
+        validator.validate_many([{"asset_id": "a"}])
+
+    thread.join(timeout=1.0)
+    assert not errors
+
+
+def _start_persistent_server(per_connection: int, connections: int = 1):
+    """Serve *connections* clients, answering *per_connection* requests each in reverse order."""
+
+    from labs.transport import iter_messages
+
+    try:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(("127.0.0.1", 0))
+        server.listen(4)
+    except PermissionError:  # pragma: no cover - sandbox restriction
+        pytest.skip("TCP sockets are not permitted in this sandbox")
+    errors: List[BaseException] = []
+
+    def run() -> None:
+        with server:
+            for _ in range(connections):
+                conn, _ = server.accept()
+                with conn:
+                    try:
+                        received = []
+                        messages = iter_messages(conn)
+                        for raw in messages:
+                            received.append(decode_payload(raw))
+                            if len(received) == per_connection:
+                                break
+                        for request in reversed(received):
+                            asset = request["params"]["asset"]
+                            write_message(
+                                conn,
+                                {"jsonrpc": "2.0", "id": request["id"], "result": {"asset_id": asset["asset_id"]}},
+                            )
+                    except Exception as exc:  # pragma: no cover - surfaced in assertions
+                        errors.append(exc)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread, server.getsockname()[1], errors
+
+
+def test_tcp_pipelines_requests_over_one_connection() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    thread, port, errors = _start_persistent_server(per_connection=4)
+    validator = TcpMCPValidator("127.0.0.1", port, timeout=5.0)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda index: validator.validate({"asset_id": f"a{index}"}), range(4)))
+
+    thread.join(timeout=2.0)
+    validator.close()
+    assert not errors
+    assert [item["asset_id"] for item in results] == ["a0", "a1", "a2", "a3"]
+    assert validator._connection.connects == 1
+
+
+def test_tcp_reconnects_after_server_closes_connection() -> None:
+    thread, port, errors = _start_persistent_server(per_connection=1, connections=2)
+    validator = TcpMCPValidator("127.0.0.1", port, timeout=5.0)
+
+    first = validator.validate({"asset_id": "first"})
+    second = validator.validate({"asset_id": "second"})
+
+    thread.join(timeout=2.0)
+    validator.close()
+    assert not errors
+    assert first == {"asset_id": "first"}
+    assert second == {"asset_id": "second"}
+    assert validator._connection.connects == 2
+
+
+def test_tcp_timeout_with_id_less_server_does_not_misroute_late_reply() -> None:
+    import time
+
+    from labs.transport import iter_messages
+
+    try:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(("127.0.0.1", 0))
+        server.listen(4)
+    except PermissionError:  # pragma: no cover - sandbox restriction
+        pytest.skip("TCP sockets are not permitted in this sandbox")
+
+    def serve(conn: socket.socket) -> None:
+        with conn:
+            try:
+                for raw in iter_messages(conn):
+                    asset = decode_payload(raw)["params"]["asset"]
+                    if asset["asset_id"] == "slow":
+                        time.sleep(0.6)
+                    write_message(conn, {"jsonrpc": "2.0", "result": {"asset_id": asset["asset_id"]}})
+            except OSError:
+                pass
+
+    def run() -> None:
+        with server:
+            for _ in range(2):
+                conn, _ = server.accept()
+                threading.Thread(target=serve, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=run, daemon=True).start()
+    validator = TcpMCPValidator("127.0.0.1", server.getsockname()[1], timeout=0.3)
+
+    with pytest.raises(MCPUnavailableError):
+        validator.validate({"asset_id": "slow"})
+    assert validator.validate({"asset_id": "fast"}) == {"asset_id": "fast"}
+    validator.close()
+    assert validator._connection.connects == 2
@@ -0,0 +1,164 @@
+"""Tests for transport framing helpers."""
+
+from __future__ import annotations
+
+import socket
+import struct
+import threading
+
+import pytest
+
+from labs.transport import (
+    CODEC_ZLIB,
+    FRAMING_LENGTH,
+    FRAMING_NEWLINE,
+    MAX_PAYLOAD_BYTES,
+    InvalidPayloadError,
+    MessageReader,
+    PayloadTooLargeError,
+    available_codecs,
+    decode_payload,
+    encode_frame,
+    get_codec,
+    select_codec,
+    split_frame,
+    iter_messages,
+    iter_payload_batches,
+    write_message,
+)
+
+
+def test_iter_payload_batches_respects_item_limit() -> None:
+    items = [{"asset_id": str(index)} for index in range(5)]
+
+    batches = list(iter_payload_batches(items, max_items=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [item for batch in batches for item in batch] == items
+
+
+def test_iter_payload_batches_respects_byte_budget() -> None:
+    items = [{"data": "x" * 400} for _ in range(5)]
+
+    batches = list(iter_payload_batches(items, max_bytes=1200, envelope_bytes=100))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+def test_iter_payload_batches_yields_oversized_item_alone() -> None:
+    items = [{"data": "small"}, {"data": "x" * 5000}, {"data": "small"}]
+
+    batches = list(iter_payload_batches(items, max_bytes=1000, envelope_bytes=0))
+
+    assert [len(batch) for batch in batches] == [1, 1, 1]
+
+
+def test_iter_messages_keeps_pipelined_payloads() -> None:
+    left, right = socket.socketpair()
+    with left, right:
+        right.sendall(b'{"id":1}\n{"id":2}\n{"id"')
+        right.sendall(b':3}\n')
+        right.close()
+
+        assert list(iter_messages(left, chunk_size=7)) == [b'{"id":1}\n', b'{"id":2}\n', b'{"id":3}\n']
+
+
+def test_message_reader_grows_chunks_for_large_payloads() -> None:
+    left, right = socket.socketpair()
+    payload = {"data": "x" * 300_000}
+    with left, right:
+        sender = threading.Thread(target=write_message, args=(right, payload))
+        sender.start()
+        reader = MessageReader(left, chunk_size=1024)
+        message = reader.read()
+        sender.join()
+
+        assert decode_payload(message) == payload
+        assert reader._chunk > 1024
+
+
+def test_message_reader_length_prefixed_frames() -> None:
+    left, right = socket.socketpair()
+    first, second = {"id": 1, "data": "y" * 200_000}, {"id": 2}
+    with left, right:
+        data = encode_frame(first, FRAMING_LENGTH) + encode_frame(second, FRAMING_LENGTH)
+        sender = threading.Thread(target=right.sendall, args=(data,))
+        sender.start()
+        reader = MessageReader(left, framing=FRAMING_LENGTH, chunk_size=4096)
+        messages = [decode_payload(reader.read()), decode_payload(reader.read())]
+        sender.join()
+        right.close()
+
+        assert messages == [first, second]
+        assert reader.read() is None
+
+
+def test_message_reader_rejects_oversized_length_header() -> None:
+    left, right = socket.socketpair()
+    with left, right:
+        right.sendall(struct.pack(">I", MAX_PAYLOAD_BYTES + 1))
+        with pytest.raises(PayloadTooLargeError):
+            MessageReader(left, framing=FRAMING_LENGTH).read()
+
+
+def test_decode_payload_reads_memoryviews() -> None:
+    payload = {"id": 1, "text": "caf\u00e9"}
+    frame = bytearray(encode_frame(payload))
+
+    assert decode_payload(memoryview(frame)) == payload
+    assert get_codec(CODEC_ZLIB).decode(memoryview(get_codec(CODEC_ZLIB).encode(payload))) == payload
+    with pytest.raises(InvalidPayloadError):
+        decode_payload(memoryview(b"\xff\n"))
+
+
+@pytest.mark.parametrize("framing", [FRAMING_NEWLINE, FRAMING_LENGTH])
+def test_split_frame_pops_buffered_frames(framing: str) -> None:
+    first, second = {"id": 1}, {"id": 2}
+    buffer = bytearray(encode_frame(first, framing) + encode_frame(second, framing)[:-1])
+
+    frame, offset = split_frame(buffer, framing=framing)
+    assert decode_payload(frame) == first
+    frame, scanned = split_frame(buffer, offset, framing=framing, scanned=offset)
+    assert frame is None
+
+    buffer.extend(encode_frame(second, framing)[-1:])
+    frame, end = split_frame(buffer, offset, framing=framing, scanned=scanned)
+    assert decode_payload(frame) == second and end == len(buffer)
+    with pytest.raises(PayloadTooLargeError):
+        split_frame(struct.pack(">I", MAX_PAYLOAD_BYTES + 1), framing=FRAMING_LENGTH)
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_codecs_round_trip_length_prefixed_frames(name: str) -> None:
+    codec = get_codec(name)
+    payload = {"jsonrpc": "2.0", "id": "1", "params": {"asset": {"text": "caf\u00e9\n", "values": [1, 2.5, None]}}}
+    left, right = socket.socketpair()
+    with left, right:
+        right.sendall(encode_frame(payload, FRAMING_LENGTH, codec))
+        body = MessageReader(left, framing=FRAMING_LENGTH).read()
+
+    assert decode_payload(body, codec) == payload
+
+
+def test_zlib_codec_caps_decompressed_size() -> None:
+    import zlib
+
+    codec = get_codec(CODEC_ZLIB)
+    bomb = zlib.compress(b'{"data":"' + b"x" * (MAX_PAYLOAD_BYTES + 10) + b'"}')
+
+    assert len(bomb) < MAX_PAYLOAD_BYTES
+    with pytest.raises(PayloadTooLargeError):
+        decode_payload(bomb, codec)
+    with pytest.raises(PayloadTooLargeError):
+        encode_frame({"data": "x" * (MAX_PAYLOAD_BYTES + 10)}, FRAMING_LENGTH, codec)
+    with pytest.raises(InvalidPayloadError):
+        decode_payload(b"not deflate", codec)
+
+
+def test_binary_codecs_require_length_prefixed_framing() -> None:
+    codec = get_codec(CODEC_ZLIB)
+
+    with pytest.raises(ValueError):
+        encode_frame({"id": 1}, FRAMING_NEWLINE, codec)
+    assert select_codec(["bogus", CODEC_ZLIB], FRAMING_NEWLINE).name == "json"
+    assert select_codec(["bogus", CODEC_ZLIB], FRAMING_LENGTH).name == CODEC_ZLIB
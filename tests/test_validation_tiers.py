@@ -0,0 +1,200 @@
+"""Tests for tiered (local-first) validation in the critic and MCP client."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, List
+
+import pytest
+
+from labs.agents.critic import CriticAgent
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import MCPClient
+from labs.mcp import validate
+from labs.mcp.exceptions import MCPUnavailableError
+from labs.mcp.sampling import select_sample
+
+
+@pytest.fixture()
+def valid_asset() -> dict:
+    return GeneratorAgent(schema_version="0.7.4").propose("tiers", seed=5)
+
+
+@pytest.fixture()
+def invalid_asset(valid_asset) -> dict:
+    return dict(valid_asset, tone=[])
+
+
+class _Remote:
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+
+    def __call__(self, asset: dict) -> dict:
+        self.calls.append(asset)
+        return {"ok": True, "source": "remote"}
+
+    def validate(self, asset: dict) -> dict:
+        return self(asset)
+
+    def validate_many(self, assets, *, batch_limit=None) -> List[dict]:
+        return [self(asset) for asset in assets]
+
+
+def test_resolve_validation_tier(monkeypatch) -> None:
+    monkeypatch.delenv("LABS_VALIDATION_TIER", raising=False)
+    assert validate.resolve_validation_tier() == "remote"
+    monkeypatch.setenv("LABS_VALIDATION_TIER", " Tiered ")
+    assert validate.resolve_validation_tier() == "tiered"
+    assert validate.resolve_validation_tier("local") == "local"
+    assert validate.resolve_validation_tier("bogus") == "remote"
+
+
+def test_local_verdict_defers_unknown_schemas(valid_asset) -> None:
+    unknown = dict(valid_asset, **{"$schema": "meta/schemas/9.9.9/missing.schema.json"})
+
+    assert validate.local_verdict(valid_asset, "tiered") is None
+    assert validate.local_verdict(unknown, "tiered") is None
+    assert validate.local_verdict(unknown, "local")["ok"] is False
+
+
+def test_critic_tiered_short_circuits_local_failures(tmp_path, invalid_asset, valid_asset) -> None:
+    remote = _Remote()
+    critic = CriticAgent(validator=remote, log_path=str(tmp_path / "critic.jsonl"), validation_tier="tiered")
+
+    failed = critic.review(invalid_asset)
+    passed = critic.review(valid_asset)
+
+    assert remote.calls == [valid_asset]
+    assert failed["ok"] is False and failed["validation_tier"] == "local"
+    assert failed["mcp_response"]["errors"] == [{"path": "/tone", "msg": "[] is not of type 'object'"}]
+    assert passed["ok"] is True and passed["validation_tier"] == "remote"
+    assert passed["mcp_response"]["source"] == "remote"
+
+
+def test_critic_local_only_never_builds_transport(tmp_path, monkeypatch, valid_asset) -> None:
+    monkeypatch.setenv("LABS_VALIDATION_TIER", "local")
+    monkeypatch.setattr(
+        "labs.agents.critic.build_validator_from_env",
+        lambda: pytest.fail("local tier must not build a transport"),
+    )
+    critic = CriticAgent(log_path=str(tmp_path / "critic.jsonl"))
+
+    review = critic.review(valid_asset)
+
+    assert review["ok"] is True
+    assert review["validation_tier"] == "local"
+    assert review["mcp_response"]["reason"] == "validation_passed"
+
+
+def test_client_tiered_sends_only_locally_valid_assets(monkeypatch, invalid_asset, valid_asset) -> None:
+    remote = _Remote()
+    events: List[dict] = []
+    monkeypatch.setattr("labs.mcp_stdio.build_transport_from_env", lambda: remote)
+    client = MCPClient(batch_limit=5, validation_tier="tiered", event_hook=events.append)
+
+    results = client.validate([invalid_asset, valid_asset, invalid_asset])
+
+    assert len(remote.calls) == 1
+    assert [item["validation_tier"] for item in results] == ["local", "remote", "local"]
+    assert [item["ok"] for item in results] == [False, True, False]
+    assert events[-1]["local_decisions"] == 2
+
+
+def test_client_local_only_skips_transport(monkeypatch, valid_asset) -> None:
+    monkeypatch.setattr(
+        "labs.mcp_stdio.build_transport_from_env",
+        lambda: pytest.fail("local tier must not build a transport"),
+    )
+    client = MCPClient(validation_tier="local")
+
+    results = client.validate([valid_asset])
+
+    assert results == [{"ok": True, "reason": "validation_passed", "errors": [], "validation_tier": "local"}]
+
+
+class _JudgingRemote(_Remote):
+    """Remote that agrees with the local validator unless ``drift`` is set."""
+
+    def __init__(self, drift: bool = False) -> None:
+        super().__init__()
+        self.drift = drift
+
+    def __call__(self, asset: dict) -> dict:
+        self.calls.append(asset)
+        if self.drift:
+            return {"ok": True, "source": "remote"}
+        return dict(validate.validate_asset(asset), source="remote")
+
+
+def test_select_sample_strategies() -> None:
+    strata = ["a"] * 90 + ["b"] * 10
+    stratified = select_sample(strata, 0.02, random.Random(1))
+    uniform = select_sample(strata, 0.02, random.Random(1), strategy="random")
+
+    assert len(stratified) == 3 and any(index >= 90 for index in stratified)
+    assert len(uniform) == 2 and uniform == sorted(uniform)
+    with pytest.raises(ValueError):
+        select_sample(strata, 0, random.Random(1))
+
+
+def test_client_sampled_confirms_a_stratified_sample(monkeypatch, invalid_asset, valid_asset) -> None:
+    remote = _JudgingRemote()
+    events: List[dict] = []
+    monkeypatch.setattr("labs.mcp_stdio.build_transport_from_env", lambda: remote)
+    client = MCPClient(
+        batch_limit=50,
+        validation_tier="sampled",
+        sample_rate=0.05,
+        sample_seed=7,
+        event_hook=events.append,
+    )
+    batch = [valid_asset] * 40 + [invalid_asset] * 10
+
+    results = client.validate(batch)
+
+    assert len(remote.calls) == 3
+    assert [item["ok"] for item in results] == [True] * 40 + [False] * 10
+    assert sum(item["validation_tier"] == "remote" for item in results) == 3
+    sampled = next(event for event in events if event["event"] == "validation_sampled")
+    assert sampled["sampled"] == 3 and sampled["escalated"] is False
+
+
+def test_client_sampled_escalates_on_drift(monkeypatch, invalid_asset, valid_asset) -> None:
+    remote = _JudgingRemote(drift=True)
+    events: List[dict] = []
+    monkeypatch.setattr("labs.mcp_stdio.build_transport_from_env", lambda: remote)
+    client = MCPClient(batch_limit=50, validation_tier="sampled", sample_rate=0.05, sample_seed=7, event_hook=events.append)
+
+    results = client.validate([valid_asset] * 20 + [invalid_asset] * 20)
+
+    assert len(remote.calls) == 40
+    assert all(item["validation_tier"] == "remote" and item["ok"] for item in results)
+    sampled = next(event for event in events if event["event"] == "validation_sampled")
+    assert sampled["escalated"] is True and sampled["mismatches"] >= 1
+
+
+def test_client_sampled_without_transport_reports_fallback(monkeypatch, invalid_asset, valid_asset) -> None:
+    def unavailable():
+        raise MCPUnavailableError("no transport")
+
+    events: List[dict] = []
+    monkeypatch.setattr("labs.mcp_stdio.build_transport_from_env", unavailable)
+    client = MCPClient(batch_limit=50, validation_tier="sampled", sample_rate=0.05, sample_seed=7, event_hook=events.append)
+
+    results = client.validate([valid_asset] * 20 + [invalid_asset] * 20, strict=False)
+
+    assert not any(item["validation_tier"] == "remote" for item in results)
+    assert sum(item["validation_tier"] == "fallback" for item in results) == 2
+    sampled = next(event for event in events if event["event"] == "validation_sampled")
+    assert sampled["fallback"] == 2 and sampled["escalated"] is False
+    assert events[-1]["fallback_decisions"] == 2
+
+
+def test_client_tiered_without_transport_reports_fallback(monkeypatch, valid_asset) -> None:
+    def unavailable():
+        raise MCPUnavailableError("no transport")
+
+    monkeypatch.setattr("labs.mcp_stdio.build_transport_from_env", unavailable)
+    client = MCPClient(validation_tier="tiered")
+
+    assert client.validate([valid_asset])[0]["validation_tier"] == "fallback"
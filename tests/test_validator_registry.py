@@ -0,0 +1,116 @@
+"""Tests for the bounded validator registry."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from labs.agents.generator import GeneratorAgent
+from labs.mcp import validate
+from labs.mcp.registry import ValidatorRegistry
+
+_ROOT = Path(__file__).resolve().parent.parent
+_SCHEMA_PATH = _ROOT / "meta" / "schemas" / "0.7.3" / "synesthetic-asset.schema.json"
+
+
+def _registry(max_entries: int = 64) -> ValidatorRegistry:
+    return ValidatorRegistry(
+        resolve=validate._resolve_schema_path,
+        build_check=validate._build_check,
+        max_entries=max_entries,
+    )
+
+
+def test_spellings_share_one_entry() -> None:
+    registry = _registry()
+    spellings = [
+        "meta/schemas/0.7.3/synesthetic-asset.schema.json",
+        str(_SCHEMA_PATH),
+        "https://schemas.synesthetic.dev/0.7.3/synesthetic-asset.schema.json",
+        "https://schemas.synesthetic-labs.ai/mcp/0.7.3/synesthetic-asset.schema.json",
+    ]
+
+    checks = {id(registry.check(spelling)) for spelling in spellings}
+    stats = registry.stats()
+
+    assert len(checks) == 1
+    assert stats["entries"] == 1 and stats["misses"] == 1 and stats["hits"] == 3
+    assert stats["aliases"] == len(spellings)
+    assert stats["schemas"] == ["https://schemas.synesthetic.dev/0.7.3/synesthetic-asset.schema.json"]
+
+
+def test_known_alias_skips_resolution() -> None:
+    calls = []
+
+    def resolve(identifier: str) -> Path:
+        calls.append(identifier)
+        return validate._resolve_schema_path(identifier)
+
+    registry = ValidatorRegistry(resolve=resolve, build_check=validate._build_check)
+    for _ in range(3):
+        registry.check(str(_SCHEMA_PATH))
+
+    assert calls == [str(_SCHEMA_PATH)]
+
+
+def test_lru_eviction_drops_aliases(tmp_path: Path) -> None:
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"s{index}.schema.json"
+        path.write_text(json.dumps({"$id": f"urn:test:{index}", "type": "object"}))
+        paths.append(str(path))
+
+    registry = _registry(max_entries=2)
+    registry.check(paths[0])
+    registry.check(paths[1])
+    registry.check(paths[0])
+    registry.check(paths[2])
+
+    assert paths[0] in registry and paths[2] in registry
+    assert paths[1] not in registry
+    assert registry.stats()["evictions"] == 1
+    assert len(registry) == 2
+
+
+def test_changed_content_compiles_new_entry(tmp_path: Path) -> None:
+    path = tmp_path / "s.schema.json"
+    path.write_text(json.dumps({"$id": "urn:test:s", "type": "object"}))
+    registry = _registry()
+    first = registry.check(str(path))
+
+    path.write_text(json.dumps({"$id": "urn:test:s", "type": "array"}))
+    fresh = _registry()
+
+    assert fresh.check(str(path)) is not first
+    assert fresh.check(str(path))({}) == {"path": "/", "msg": "{} is not of type 'array'"}
+
+
+def test_warm_up_registers_bundled_versions() -> None:
+    registry = _registry()
+
+    assert registry.warm_up(_ROOT / "meta" / "schemas") == 2
+    assert "https://schemas.synesthetic.dev/0.7.4/synesthetic-asset.schema.json" in registry
+
+    registry.check("meta/schemas/0.7.4/synesthetic-asset.schema.json")
+    assert registry.stats()["misses"] == 2
+
+
+def test_validate_asset_reports_registry_stats() -> None:
+    validate._VALIDATOR_CACHE.clear()
+    before = validate.validator_stats()
+    asset = GeneratorAgent(schema_version="0.7.3").propose("registry", seed=1)
+
+    assert validate.validate_asset(asset)["ok"] is True
+    assert validate.validate_asset(dict(asset))["ok"] is True
+    after = validate.validator_stats()
+
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] >= 1
+    assert after["compile_seconds"] >= before["compile_seconds"]
+
+
+def test_registry_rejects_non_positive_bound() -> None:
+    with pytest.raises(ValueError):
+        _registry(max_entries=0)